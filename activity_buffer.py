@@ -0,0 +1,190 @@
+# database/activity_buffer.py
+
+import atexit
+import json
+import os
+import threading
+import uuid
+from datetime import date
+import mysql.connector
+from database.database import Database
+
+SPILL_FILE = "activity_spill.jsonl"
+DEAD_LETTER_FILE = "activity_dead_letter.jsonl"  # Rows MySQL rejected for good, with the reason
+FLUSH_SIZE = 50        # Flush as soon as this many rows are waiting...
+FLUSH_INTERVAL = 2.0   # ...or after this many seconds, whichever comes first
+
+
+class ActivityWriteBuffer:
+    """Write-behind queue for activity_log rows.
+
+    add() appends the row to a local spill file and returns immediately; a
+    background thread writes queued rows with Database.log_activities_bulk
+    (one commit per batch) once FLUSH_SIZE rows are waiting or FLUSH_INTERVAL
+    has passed. Rows left in the spill file by a crash or a lost connection are
+    queued again on the next start; entry IDs make the replay idempotent.
+
+    If a batch is rejected for its data (IntegrityError or DataError), its rows
+    are retried one at a time and those that still fail are moved to the
+    dead-letter file, so one bad row cannot hold back the queue. Other errors,
+    such as a lost connection, leave the batch queued for the next attempt.
+    """
+
+    def __init__(self, spill_path=SPILL_FILE, flush_size=FLUSH_SIZE, flush_interval=FLUSH_INTERVAL,
+                 dead_letter_path=DEAD_LETTER_FILE):
+        self.spill_path = spill_path
+        self.dead_letter_path = dead_letter_path
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._flushing = threading.Lock()  # One batch in flight at a time
+        self._closed = False
+        self._db = None
+        self._load_spill()
+        self._spill = open(self.spill_path, "a")
+        self._thread = threading.Thread(target=self._run, name="activity-flush", daemon=True)
+        self._thread.start()
+
+    def _load_spill(self):
+        try:
+            with open(self.spill_path) as file:
+                for line in file:
+                    try:
+                        self._pending.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        break  # Torn final line
+        except FileNotFoundError:
+            pass
+        if self._pending:
+            print(f"♻️ Replaying {len(self._pending)} unsaved activities")
+            self._rewrite_spill(self._pending)
+
+    def add(self, client_id, activity, duration, calories):
+        """Queue an activity for today and return the buffered row."""
+        row = {
+            "entry_id": uuid.uuid4().hex,
+            "client_id": client_id,
+            "activity": activity,
+            "duration": duration,
+            "calories_burned": calories,
+            "log_date": date.today().isoformat(),
+        }
+        with self._lock:
+            self._spill.write(json.dumps(row) + "\n")
+            self._spill.flush()
+            self._pending.append(row)
+            if len(self._pending) >= self.flush_size:
+                self._wake.notify()
+        return row
+
+    def pending_for(self, client_id, log_date=None):
+        """Rows for a client that are queued but not yet in the database."""
+        log_date = (log_date or date.today()).isoformat()
+        with self._lock:
+            return [row for row in self._pending
+                    if row["client_id"] == client_id and row["log_date"] == log_date]
+
+    def flush(self):
+        """Write every queued row now; returns how many were written."""
+        with self._flushing:
+            return self._flush()
+
+    def _flush(self):
+        with self._lock:
+            batch = list(self._pending)
+        if not batch:
+            return 0
+        if self._db is None or self._db.conn is None:
+            self._db = Database()
+            if self._db.conn is None:
+                self._db = None
+                raise ConnectionError("Database connection is not available.")
+        try:
+            try:
+                self._db.log_activities_bulk([self._values(row) for row in batch])
+            except (mysql.connector.IntegrityError, mysql.connector.DataError):
+                self._write_singly(batch)
+        except Exception:
+            self._db.close()  # Reconnect through the pool on the next attempt
+            self._db = None
+            raise
+        with self._lock:
+            del self._pending[:len(batch)]  # add() only appends, so the batch is still at the front
+            self._rewrite_spill(self._pending)
+        return len(batch)
+
+    @staticmethod
+    def _values(row):
+        return (row["entry_id"], row["client_id"], row["activity"], row["duration"],
+                row["calories_burned"], row["log_date"])
+
+    def _write_singly(self, batch):
+        """Write a rejected batch row by row, dead-lettering the rows MySQL refuses."""
+        rejected = []
+        for row in batch:
+            try:
+                self._db.log_activities_bulk([self._values(row)])
+            except (mysql.connector.IntegrityError, mysql.connector.DataError) as e:
+                rejected.append(dict(row, error=str(e)))
+        if rejected:
+            with open(self.dead_letter_path, "a") as file:
+                for row in rejected:
+                    file.write(json.dumps(row) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+            print(f"⚠️ {len(rejected)} activities were rejected by the database; see {self.dead_letter_path}")
+
+    def _rewrite_spill(self, rows):
+        """Replace the spill file with `rows` (called with the lock held)."""
+        tmp_path = self.spill_path + ".tmp"
+        with open(tmp_path, "w") as file:
+            for row in rows:
+                file.write(json.dumps(row) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        spill = getattr(self, "_spill", None)
+        if spill is not None:
+            spill.close()
+        os.replace(tmp_path, self.spill_path)
+        if spill is not None:
+            self._spill = open(self.spill_path, "a")
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._closed and len(self._pending) < self.flush_size:
+                    self._wake.wait(self.flush_interval)
+                closed = self._closed
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"❌ Activity flush failed, will retry: {e}")
+            if closed:
+                return
+
+    def close(self):
+        """Flush what is queued and stop the background thread."""
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+        self._thread.join()
+        with self._lock:
+            self._spill.close()
+        if self._db is not None:
+            self._db.close()
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_activity_buffer():
+    """The process-wide buffer; it is flushed when the interpreter exits."""
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            _buffer = ActivityWriteBuffer()
+            atexit.register(_buffer.close)
+    return _buffer
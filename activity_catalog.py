@@ -0,0 +1,68 @@
+# database/activity_catalog.py
+
+import threading
+import time
+
+REVALIDATE_AFTER = 60.0  # Seconds a cached catalog is trusted without asking the database
+
+
+class ActivityCatalogCache:
+    """Process-wide cache of Database.get_activity_list().
+
+    The catalog is tagged with the catalog_version row it was read at. While
+    it is younger than REVALIDATE_AFTER it is served with no query at all;
+    after that a single-row version lookup decides whether to re-read it.
+    Edits made through this process call invalidate() directly.
+    """
+
+    def __init__(self, revalidate_after=REVALIDATE_AFTER):
+        self.revalidate_after = revalidate_after
+        self._catalog = None
+        self._version = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def peek(self):
+        """The cached catalog if it is still fresh, else None (never touches the database)."""
+        with self._lock:
+            if self._catalog is not None and time.monotonic() - self._checked < self.revalidate_after:
+                return self._catalog
+        return None
+
+    def get(self, db):
+        """Return the catalog, revalidating against `db` only when the cache has gone stale."""
+        catalog = self.peek()
+        if catalog is not None:
+            return catalog
+
+        version = db.get_catalog_version("activities")
+        with self._lock:
+            if self._catalog is not None and version == self._version:
+                self._checked = time.monotonic()
+                return self._catalog
+
+        catalog = db.get_activity_list()
+        with self._lock:
+            self._catalog = catalog
+            self._version = version
+            self._checked = time.monotonic()
+        return catalog
+
+    def invalidate(self):
+        with self._lock:
+            self._catalog = None
+            self._version = None
+
+
+activity_catalog = ActivityCatalogCache()
+
+
+def save_activity(db, name, met):
+    """Edit the catalog through `db` and drop the cached copy."""
+    db.save_activity(name, met)
+    activity_catalog.invalidate()
+
+
+def delete_activity(db, name):
+    db.delete_activity(name)
+    activity_catalog.invalidate()
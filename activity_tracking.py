@@ -1,5 +1,10 @@
 from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QLineEdit, QComboBox, QSpinBox
-from database.database import Database
+from database.async_db import AsyncDatabase
+from database.activity_buffer import get_activity_buffer
+from database.activity_catalog import activity_catalog
+from core.services import ActivityService, ServiceError
+from ui.client_completer import attach_to_combo
+
 
 class ActivityTrackingWindow(QWidget):
     def __init__(self):
@@ -8,22 +13,23 @@ class ActivityTrackingWindow(QWidget):
         self.setWindowTitle("Activity and Calorie Tracking")
         self.setGeometry(200, 200, 700, 500)
 
-        # ✅ TRY TO CONNECT TO DATABASE SAFELY
-        try:
-            self.db = Database()
-            print("✅ Database connection established")
-        except Exception as e:
-            print(f"❌ Database connection failed: {e}")
-            return  # Prevent UI from loading if database connection fails
+        # ✅ ALL QUERIES RUN ON WORKER THREADS
+        self.db = AsyncDatabase(self)
+        self.activity_buffer = get_activity_buffer()
+        self.activities = ActivityService(buffer=self.activity_buffer)
 
         # CLIENT SELECTION
         self.client_dropdown = QComboBox()
+        self.client_search = attach_to_combo(self.client_dropdown)
+        self.client_dropdown.currentIndexChanged.connect(self.load_activity_log)
         self.load_clients()
 
         # ACTIVITY SELECTION
         self.activity_dropdown = QComboBox()
-        self.activity_list = self.load_activity_list()
-        self.activity_dropdown.addItems(self.activity_list.keys())
+        self.activity_list = {}
+        self.activities.use_catalog({})
+        self.client_weights = {}
+        self.load_activity_list()
 
         self.duration_input = QSpinBox()
         self.duration_input.setRange(1, 300)  # 1 to 300 minutes
@@ -57,71 +63,104 @@ class ActivityTrackingWindow(QWidget):
 
     def load_clients(self):
         """Load clients from the database into dropdown."""
-        try:
-            clients = self.db.get_all_clients()
-            if not clients:
-                print("⚠️ No clients found in the database")
-                return
-            for client in clients:
-                self.client_dropdown.addItem(f"{client['id']} - {client['name']}", client['id'])
-            print("✅ Clients loaded successfully")
-        except Exception as e:
-            print(f"❌ Error loading clients: {e}")
+        self.db.submit("clients", "get_all_clients",
+                       on_result=self.populate_clients,
+                       on_error=lambda e: print(f"❌ Error loading clients: {e}"))
+
+    def populate_clients(self, clients):
+        if not clients:
+            print("⚠️ No clients found in the database")
+            return
+        for client in clients:
+            self.client_dropdown.addItem(f"{client['id']} - {client['name']}", client['id'])
+            self.client_weights[client['id']] = client.get('weight')
+        self.client_search.set_clients(clients)
+        print("✅ Clients loaded successfully")
 
     def load_activity_list(self):
-        """Load available activities from the database."""
-        try:
-            activity_list = self.db.get_activity_list()
-            if not activity_list:
-                print("⚠️ No activities found")
-                return {}
-            print("✅ Activities loaded successfully")
-            return activity_list
-        except Exception as e:
-            print(f"❌ Error loading activities: {e}")
-            return {}
+        """Load available activities, from the shared cache when it is fresh."""
+        catalog = activity_catalog.peek()
+        if catalog is not None:
+            self.populate_activity_list(catalog)
+            return
+        self.db.submit("activities", activity_catalog.get,
+                       on_result=self.populate_activity_list,
+                       on_error=lambda e: print(f"❌ Error loading activities: {e}"))
+
+    def populate_activity_list(self, activity_list):
+        if not activity_list:
+            print("⚠️ No activities found")
+            return
+        self.activity_list = activity_list
+        self.activities.use_catalog(activity_list)
+        self.activity_dropdown.clear()
+        self.activity_dropdown.addItems(self.activity_list.keys())
+        print("✅ Activities loaded successfully")
+
+    def estimate_calories(self, client_id, activity, duration):
+        """MET x the client's weight x duration."""
+        return self.activities.estimate(activity, self.client_weights.get(client_id), duration)
 
     def calculate_calories(self):
         """Calculate calories burned based on activity and duration."""
         activity = self.activity_dropdown.currentText()
         duration = self.duration_input.value()
-        calories = self.activity_list.get(activity, 0) * duration
+        calories = self.estimate_calories(self.client_dropdown.currentData(), activity, duration)
         self.calories_label.setText(f"Calories Burned: {calories}")
 
     def log_activity(self):
-        """Log activity in the database."""
+        """Queue the activity for a group commit and show it straight away."""
         client_id = self.client_dropdown.currentData()
         activity = self.activity_dropdown.currentText()
         duration = self.duration_input.value()
-        calories = self.activity_list.get(activity, 0) * duration
 
-        if client_id:
-            try:
-                self.db.log_activity(client_id, activity, duration, calories)
-                print(f"✅ Activity logged: {activity}, {duration} mins, {calories} kcal")
-                self.load_activity_log()
-            except Exception as e:
-                print(f"❌ Error logging activity: {e}")
+        try:
+            row = self.activities.log(client_id, activity, duration, self.client_weights.get(client_id))
+        except ServiceError as e:
+            print(f"⚠️ {e}")
+            return
+        self.append_activity_row(row)
+        print(f"✅ Activity logged: {activity}, {duration} mins, {row['calories_burned']} kcal")
 
     def load_activity_log(self):
         """Load today's activity log for the selected client."""
         client_id = self.client_dropdown.currentData()
-        try:
-            logs = self.db.get_today_activity_log(client_id)
-            if not logs:
-                print("⚠️ No activity logs found for today.")
-                self.activity_table.setRowCount(0)
-                return
-
-            self.activity_table.setRowCount(len(logs))
-            for row, data in enumerate(logs):
-                self.activity_table.setItem(row, 0, QTableWidgetItem(data["activity"]))
-                self.activity_table.setItem(row, 1, QTableWidgetItem(str(data["duration"])))
-                self.activity_table.setItem(row, 2, QTableWidgetItem(str(data["calories_burned"])))
-
-            print("✅ Activity log loaded")
-        except Exception as e:
-            print(f"❌ Error loading activity log: {e}")
+        if not client_id:
+            return
+        self.db.submit("activity_log", "get_today_activity_log", client_id,
+                       on_result=lambda logs: self.show_activity_log(self.with_pending(client_id, logs)),
+                       on_error=lambda e: print(f"❌ Error loading activity log: {e}"))
+
+    def with_pending(self, client_id, logs):
+        """Add rows still waiting in the write-behind buffer to what the database returned."""
+        stored = {data.get("entry_id") for data in logs}
+        return logs + [row for row in self.activity_buffer.pending_for(client_id)
+                       if row["entry_id"] not in stored]
+
+    def append_activity_row(self, data):
+        row = self.activity_table.rowCount()
+        self.activity_table.insertRow(row)
+        self.activity_table.setItem(row, 0, QTableWidgetItem(data["activity"]))
+        self.activity_table.setItem(row, 1, QTableWidgetItem(str(data["duration"])))
+        self.activity_table.setItem(row, 2, QTableWidgetItem(str(data["calories_burned"])))
+
+    def show_activity_log(self, logs):
+        if not logs:
+            print("⚠️ No activity logs found for today.")
+            self.activity_table.setRowCount(0)
+            return
+
+        self.activity_table.setRowCount(len(logs))
+        for row, data in enumerate(logs):
+            self.activity_table.setItem(row, 0, QTableWidgetItem(data["activity"]))
+            self.activity_table.setItem(row, 1, QTableWidgetItem(str(data["duration"])))
+            self.activity_table.setItem(row, 2, QTableWidgetItem(str(data["calories_burned"])))
+
+        print("✅ Activity log loaded")
+
+    def closeEvent(self, event):
+        self.db.shutdown()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication([])
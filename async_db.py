@@ -0,0 +1,198 @@
+# database/async_db.py
+
+import itertools
+import threading
+import mysql.connector
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from database.database import Database
+
+MAX_WORKERS = 4  # Keep below db_config.POOL_SIZE so the login screen can still connect
+
+_local = threading.local()
+_workers = None
+
+
+def worker_pool():
+    """The process-wide worker pool; its threads stay alive to keep their connections warm."""
+    global _workers
+    if _workers is None:
+        _workers = QThreadPool()
+        _workers.setMaxThreadCount(MAX_WORKERS)
+        _workers.setExpiryTimeout(-1)
+    return _workers
+
+
+def _thread_database():
+    """Each worker thread keeps its own Database (MySQL connections are not thread-safe)."""
+    db = getattr(_local, "db", None)
+    if db is None or db.conn is None:
+        db = Database()
+        if db.conn is None:
+            raise ConnectionError("Database connection is not available.")
+        _local.db = db
+    return db
+
+
+def _drop_dead_database():
+    """Forget this thread's Database if its connection has died; returns True if it had.
+
+    Worker threads live for the whole session, so the pool's checkout ping
+    alone cannot catch a connection the server closed while it sat idle.
+    """
+    db = getattr(_local, "db", None)
+    if db is None or db.conn is None:
+        return False
+    try:
+        if db.conn.is_connected():  # is_connected() pings the server
+            return False
+    except mysql.connector.Error:
+        pass
+    _local.db = None
+    try:
+        db.close()  # The pool pings it again on the next checkout and reconnects or discards it
+    except mysql.connector.Error:
+        pass
+    return True
+
+
+class _TaskSignals(QObject):
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, object)
+
+
+class _DbTask(QRunnable):
+    def __init__(self, ticket, method, args, signals):
+        super().__init__()
+        self.ticket = ticket
+        self.method = method
+        self.args = args
+        self.signals = signals
+        self.cancelled = False
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            try:
+                result = self._call(_thread_database())
+            except (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError):
+                if not _drop_dead_database():
+                    raise
+                result = self._call(_thread_database())  # Lost the connection; retry once on a fresh one
+        except Exception as e:
+            self.signals.failed.emit(self.ticket, e)
+        else:
+            self.signals.finished.emit(self.ticket, result)
+
+    def _call(self, db):
+        if callable(self.method):
+            return self.method(db, *self.args)
+        return getattr(db, self.method)(*self.args)
+
+
+class AsyncDatabase(QObject):
+    """Runs Database calls on a QThreadPool and delivers results on the GUI thread.
+
+    Every request has a key (e.g. "progress"). Submitting a new request under a
+    key supersedes the previous one, whose result is then dropped; submitting the
+    same method and arguments while it is still running joins the pending call.
+    Error callbacks receive the exception itself, so callers can tell input
+    errors (core.services.ServiceError) from database failures.
+    """
+
+    finished = pyqtSignal(str, object)  # key, result
+    failed = pyqtSignal(str, object)    # key, exception
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = worker_pool()
+        self._tickets = itertools.count(1)
+        self._signals = _TaskSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._latest = {}     # key -> ticket of the newest request
+        self._inflight = {}   # (key, method, args) -> ticket
+        self._pending = {}    # ticket -> [key, identity, task, callbacks]
+
+    def submit(self, key, method, *args, on_result=None, on_error=None):
+        """Run `db.method(*args)` (or `method(db, *args)` for a callable) in the background."""
+        identity = (key, method, args)
+        try:
+            ticket = self._inflight.get(identity)
+        except TypeError:
+            identity, ticket = None, None  # Unhashable arguments are never coalesced
+        if ticket is not None and self._latest.get(key) == ticket:
+            self._pending[ticket][3].append((on_result, on_error))
+            return ticket
+
+        self.cancel(key)
+        ticket = next(self._tickets)
+        task = _DbTask(ticket, method, args, self._signals)
+        self._latest[key] = ticket
+        if identity is not None:
+            self._inflight[identity] = ticket
+        self._pending[ticket] = [key, identity, task, [(on_result, on_error)]]
+        self.pool.start(task)
+        return ticket
+
+    def run(self, method, *args, on_result=None, on_error=None):
+        """Submit a write under a one-off key so it is never superseded or merged."""
+        return self.submit(f"write-{next(self._tickets)}", method, *args,
+                           on_result=on_result, on_error=on_error)
+
+    def cancel(self, key):
+        """Drop the outstanding request for `key`; queued work is skipped entirely."""
+        ticket = self._latest.pop(key, None)
+        if ticket is not None:
+            self._forget(ticket).cancelled = True
+
+    def cancel_all(self):
+        for key in list(self._latest):
+            self.cancel(key)
+
+    def shutdown(self):
+        """Drop pending reads and every callback; call from the owning window's closeEvent.
+
+        Writes that were already submitted still reach the database.
+        """
+        for key, ticket in list(self._latest.items()):
+            if key.startswith("write-"):
+                self._pending[ticket][3].clear()
+            else:
+                self.cancel(key)
+
+    def is_pending(self, key):
+        return key in self._latest
+
+    def _forget(self, ticket):
+        key, identity, task, _ = self._pending.pop(ticket)
+        if identity is not None and self._inflight.get(identity) == ticket:
+            del self._inflight[identity]
+        return task
+
+    def _take(self, ticket):
+        entry = self._pending.get(ticket)
+        if entry is None or self._latest.get(entry[0]) != ticket:
+            return None, []  # Cancelled or superseded
+        key, _, _, callbacks = entry
+        del self._latest[key]
+        self._forget(ticket)
+        return key, callbacks
+
+    def _on_finished(self, ticket, result):
+        key, callbacks = self._take(ticket)
+        if key is None:
+            return
+        for on_result, _ in callbacks:
+            if on_result is not None:
+                on_result(result)
+        self.finished.emit(key, result)
+
+    def _on_failed(self, ticket, error):
+        key, callbacks = self._take(ticket)
+        if key is None:
+            return
+        for _, on_error in callbacks:
+            if on_error is not None:
+                on_error(error)
+        self.failed.emit(key, error)
@@ -0,0 +1,123 @@
+# batch_reports.py
+#
+# Month-end job: writes a progress report PDF for every active client (or the
+# ones given) across a process pool, one database connection per worker.
+# Reports land in <output>/<YYYY-MM>/client_<id>_<YYYY-MM>.pdf; a rerun skips
+# the ones already there, so an interrupted job simply resumes.
+#
+#   python batch_reports.py                    # last month
+#   python batch_reports.py --month 2026-09 --workers 4
+#   python batch_reports.py --clients 3 7 --force
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from database.database import Database
+from database.report_export import export_progress_pdf
+
+OUTPUT_DIR = "reports"
+
+_db = None  # One connection per worker process
+
+
+def _init_worker():
+    global _db
+    _db = Database()
+    if _db.conn is None:
+        raise ConnectionError("Database connection is not available.")
+
+
+def month_range(month):
+    """First and last day of a "YYYY-MM" month."""
+    first = date.fromisoformat(f"{month}-01")
+    last = (first.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    return first, last
+
+
+def last_month():
+    return (date.today().replace(day=1) - timedelta(days=1)).strftime("%Y-%m")
+
+
+def report_path(output_dir, client_id, month):
+    return os.path.join(output_dir, month, f"client_{client_id}_{month}.pdf")
+
+
+def write_report(client_id, name, month, path):
+    """Export one client's report in a worker process; returns the rows written."""
+    start_date, end_date = month_range(month)
+    part_path = path + ".part"  # Only a finished report gets the final name
+    rows = export_progress_pdf(_db, part_path, client_id, start_date, end_date,
+                               title=f"{name} - Progress Report {month}")
+    os.replace(part_path, path)
+    return rows
+
+
+def run_batch(month, output_dir=OUTPUT_DIR, client_ids=None, workers=None, force=False, all_clients=False):
+    """Produce every missing report for `month`; returns (written, skipped, failed) counts."""
+    start_date, end_date = month_range(month)
+    os.makedirs(os.path.join(output_dir, month), exist_ok=True)
+
+    db = Database()
+    if db.conn is None:
+        raise ConnectionError("Database connection is not available.")
+    try:
+        names = {client["id"]: client["name"] for client in db.get_all_clients()}
+        if client_ids:
+            selected = [client_id for client_id in client_ids if client_id in names]
+        elif all_clients:
+            selected = list(names)
+        else:
+            selected = db.get_active_client_ids(start_date, end_date)
+    finally:
+        db.close()
+
+    todo = [client_id for client_id in selected
+            if force or not os.path.exists(report_path(output_dir, client_id, month))]
+    skipped = len(selected) - len(todo)
+    failed = 0
+    if not todo:
+        return 0, skipped, failed
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(write_report, client_id, names[client_id], month,
+                               report_path(output_dir, client_id, month)): client_id
+                   for client_id in todo}
+        for done, future in enumerate(as_completed(futures), 1):
+            client_id = futures[future]
+            try:
+                rows = future.result()
+                print(f"📄 [{done}/{len(todo)}] Client {client_id}: {rows} rows")
+            except Exception as e:
+                failed += 1
+                print(f"❌ [{done}/{len(todo)}] Client {client_id}: {e}")
+    return len(todo) - failed, skipped, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate monthly progress reports for every active client.")
+    parser.add_argument("--month", default=last_month(), help="Report month as YYYY-MM (default: last month)")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="Root directory for the reports")
+    parser.add_argument("--clients", type=int, nargs="+", help="Only these client IDs")
+    parser.add_argument("--all-clients", action="store_true", help="Include clients with no data that month")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="Regenerate reports that already exist")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        written, skipped, failed = run_batch(args.month, args.output, args.clients, args.workers,
+                                             args.force, args.all_clients)
+    except (ConnectionError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ {args.month}: wrote {written} reports, skipped {skipped} already done, {failed} failed "
+          f"in {time.perf_counter() - started:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+# benchmark.py
+#
+# Reproducible performance harness. For each data size it recreates a scratch
+# database, fills it from a seeded synthetic gym (clients, years of weigh-ins,
+# activity logs and reminders), then times every public Database method, the
+# client roster store, chart series building and PDF export. Reads are timed
+# first, against the seeded data only; writes change that data, so each one
+# runs once afterwards. Results are written as JSON; --compare flags cases
+# that got slower than a previous run.
+#
+#   python benchmark.py --sizes small medium --output bench-$(git rev-parse --short HEAD).json
+#   python benchmark.py --sizes small --compare bench-old.json
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+import mysql.connector
+from database.db_config import DB_CONFIG, configure_pool
+from database.database import Database
+from database.migrations import reset_schema_cache
+from database.client_store import ClientStore
+from database.progress_cache import ProgressSeries
+from database.progress_store import build_progress_store, store_path
+from database.report_export import export_progress_pdf
+from ui.lttb import lttb
+
+TODAY = date.today()
+CHUNK = 5000  # Rows per executemany() while generating
+
+# "activity_days" is the share of days with a logged activity; "progress_every" is days between weigh-ins
+SIZES = {
+    "small": {"clients": 50, "years": 1, "progress_every": 3, "activity_days": 0.5,
+              "reminders": 20, "roster": 1000},
+    "medium": {"clients": 500, "years": 2, "progress_every": 2, "activity_days": 0.7,
+               "reminders": 50, "roster": 10000},
+    "large": {"clients": 2000, "years": 3, "progress_every": 1, "activity_days": 1.0,
+              "reminders": 100, "roster": 100000},  # ~2.2M activity rows, ~2.2M weigh-ins
+}
+
+ACTIVITIES = {
+    "Running": 9.8, "Cycling": 7.5, "Swimming": 8.0, "Walking": 3.5, "Yoga": 2.5,
+    "Rowing": 7.0, "Weight Training": 6.0, "HIIT": 8.0, "Elliptical": 5.0, "Stretching": 2.3,
+}
+GOALS = ["Lose weight", "Build muscle", "Endurance", "Flexibility", "General fitness"]
+STATUSES = ["Pending", "Done", "Overdue"]
+NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn"]
+
+
+def _chunks(rows):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def generate(db, spec, seed=42):
+    """Fill an empty schema through `db` from `spec`; returns row counts per table."""
+    rng = random.Random(seed)
+    cursor = db.cursor
+    days = spec["years"] * 365
+    start = TODAY - timedelta(days=days - 1)
+
+    clients = [(f"{rng.choice(NAMES)} {i}", rng.randint(16, 70), round(rng.uniform(50, 120), 1), rng.choice(GOALS))
+               for i in range(spec["clients"])]
+    cursor.executemany("INSERT INTO clients (name, age, weight, goal) VALUES (%s, %s, %s, %s)", clients)
+    for name, met in ACTIVITIES.items():
+        db.save_activity(name, met)
+    cursor.executemany("INSERT INTO users (username, password) VALUES (%s, %s)",
+                       [(f"user{i}", "0" * 64) for i in range(spec["clients"])])
+    db.conn.commit()
+    cursor.execute("SELECT id, weight FROM clients ORDER BY id")
+    client_weights = cursor.fetchall()
+
+    def progress_rows():
+        for client_id, weight in client_weights:
+            for day in range(0, days, spec["progress_every"]):
+                weight = max(40.0, weight + rng.gauss(-0.02, 0.3))  # Slow downward random walk
+                yield client_id, start + timedelta(days=day), round(weight, 1), rng.choice(["", "", "Felt good"])
+
+    def activity_rows():
+        names = list(ACTIVITIES)
+        for client_id, weight in client_weights:
+            for day in range(days):
+                if rng.random() < spec["activity_days"]:
+                    name = rng.choice(names)
+                    minutes = rng.randint(10, 90)
+                    yield (f"{rng.getrandbits(128):032x}", client_id, name, minutes,
+                           round(ACTIVITIES[name] * weight * minutes / 60.0, 1), start + timedelta(days=day))
+
+    def reminder_rows():
+        for client_id, _ in client_weights:
+            for _ in range(spec["reminders"]):
+                yield (client_id, start + timedelta(days=rng.randrange(days + 60)), "Check in",
+                       rng.choice(STATUSES))
+
+    counts = {"clients": len(client_weights), "progress": 0, "activity_log": 0, "reminders": 0}
+    for table, query, rows in (
+        ("progress", "INSERT INTO progress (client_id, date, weight, notes) VALUES (%s, %s, %s, %s)",
+         progress_rows()),
+        ("activity_log", "INSERT INTO activity_log (entry_id, client_id, activity, duration, calories_burned, "
+                         "log_date) VALUES (%s, %s, %s, %s, %s, %s)", activity_rows()),
+        ("reminders", "INSERT INTO reminders (client_id, reminder_date, message, status) VALUES (%s, %s, %s, %s)",
+         reminder_rows()),
+    ):
+        for chunk in _chunks(rows):
+            cursor.executemany(query, chunk)
+            db.conn.commit()
+            counts[table] += len(chunk)
+    db.rebuild_activity_rollups()
+    return counts
+
+
+def timed(func, repeat):
+    """Run `func` `repeat` times; returns (stats, last result)."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        times.append((time.perf_counter() - started) * 1000)
+    return {"min_ms": round(min(times), 3), "median_ms": round(statistics.median(times), 3), "runs": repeat}, result
+
+
+def read_cases(db, heavy_client):
+    """(name, method, callable) for the public Database methods that only read."""
+    month_start = TODAY.replace(day=1)
+    return [
+        ("create_tables", "create_tables", lambda: db.create_tables()),
+        ("get_reminders", "get_reminders", lambda: db.get_reminders()),
+        ("get_reminders_page", "get_reminders_page", lambda: db.get_reminders_page()),
+        ("get_reminders_page status+window", "get_reminders_page",
+         lambda: db.get_reminders_page(status="Pending", start_date=TODAY - timedelta(days=90), end_date=TODAY)),
+        ("get_pending_reminders 7d", "get_pending_reminders", lambda: db.get_pending_reminders(TODAY, TODAY + timedelta(days=7))),
+        ("get_password_hash", "get_password_hash", lambda: db.get_password_hash("user1")),
+        ("get_all_clients", "get_all_clients", lambda: db.get_all_clients()),
+        ("get_client_name", "get_client_name", lambda: db.get_client_name(heavy_client)),
+        ("get_client_weight", "get_client_weight", lambda: db.get_client_weight(heavy_client)),
+        ("get_progress", "get_progress", lambda: db.get_progress(heavy_client)),
+        ("get_progress 90d", "get_progress",
+         lambda: db.get_progress(heavy_client, TODAY - timedelta(days=90), TODAY)),
+        ("count_progress", "count_progress", lambda: db.count_progress(heavy_client)),
+        ("iter_progress", "iter_progress", lambda: sum(len(rows) for rows in db.iter_progress(heavy_client))),
+        ("iter_all_progress", "iter_all_progress", lambda: sum(len(rows) for rows in db.iter_all_progress())),
+        ("get_progress_series", "get_progress_series", lambda: len(db.get_progress_series(heavy_client))),
+        ("get_progress_summary month", "get_progress_summary",
+         lambda: db.get_progress_summary(heavy_client, "month")),
+        ("get_progress_summary season", "get_progress_summary",
+         lambda: db.get_progress_summary(heavy_client, "season")),
+        ("get_activity_list", "get_activity_list", lambda: db.get_activity_list()),
+        ("get_catalog_version", "get_catalog_version", lambda: db.get_catalog_version("activities")),
+        ("get_activity_totals day 90d", "get_activity_totals",
+         lambda: db.get_activity_totals(heavy_client, "day", TODAY - timedelta(days=90), TODAY)),
+        ("get_activity_totals week", "get_activity_totals", lambda: db.get_activity_totals(heavy_client, "week")),
+        ("get_activity_totals month", "get_activity_totals", lambda: db.get_activity_totals(heavy_client, "month")),
+        ("get_active_client_ids month", "get_active_client_ids",
+         lambda: db.get_active_client_ids(month_start, TODAY)),
+        ("get_chart_fingerprints", "get_chart_fingerprints", lambda: db.get_chart_fingerprints()),
+        ("get_activity_rows 50000", "get_activity_rows", lambda: db.get_activity_rows(0, 50000)),
+        ("get_today_activity_log", "get_today_activity_log", lambda: db.get_today_activity_log(heavy_client)),
+    ]
+
+
+def write_cases(db, heavy_client, counter):
+    """(name, method, callable) for the public Database methods that write; each is meant to run once.
+
+    Run in this order: update_activity_calories bypasses the rollups and the
+    rebuild at the end puts them back in step. `counter` keeps keys unique.
+    """
+    activity_ids = [row[0] for row in db.get_activity_rows(0, 1000)]
+    reminder_ids = [row["id"] for row in db.get_reminders_page(limit=1000)]
+    return [
+        ("save_reminder", "save_reminder",
+         lambda: db.save_reminder(heavy_client, TODAY + timedelta(days=next(counter) % 300), "Bench", "Pending")),
+        ("save_reminders_bulk 1000", "save_reminders_bulk",
+         lambda: db.save_reminders_bulk([(heavy_client, TODAY + timedelta(days=400 + i % 30), "Bench bulk", "Pending")
+                                         for i in range(1000)])),
+        ("mark_overdue_reminders", "mark_overdue_reminders", lambda: db.mark_overdue_reminders(TODAY)),
+        ("mark_reminders_notified 100", "mark_reminders_notified",
+         lambda: db.mark_reminders_notified(reminder_ids[:100])),
+        ("delete_reminder", "delete_reminder", lambda: db.delete_reminder(reminder_ids[-1])),
+        ("add_user", "add_user", lambda: db.add_user(f"bench{next(counter)}", "0" * 64)),
+        ("set_password_hash", "set_password_hash", lambda: db.set_password_hash("user1", f"{next(counter):064d}")),
+        ("add_progress", "add_progress", lambda: db.add_progress(heavy_client, TODAY.isoformat(), 80.0, "Bench")),
+        ("save_activity", "save_activity", lambda: db.save_activity("Bench Activity", 4.0)),
+        ("delete_activity", "delete_activity", lambda: db.delete_activity("Bench Activity")),
+        ("log_activity", "log_activity", lambda: db.log_activity(heavy_client, "Running", 30, 300.0)),
+        ("log_activities_bulk 500", "log_activities_bulk",
+         lambda: db.log_activities_bulk([(f"{next(counter):032x}", heavy_client, "Walking", 20, 80.0,
+                                          TODAY.isoformat()) for _ in range(500)])),
+        ("update_activity_calories 1000", "update_activity_calories",
+         lambda: db.update_activity_calories([(100.0, activity_id) for activity_id in activity_ids])),
+        ("rebuild_activity_rollups", "rebuild_activity_rollups", lambda: db.rebuild_activity_rollups()),
+    ]
+
+
+def other_cases(db, heavy_client, spec, workdir):
+    """Roster store, chart series, progress store and PDF export cases.
+
+    The store is built for the benchmark database, so from here on the
+    progress readers use it and add_progress() appends to it.
+    """
+    roster_path = os.path.join(workdir, "clients.json")
+    rng = random.Random(7)
+    roster = {str(i): {"name": f"{rng.choice(NAMES)} {i}", "age": str(rng.randint(16, 70)),
+                       "weight": str(rng.randint(50, 120)), "goal": rng.choice(GOALS)}
+              for i in range(spec["roster"])}
+
+    def roster_save():
+        for path in (roster_path, roster_path + ".journal"):
+            if os.path.exists(path):
+                os.remove(path)
+        store = ClientStore(roster_path)
+        for client_id, details in roster.items():
+            store.put(client_id, details)
+        store.compact()
+        store.close()
+
+    def roster_load():
+        store = ClientStore(roster_path)
+        store.close()
+        return len(store.clients)
+
+    rows = db.get_progress(heavy_client)
+    series = ProgressSeries.from_rows(rows)
+    pdf_path = os.path.join(workdir, "report.pdf")
+    return [
+        ("client_store save", roster_save),
+        ("client_store load", roster_load),
+        ("series from_rows", lambda: ProgressSeries.from_rows(rows)),
+        ("series lttb 800px", lambda: lttb(series.x, series.y, 800)),
+        ("progress_store build", lambda: build_progress_store(db)),
+        ("get_progress_series from store", lambda: len(db.get_progress_series(heavy_client))),
+        ("get_progress_summary month from store", lambda: db.get_progress_summary(heavy_client, "month")),
+        ("pdf export heavy client", lambda: export_progress_pdf(db, pdf_path, heavy_client)),
+    ]
+
+
+def run_size(name, spec, args):
+    print(f"📦 {name}: {spec}")
+    config = {key: value for key, value in DB_CONFIG.items() if key != "database"}
+    server = mysql.connector.connect(**config)
+    cursor = server.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{args.database}`")
+    cursor.execute(f"CREATE DATABASE `{args.database}`")
+    server.close()
+    shutil.rmtree(store_path(args.database), ignore_errors=True)  # Built from the old data
+
+    configure_pool(**config, database=args.database)
+    reset_schema_cache()
+    db = Database()
+    if db.conn is None:
+        raise ConnectionError("Could not connect to the benchmark database.")
+    try:
+        started = time.perf_counter()
+        counts = generate(db, spec, args.seed)
+        generate_s = time.perf_counter() - started
+        print(f"   generated {counts} in {generate_s:.1f}s")
+
+        db.cursor.execute("SELECT client_id FROM progress GROUP BY client_id ORDER BY COUNT(*) DESC LIMIT 1")
+        heavy_client = db.cursor.fetchone()[0]
+        counter = iter(range(1, 10 ** 12))
+        results = {}
+
+        reads = read_cases(db, heavy_client)
+        writes = write_cases(db, heavy_client, counter)
+        covered = {method for _, method, _ in reads + writes}
+        public = {attr for attr in dir(Database) if not attr.startswith("_") and callable(getattr(Database, attr))}
+        missing = sorted(public - covered - {"close"})
+        for method in missing:
+            print(f"⚠️ No benchmark case for Database.{method}")
+
+        with tempfile.TemporaryDirectory() as workdir:
+            runs = ([(case, func, args.repeat) for case, _, func in reads]
+                    + [(case, func, args.repeat) for case, func in other_cases(db, heavy_client, spec, workdir)]
+                    + [(case, func, 1) for case, _, func in writes])
+            for case, func, repeat in runs:
+                results[case], _ = timed(func, repeat)
+                print(f"   {case:<40} {results[case]['median_ms']:10.2f} ms")
+    finally:
+        db.close()
+    return {"spec": spec, "rows": counts, "generate_s": round(generate_s, 2), "heavy_client": heavy_client,
+            "missing_cases": missing, "results": results}
+
+
+def compare(current, baseline, threshold):
+    """Print cases whose median got more than `threshold` times slower; returns how many."""
+    regressions = 0
+    for size, report in current["sizes"].items():
+        old = baseline.get("sizes", {}).get(size, {}).get("results", {})
+        for case, stats in report["results"].items():
+            if case in old and old[case]["median_ms"] > 0:
+                ratio = stats["median_ms"] / old[case]["median_ms"]
+                if ratio > threshold:
+                    regressions += 1
+                    print(f"❌ {size} {case}: {old[case]['median_ms']:.2f} -> {stats['median_ms']:.2f} ms (x{ratio:.2f})")
+    if not regressions:
+        print(f"✅ No case slower than x{threshold} against {baseline.get('commit')}")
+    return regressions
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the data layer on seeded synthetic gym data.")
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["small"])
+    parser.add_argument("--database", default="fitness_tracker_bench",
+                        help="Scratch database; it is dropped and recreated for every size")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Earlier results JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "sizes": {name: run_size(name, SIZES[name], args) for name in args.sizes},
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+    if args.compare:
+        with open(args.compare) as file:
+            if compare(report, json.load(file), args.threshold):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
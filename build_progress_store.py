@@ -0,0 +1,35 @@
+# build_progress_store.py
+#
+# Exports every progress entry into the columnar, memory-mapped progress store
+# used for charts and report summaries. Once built, Database.add_progress()
+# keeps it current; rerun to resynchronise it with the database, e.g. after
+# entries were changed in SQL directly.
+#
+#   python build_progress_store.py
+
+import argparse
+import sys
+import time
+from database.database import Database
+from database.progress_store import build_progress_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the columnar progress store from the database.")
+    parser.add_argument("--output", help="Store directory (default: progress_store/<database>)")
+    args = parser.parse_args()
+
+    db = Database()
+    if db.conn is None:
+        sys.exit(1)
+    started = time.perf_counter()
+    try:
+        store = build_progress_store(db, args.output)
+    finally:
+        db.close()
+    print(f"✅ Stored {len(store)} entries for {len(store.client_ids())} clients "
+          f"in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
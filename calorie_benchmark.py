@@ -0,0 +1,102 @@
+# calorie_benchmark.py
+#
+# Compares the vectorized CalorieEngine with the row-at-a-time scalar formula
+# on synthetic activity logs of increasing size. With --database it also times
+# a full recalculate_activity_log() pass (read, compute, write back, rebuild
+# rollups) against an existing database, e.g. the one benchmark.py fills.
+#
+#   python calorie_benchmark.py --sizes 10000 100000 1000000 --output calories.json
+#   python calorie_benchmark.py --sizes 10000 --database fitness_tracker_bench
+
+import argparse
+import json
+import random
+import time
+import numpy as np
+from database.calorie_engine import CalorieEngine, calories, recalculate_activity_log
+from database.db_config import DB_CONFIG, configure_pool
+from database.database import Database
+
+MET_TABLE = {
+    "Running": 9.8, "Cycling": 7.5, "Swimming": 8.0, "Walking": 3.5, "Yoga": 2.5,
+    "Rowing": 7.0, "Weight Training": 6.0, "HIIT": 8.0, "Elliptical": 5.0, "Stretching": 2.3,
+}
+
+
+def synthetic_log(rows, seed=42):
+    rng = random.Random(seed)
+    names = list(MET_TABLE)
+    activities = [rng.choice(names) for _ in range(rows)]
+    weights = [rng.uniform(45, 130) for _ in range(rows)]
+    minutes = [rng.randint(5, 120) for _ in range(rows)]
+    return activities, weights, minutes
+
+
+def scalar(activities, weights, minutes):
+    return [calories(MET_TABLE.get(a, 0.0), w, m) for a, w, m in zip(activities, weights, minutes)]
+
+
+def best_of(repeat, func, *args):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - started)
+    return min(times), result
+
+
+def run(sizes, repeat=3):
+    engine = CalorieEngine(MET_TABLE)
+    results = []
+    for size in sizes:
+        activities, weights, minutes = synthetic_log(size)
+        scalar_s, expected = best_of(repeat, scalar, activities, weights, minutes)
+        vector_s, actual = best_of(repeat, engine.compute, activities, weights, minutes)
+        assert np.allclose(expected, actual)
+        results.append({
+            "rows": size,
+            "scalar_ms": scalar_s * 1000,
+            "vectorized_ms": vector_s * 1000,
+            "speedup": scalar_s / vector_s if vector_s else None,
+        })
+        print(f"{size:>10} rows  scalar {scalar_s * 1000:9.1f} ms  vectorized {vector_s * 1000:8.1f} ms  "
+              f"x{results[-1]['speedup']:.1f}")
+    return results
+
+
+def run_database(database, repeat=1):
+    """Time recalculate_activity_log() end to end, database writes included."""
+    config = {key: value for key, value in DB_CONFIG.items() if key != "database"}
+    configure_pool(**config, database=database)
+    db = Database()
+    if db.conn is None:
+        raise ConnectionError(f"Could not connect to {database}.")
+    try:
+        total_s, rows = best_of(repeat, recalculate_activity_log, db, CalorieEngine(MET_TABLE))
+    finally:
+        db.close()
+    result = {"rows": rows, "recalculate_ms": total_s * 1000, "rows_per_s": rows / total_s if total_s else None}
+    print(f"{rows:>10} rows  recalculate_activity_log {total_s * 1000:9.1f} ms  "
+          f"({result['rows_per_s'] or 0:,.0f} rows/s incl. writes)")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized vs scalar calorie maths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--database",
+                        help="Also time a full recalculation in this database; its calories are rewritten")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat)
+    if args.database:
+        results.append(run_database(args.database))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
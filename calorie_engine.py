@@ -0,0 +1,66 @@
+# database/calorie_engine.py
+
+import numpy as np
+
+DEFAULT_WEIGHT_KG = 70.0  # Used when a client has no recorded weight
+RECALC_CHUNK_SIZE = 50000
+
+
+def effective_weights(weights_kg):
+    """Weights to calculate with: anything but a positive number (None, NaN, 0, < 0) becomes DEFAULT_WEIGHT_KG.
+
+    Takes a scalar or an array; calories() and CalorieEngine.compute() both
+    go through here, so a preview always matches the recalculated value.
+    """
+    if weights_kg is None or np.isscalar(weights_kg):
+        return weights_kg if weights_kg is not None and weights_kg > 0 else DEFAULT_WEIGHT_KG
+    weights = np.asarray(weights_kg, dtype=np.float64)  # None entries become NaN
+    return np.where(weights > 0, weights, DEFAULT_WEIGHT_KG)
+
+
+def calories(met, weight_kg, minutes):
+    """Energy burned in kcal: MET x body weight (kg) x duration (hours)."""
+    return met * effective_weights(weight_kg) * minutes / 60.0
+
+
+class CalorieEngine:
+    """MET-based calorie calculation over whole arrays of activity rows."""
+
+    def __init__(self, met_table):
+        self.met_table = dict(met_table)
+
+    def met_for(self, activities):
+        """MET value for each activity name (0 for activities missing from the table)."""
+        names, inverse = np.unique(np.asarray(activities, dtype=object), return_inverse=True)
+        mets = np.array([self.met_table.get(name, 0.0) for name in names], dtype=np.float64)
+        return mets[inverse]
+
+    def compute(self, activities, weights_kg, minutes):
+        """Vectorized kcal for parallel sequences of activity, weight and minutes."""
+        return self.met_for(activities) * effective_weights(weights_kg) * np.asarray(minutes, dtype=np.float64) / 60.0
+
+    def preview(self, activity, weight_kg, minutes):
+        """Single-row estimate for the activity screen."""
+        return round(calories(self.met_table.get(activity, 0.0), weight_kg, minutes), 1)
+
+
+def recalculate_activity_log(db, engine, chunk_size=RECALC_CHUNK_SIZE):
+    """Recompute calories_burned for every logged activity, e.g. after a MET correction.
+
+    Rows are read in id order, chunk by chunk, computed as arrays and written
+    back with one UPDATE ... JOIN per chunk; the activity rollups are rebuilt at
+    the end. Returns how many rows were updated.
+    """
+    updated = 0
+    after_id = 0
+    while True:
+        rows = db.get_activity_rows(after_id, chunk_size)
+        if not rows:
+            db.rebuild_activity_rollups()
+            return updated
+        ids, activities, minutes, weights = zip(*rows)
+        weights = np.array([np.nan if w is None else w for w in weights], dtype=np.float64)
+        burned = np.round(engine.compute(activities, weights, minutes), 1)
+        db.update_activity_calories(list(zip(burned.tolist(), ids)))
+        updated += len(rows)
+        after_id = ids[-1]
@@ -1,7 +1,16 @@
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QComboBox, QTableWidget, QTableWidgetItem
+from PyQt5.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QComboBox, QTableWidget, QTableWidgetItem,
+    QFileDialog, QMessageBox
+)
 from PyQt5.QtChart import QChart, QChartView, QLineSeries, QValueAxis, QDateTimeAxis
-from PyQt5.QtCore import Qt, QDateTime
-from database.database import Database  # ✅ Corrected import
+from PyQt5.QtCore import Qt, QDate, QDateTime, QPointF
+import numpy as np
+from database.async_db import AsyncDatabase
+from ui.client_completer import attach_to_combo
+from database.progress_cache import MS_PER_DAY, progress_cache, load_progress_series
+from ui.lttb import lttb
+
+PREFETCH_NEIGHBOURS = 1  # Clients on each side of the selection to warm the cache for
 
 class ChartsWindow(QWidget):
     def __init__(self):
@@ -12,12 +21,7 @@ class ChartsWindow(QWidget):
         self.setWindowTitle("Client Progress Charts")
         self.setGeometry(100, 100, 600, 400)
 
-        try:
-            self.db = Database()  # ✅ Try connecting to the database
-            print("✅ Database connected successfully!")  # Debugging print
-        except Exception as e:
-            print(f"❌ Database connection failed: {e}")  # Debugging print
-            return  # Stop execution if DB connection fails
+        self.db = AsyncDatabase(self)  # ✅ Queries run on worker threads, never on the GUI thread
 
         layout = QVBoxLayout()
 
@@ -26,6 +30,7 @@ class ChartsWindow(QWidget):
         layout.addWidget(self.client_id_label)
 
         self.client_id_dropdown = QComboBox()
+        self.client_search = attach_to_combo(self.client_id_dropdown)
         layout.addWidget(self.client_id_dropdown)
 
         # Load Client IDs
@@ -35,7 +40,9 @@ class ChartsWindow(QWidget):
 
         # Chart display
         self.chart_view = QChartView()
+        self.chart_view.setRubberBand(QChartView.RectangleRubberBand)  # Drag to zoom in
         layout.addWidget(self.chart_view)
+        self.init_chart()
 
         # Table display
         self.table = QTableWidget()
@@ -45,6 +52,7 @@ class ChartsWindow(QWidget):
 
         # Buttons
         self.btn_save_chart = QPushButton("Save Chart")
+        self.btn_save_chart.clicked.connect(self.save_chart)
         layout.addWidget(self.btn_save_chart)
 
         self.btn_back = QPushButton("Back to Dashboard")
@@ -55,18 +63,20 @@ class ChartsWindow(QWidget):
 
     def load_client_ids(self):
         """Load client IDs into dropdown."""
-        try:
-            clients = self.db.get_all_clients()
-            if not clients:
-                print("⚠️ No clients found in the database.")  # Debugging print
-                return
+        self.db.submit("clients", "get_all_clients",
+                       on_result=self.populate_client_ids,
+                       on_error=lambda e: print(f"❌ Error loading clients: {e}"))
 
-            for client in clients:
-                self.client_id_dropdown.addItem(f"{client['id']} - {client['name']}", client['id'])
+    def populate_client_ids(self, clients):
+        if not clients:
+            print("⚠️ No clients found in the database.")  # Debugging print
+            return
+
+        for client in clients:
+            self.client_id_dropdown.addItem(f"{client['id']} - {client['name']}", client['id'])
+        self.client_search.set_clients(clients)
 
-            print("✅ Clients loaded successfully")  # Debugging print
-        except Exception as e:
-            print(f"❌ Error loading clients: {e}")
+        print("✅ Clients loaded successfully")  # Debugging print
 
     def load_chart_data(self):
         """Fetch progress data for the selected client and update the chart."""
@@ -77,48 +87,128 @@ class ChartsWindow(QWidget):
 
         print(f"📊 Loading progress data for Client ID: {client_id}")  # Debugging print
 
-        progress_data = self.db.get_progress(client_id)
-
-        if not progress_data:
-            print("⚠️ No progress data found for this client.")  # Debugging print
-            return
-
+        series = progress_cache.peek(client_id)
+        if series is not None:
+            self.db.cancel("progress")
+            self.show_progress_data(series)
+        else:
+            # Switching clients supersedes any query still running for the previous one
+            self.db.submit("progress", load_progress_series, client_id,
+                           on_result=self.show_progress_data,
+                           on_error=lambda e: print(f"❌ Error loading progress: {e}"))
+        self.prefetch_neighbours()
+
+    def prefetch_neighbours(self):
+        """Warm the cache for the clients just above and below the selection."""
+        index = self.client_id_dropdown.currentIndex()
+        for step in range(1, PREFETCH_NEIGHBOURS + 1):
+            for side, neighbour in (("prev", index - step), ("next", index + step)):
+                client_id = self.client_id_dropdown.itemData(neighbour)
+                key = f"prefetch-{side}-{step}"
+                if client_id is None or progress_cache.peek(client_id) is not None:
+                    self.db.cancel(key)
+                else:
+                    self.db.submit(key, load_progress_series, client_id)
+
+    def show_progress_data(self, series):
         # Update Table
-        self.table.setRowCount(len(progress_data))
-        for row, data in enumerate(progress_data):
-            self.table.setItem(row, 0, QTableWidgetItem(data["date"]))
-            self.table.setItem(row, 1, QTableWidgetItem(str(data["weight"])))
+        self.table.setRowCount(len(series))
+        for row, (date, weight) in enumerate(zip(series.dates(), series.y.tolist())):
+            self.table.setItem(row, 0, QTableWidgetItem(date))
+            self.table.setItem(row, 1, QTableWidgetItem(str(weight)))
 
         # Update Chart
-        self.update_chart(progress_data)
+        self.update_chart(series)
 
-    def update_chart(self, progress_data):
-        """Plot weight progress over time."""
-        series = QLineSeries()
-        for data in progress_data:
-            date = QDateTime.fromString(data["date"], "yyyy-MM-dd").toMSecsSinceEpoch()
-            series.append(date, data["weight"])
+    def init_chart(self):
+        """Build the chart, series and axes once; client switches only swap the points."""
+        self.series = QLineSeries()
+        self.series.setUseOpenGL(True)
+        self.full_x = np.empty(0, dtype=np.int64)
+        self.full_y = np.empty(0, dtype=np.float64)
+        self._setting_range = False
 
-        chart = QChart()
-        chart.addSeries(series)
-        chart.setTitle("Weight Progress Over Time")
+        self.chart = QChart()
+        self.chart.addSeries(self.series)
+        self.chart.setTitle("Weight Progress Over Time")
+        self.chart.legend().hide()
 
         # X-Axis (Date)
-        axis_x = QDateTimeAxis()
-        axis_x.setFormat("dd/MM/yyyy")
-        axis_x.setTitleText("Date")
-        chart.addAxis(axis_x, Qt.AlignBottom)
-        series.attachAxis(axis_x)
+        self.axis_x = QDateTimeAxis()
+        self.axis_x.setFormat("dd/MM/yyyy")
+        self.axis_x.setTitleText("Date")
+        self.chart.addAxis(self.axis_x, Qt.AlignBottom)
+        self.series.attachAxis(self.axis_x)
 
         # Y-Axis (Weight)
-        axis_y = QValueAxis()
-        axis_y.setTitleText("Weight (Kgs)")
-        chart.addAxis(axis_y, Qt.AlignLeft)
-        series.attachAxis(axis_y)
+        self.axis_y = QValueAxis()
+        self.axis_y.setTitleText("Weight (Kgs)")
+        self.chart.addAxis(self.axis_y, Qt.AlignLeft)
+        self.series.attachAxis(self.axis_y)
 
-        self.chart_view.setChart(chart)
+        self.axis_x.rangeChanged.connect(self.on_zoom)
+        self.chart_view.setChart(self.chart)
+
+    def update_chart(self, series):
+        """Plot weight progress over time."""
+        # Cached dates are UTC midnight. Move each to local midnight of the same day, using that
+        # day's UTC offset rather than today's, so entries across a DST change stay on their day.
+        days, inverse = np.unique(series.x // MS_PER_DAY, return_inverse=True)
+        epoch = QDate(1970, 1, 1)
+        local_ms = np.array([QDateTime(epoch.addDays(day)).toMSecsSinceEpoch() for day in days.tolist()],
+                            dtype=np.int64)
+        self.plot_series(local_ms[inverse], series.y)
+
+    def plot_series(self, x, y):
+        """Show a full (epoch-ms, weight) series, reset to its whole date range."""
+        self.full_x, self.full_y = x, y
+        if len(x) == 0:
+            self.series.clear()
+            return
+
+        self._setting_range = True
+        try:
+            self.chart.zoomReset()
+            self.axis_x.setRange(QDateTime.fromMSecsSinceEpoch(int(x[0])),
+                                 QDateTime.fromMSecsSinceEpoch(int(x[-1])))
+            self.axis_y.setRange(float(y.min()) - 1, float(y.max()) + 1)
+        finally:
+            self._setting_range = False
+        self.redraw_visible(x[0], x[-1])
         print("✅ Chart updated successfully!")  # Debugging print
 
+    def on_zoom(self, start, end):
+        if not self._setting_range:
+            self.redraw_visible(start.toMSecsSinceEpoch(), end.toMSecsSinceEpoch())
+
+    def redraw_visible(self, start_ms, end_ms):
+        """Downsample the visible slice to about one point per pixel and swap it in at once."""
+        first = max(int(np.searchsorted(self.full_x, start_ms, side="left")) - 1, 0)
+        last = min(int(np.searchsorted(self.full_x, end_ms, side="right")) + 1, len(self.full_x))
+        width = max(int(self.chart.plotArea().width()), 100)
+        x, y = lttb(self.full_x[first:last], self.full_y[first:last], width)
+        self.series.replace([QPointF(px, py) for px, py in zip(x.tolist(), y.tolist())])
+
+    def save_chart(self):
+        """Save the chart as currently shown (including any zoom) to a PNG file."""
+        client_id = self.client_id_dropdown.currentData()
+        if not client_id or not len(self.full_x):
+            QMessageBox.warning(self, "No Chart", "Select a client with progress data first.")
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Save Chart", f"client_{client_id}_weight.png",
+                                              "PNG images (*.png)")
+        if not path:
+            return
+        if self.chart_view.grab().save(path, "PNG"):
+            QMessageBox.information(self, "Success", f"Chart saved to {path}")
+        else:
+            QMessageBox.critical(self, "Save Error", f"Could not write {path}")
+
+    def closeEvent(self, event):
+        self.db.shutdown()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication([])
     window = ChartsWindow()
@@ -0,0 +1,229 @@
+# cli.py
+#
+# Command-line front end to the core services for bulk and cron-style jobs.
+# Runs without a display and never imports PyQt5.
+#
+#   python cli.py clients list
+#   python cli.py progress add 7 2026-10-01 81.5 --notes "After holiday"
+#   python cli.py activity recalc
+#   python cli.py reminders mark-overdue
+#   python cli.py reports monthly --month 2026-09 --workers 4
+#   python cli.py reports charts --clients 3 7
+
+import argparse
+import sys
+from datetime import date, timedelta
+import mysql.connector
+from database.database import Database
+from core.services import (
+    ActivityService, ClientService, ProgressService, ReminderService, ReportService, ServiceError
+)
+
+
+def _print_rows(rows, columns):
+    for row in rows:
+        print("\t".join("" if row.get(column) is None else str(row[column]) for column in columns))
+
+
+# Commands that only touch the client roster file
+def clients_list(args):
+    service = ClientService.open(args.file)
+    try:
+        for client_id, details in sorted(service.clients.items()):
+            print("\t".join([client_id] + [details.get(field, "") for field in ("name", "age", "weight", "goal")]))
+    finally:
+        service.close()
+
+
+def clients_add(args):
+    service = ClientService.open(args.file)
+    try:
+        service.add(args.id, name=args.name, age=args.age, weight=args.weight, goal=args.goal)
+    finally:
+        service.close()
+    print(f"✅ Client {args.id} added")
+
+
+def clients_delete(args):
+    service = ClientService.open(args.file)
+    try:
+        service.delete(args.id)
+    finally:
+        service.close()
+    print(f"✅ Client {args.id} deleted")
+
+
+# Commands that need the database; each gets an open Database as `db`
+def progress_show(args, db):
+    _print_rows(ProgressService(db).history(args.client, args.start, args.end), ("date", "weight", "notes"))
+
+
+def progress_add(args, db):
+    ProgressService(db).add(args.client, args.date, args.weight, args.notes)
+    print("✅ Progress added")
+
+
+def progress_summary(args, db):
+    rows = ReportService(db).summary(args.client, args.period, args.start, args.end)
+    _print_rows(rows, ("period", "entries", "start_weight", "end_weight", "change", "min_weight", "max_weight",
+                       "mean_weight", "minutes", "calories", "sessions"))
+
+
+def progress_build_store(args, db):
+    store = ProgressService(db).build_store(args.output)
+    print(f"✅ Stored {len(store)} entries for {len(store.client_ids())} clients in {store.path}")
+
+
+def activity_log(args, db):
+    row = ActivityService(db).log(args.client, args.activity, args.minutes, args.weight)
+    print(f"✅ Logged {row['activity']}, {row['duration']} mins, {row['calories_burned']} kcal")
+
+
+def activity_totals(args, db):
+    _print_rows(ActivityService(db).totals(args.client, args.period, args.start, args.end),
+                ("period_start", "minutes", "calories", "sessions"))
+
+
+def activity_recalc(args, db):
+    print(f"✅ Recalculated calories for {ActivityService(db).recalculate_calories()} activities")
+
+
+def activity_rebuild_rollups(args, db):
+    ActivityService(db).rebuild_rollups()
+    print("✅ Activity rollups rebuilt")
+
+
+def reminders_import(args, db):
+    count, seconds = ReminderService(db).import_file(args.file)
+    print(f"✅ Imported {count} reminders in {seconds:.2f}s")
+
+
+def reminders_due(args, db):
+    _print_rows(ReminderService(db).due(args.days), ("reminder_date", "client_id", "message"))
+
+
+def reminders_mark_overdue(args, db):
+    print(f"✅ Marked {ReminderService(db).mark_overdue()} reminders overdue")
+
+
+def reports_export(args, db):
+    rows = ReportService(db).export_pdf(args.output, args.client, args.start, args.end)
+    print(f"✅ Wrote {rows} rows to {args.output}")
+
+
+# Batch jobs open their own connections in worker processes
+def reports_monthly(args):
+    written, skipped, failed = ReportService.monthly_batch(args.month, args.output, args.clients,
+                                                           args.workers, args.force)
+    print(f"✅ {args.month}: wrote {written} reports, skipped {skipped}, {failed} failed")
+    return 1 if failed else 0
+
+
+def reports_charts(args):
+    rendered, skipped, failed = ReportService.render_charts(args.output, args.clients, args.workers, args.force)
+    print(f"✅ Rendered {rendered} clients, skipped {skipped} unchanged, {failed} failed")
+    return 1 if failed else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Fitness tracker command-line tools.")
+    groups = parser.add_subparsers(dest="group", required=True)
+
+    def command(group, name, func, uses_db=True, help=None):
+        sub = group.add_parser(name, help=help)
+        sub.set_defaults(func=func, uses_db=uses_db)
+        return sub
+
+    def date_range(sub):
+        sub.add_argument("--start", help="From date, YYYY-MM-DD")
+        sub.add_argument("--end", help="To date, YYYY-MM-DD")
+
+    clients = groups.add_parser("clients", help="Client roster").add_subparsers(dest="command", required=True)
+    for sub in (command(clients, "list", clients_list, False),
+                command(clients, "add", clients_add, False),
+                command(clients, "delete", clients_delete, False)):
+        sub.add_argument("--file", default="clients.json", help="Roster file")
+    clients.choices["add"].add_argument("id")
+    for field in ("name", "age", "weight", "goal"):
+        clients.choices["add"].add_argument(field)
+    clients.choices["delete"].add_argument("id")
+
+    progress = groups.add_parser("progress", help="Weight progress").add_subparsers(dest="command", required=True)
+    sub = command(progress, "show", progress_show)
+    sub.add_argument("client", type=int)
+    date_range(sub)
+    sub = command(progress, "add", progress_add)
+    sub.add_argument("client", type=int)
+    sub.add_argument("date")
+    sub.add_argument("weight")
+    sub.add_argument("--notes", default="")
+    sub = command(progress, "summary", progress_summary)
+    sub.add_argument("client", type=int)
+    sub.add_argument("--period", choices=("month", "season"), default="month")
+    date_range(sub)
+    sub = command(progress, "build-store", progress_build_store)
+    sub.add_argument("--output", help="Store directory (default: progress_store/<database>)")
+
+    activity = groups.add_parser("activity", help="Activity log").add_subparsers(dest="command", required=True)
+    sub = command(activity, "log", activity_log)
+    sub.add_argument("client", type=int)
+    sub.add_argument("activity")
+    sub.add_argument("minutes", type=int)
+    sub.add_argument("--weight", type=float,
+                     help="Client weight in kg for the calorie estimate (default: the recorded weight)")
+    sub = command(activity, "totals", activity_totals)
+    sub.add_argument("client", type=int)
+    sub.add_argument("--period", choices=("day", "week", "month"), default="week")
+    date_range(sub)
+    command(activity, "recalc", activity_recalc, help="Recompute calories from the MET table")
+    command(activity, "rebuild-rollups", activity_rebuild_rollups)
+
+    reminders = groups.add_parser("reminders", help="Reminders").add_subparsers(dest="command", required=True)
+    sub = command(reminders, "import", reminders_import)
+    sub.add_argument("file", help="CSV, JSON or JSON-lines file")
+    sub = command(reminders, "due", reminders_due)
+    sub.add_argument("--days", type=int, default=7)
+    command(reminders, "mark-overdue", reminders_mark_overdue)
+
+    reports = groups.add_parser("reports", help="Reports and charts").add_subparsers(dest="command", required=True)
+    sub = command(reports, "export", reports_export)
+    sub.add_argument("client", type=int)
+    sub.add_argument("output", help="PDF file to write")
+    date_range(sub)
+    sub = command(reports, "monthly", reports_monthly, False)
+    sub.add_argument("--month", default=(date.today().replace(day=1) - timedelta(days=1)).strftime("%Y-%m"),
+                     help="YYYY-MM (default: last month)")
+    sub.add_argument("--output")
+    sub.add_argument("--clients", type=int, nargs="+")
+    sub.add_argument("--workers", type=int)
+    sub.add_argument("--force", action="store_true")
+    sub = command(reports, "charts", reports_charts, False)
+    sub.add_argument("--output")
+    sub.add_argument("--clients", type=int, nargs="+")
+    sub.add_argument("--workers", type=int)
+    sub.add_argument("--force", action="store_true")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        if not args.uses_db:
+            return args.func(args) or 0
+        db = Database()
+        if db.conn is None:
+            return 1
+        try:
+            return args.func(args, db) or 0
+        finally:
+            db.close()
+    except (ServiceError, ConnectionError, FileNotFoundError) as e:
+        print(f"❌ {e}")
+        return 1
+    except mysql.connector.Error as e:
+        print(f"❌ Database error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
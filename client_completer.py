@@ -0,0 +1,70 @@
+# ui/client_completer.py
+
+from PyQt5.QtWidgets import QComboBox, QCompleter
+from PyQt5.QtCore import Qt, QStringListModel, pyqtSignal
+from database.client_search import ClientSearchIndex
+
+MAX_MATCHES = 20
+
+
+class ClientCompleter(QCompleter):
+    """Typeahead popup for a QLineEdit, answered by a ClientSearchIndex.
+
+    The popup is refilled from the index on every edit (the completer itself
+    does no filtering) and picking an entry emits client_selected(client_id).
+    """
+
+    client_selected = pyqtSignal(object)
+
+    def __init__(self, line_edit, parent=None):
+        super().__init__(parent or line_edit)
+        self.index = ClientSearchIndex()
+        self._ids = []
+        self._model = QStringListModel(self)
+        self.setModel(self._model)
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setCaseSensitivity(Qt.CaseInsensitive)
+        self.setMaxVisibleItems(MAX_MATCHES)
+        self.setWidget(line_edit)
+        line_edit.textEdited.connect(self.update_matches)
+        self.activated[str].connect(self._on_activated)
+
+    def set_clients(self, clients):
+        """Index dicts with "id", "name" and optionally "goal"."""
+        self.index = ClientSearchIndex.from_clients(clients)
+
+    def add_client(self, client_id, name, goal=""):
+        self.index.update(client_id, name, goal)
+
+    def remove_client(self, client_id):
+        self.index.remove(client_id)
+
+    def update_matches(self, text):
+        self._ids = self.index.search(text, limit=MAX_MATCHES)
+        self._model.setStringList([self.index.labels[client_id] for client_id in self._ids])
+        if self._ids:
+            self.complete()
+        else:
+            self.popup().hide()
+
+    def _on_activated(self, label):
+        for client_id in self._ids:
+            if self.index.labels.get(client_id) == label:
+                self.client_selected.emit(client_id)
+                return
+
+
+def attach_to_combo(combo):
+    """Make a client dropdown searchable; picking a match selects that client."""
+    combo.setEditable(True)
+    combo.setInsertPolicy(QComboBox.NoInsert)
+    combo.setCompleter(None)  # The built-in completer would filter by exact prefix
+    completer = ClientCompleter(combo.lineEdit(), combo)
+
+    def select(client_id):
+        row = combo.findData(client_id)
+        if row >= 0:
+            combo.setCurrentIndex(row)
+
+    completer.client_selected.connect(select)
+    return completer
@@ -1,13 +1,13 @@
 import sys
-import json
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QListWidget, QMessageBox
+    QLineEdit, QListView, QMessageBox
 )
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
-
-CLIENTS_FILE = "clients.json"
+from core.services import ClientService, ServiceError
+from ui.client_roster_model import ClientRosterModel
+from ui.client_completer import ClientCompleter
 
 class ClientManagementScreen(QWidget):
     def __init__(self):
@@ -26,9 +26,20 @@ class ClientManagementScreen(QWidget):
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setStyleSheet("color: #1A237E;")
 
-        self.client_list = QListWidget()
+        self.client_model = ClientRosterModel(self.clients, self)
+        self.client_list = QListView()
+        self.client_list.setUniformItemSizes(True)
+        self.client_list.setModel(self.client_model)
         self.client_list.setFixedHeight(150)
 
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔎 Search by name, ID or goal")
+        self.client_search = ClientCompleter(self.search_input, self)
+        self.client_search.set_clients(
+            [{"id": client_id, **details} for client_id, details in self.clients.items()]
+        )
+        self.client_search.client_selected.connect(self.select_client)
+
         show_all_btn = QPushButton("🔍 Show All Clients")
         show_all_btn.clicked.connect(self.show_all_clients)
 
@@ -62,6 +73,7 @@ class ClientManagementScreen(QWidget):
 
         top_layout = QVBoxLayout()
         top_layout.addWidget(title_label)
+        top_layout.addWidget(self.search_input)
         top_layout.addWidget(self.client_list)
         top_layout.addWidget(show_all_btn)
 
@@ -90,54 +102,41 @@ class ClientManagementScreen(QWidget):
         main_layout.setSpacing(10)
 
         self.setLayout(main_layout)
-        self.show_all_clients()
 
     def load_clients(self):
-        try:
-            with open(CLIENTS_FILE, "r") as file:
-                self.clients = json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.clients = {}
-
-    def save_clients_to_file(self):
-        with open(CLIENTS_FILE, "w") as file:
-            json.dump(self.clients, file, indent=4)
+        self.service = ClientService.open()
+        self.clients = self.service.clients
 
     def show_all_clients(self):
-        self.client_list.clear()
-        for client_id, details in self.clients.items():
-            self.client_list.addItem(f"ID: {client_id}, Name: {details['name']}, Age: {details['age']}")
+        self.client_model.reload()
 
-    def add_client(self):
-        client_id = self.client_id.text().strip()
-        name = self.client_name.text().strip()
-        age = self.client_age.text().strip()
-        weight = self.client_weight.text().strip()
-        goal = self.client_goal.text().strip()
+    def select_client(self, client_id):
+        index = self.client_model.index_of(client_id)
+        self.client_list.setCurrentIndex(index)
+        self.client_list.scrollTo(index)
 
-        if not client_id or not name or not age or not weight or not goal:
-            QMessageBox.warning(self, "Input Error", "All fields are required!")
-            return
+    def selected_client_id(self):
+        return self.client_model.client_id(self.client_list.currentIndex())
 
-        if client_id in self.clients:
-            QMessageBox.warning(self, "Duplicate Error", "Client ID already exists!")
+    def add_client(self):
+        client_id = self.client_id.text().strip()
+        try:
+            details = self.service.add(client_id, **self.form_details())
+        except ServiceError as e:
+            QMessageBox.warning(self, "Input Error", str(e))
             return
 
-        self.clients[client_id] = {
-            "name": name, "age": age, "weight": weight, "goal": goal
-        }
-        self.save_clients_to_file()
-        self.show_all_clients()
+        self.client_model.client_added(client_id)
+        self.client_search.add_client(client_id, details["name"], details["goal"])
         self.clear_form()
         QMessageBox.information(self, "Success", "Client Added Successfully!")
 
     def edit_client(self):
-        selected_item = self.client_list.currentItem()
-        if not selected_item:
+        client_id = self.selected_client_id()
+        if client_id is None:
             QMessageBox.warning(self, "Selection Error", "Select a client to edit!")
             return
 
-        client_id = selected_item.text().split(",")[0].split(":")[1].strip()
         client_data = self.clients[client_id]
 
         self.client_id.setText(client_id)
@@ -147,41 +146,43 @@ class ClientManagementScreen(QWidget):
         self.client_goal.setText(client_data["goal"])
 
     def delete_client(self):
-        selected_item = self.client_list.currentItem()
-        if not selected_item:
+        client_id = self.selected_client_id()
+        if client_id is None:
             QMessageBox.warning(self, "Selection Error", "Select a client to delete!")
             return
 
-        client_id = selected_item.text().split(",")[0].split(":")[1].strip()
-
         confirmation = QMessageBox.question(
             self, "Confirm Delete", f"Are you sure you want to delete {self.clients[client_id]['name']}?",
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
 
         if confirmation == QMessageBox.Yes:
-            del self.clients[client_id]
-            self.save_clients_to_file()
-            self.show_all_clients()
+            self.service.delete(client_id)
+            self.client_model.client_removed(client_id)
+            self.client_search.remove_client(client_id)
             QMessageBox.information(self, "Success", "Client Deleted Successfully!")
 
     def save_client_data(self):
         client_id = self.client_id.text().strip()
-        if client_id not in self.clients:
-            QMessageBox.warning(self, "Save Error", "Client does not exist!")
+        try:
+            details = self.service.update(client_id, **self.form_details())
+        except ServiceError as e:
+            QMessageBox.warning(self, "Save Error", str(e))
             return
 
-        self.clients[client_id] = {
-            "name": self.client_name.text().strip(),
-            "age": self.client_age.text().strip(),
-            "weight": self.client_weight.text().strip(),
-            "goal": self.client_goal.text().strip()
-        }
-        self.save_clients_to_file()
-        self.show_all_clients()
+        self.client_model.client_changed(client_id)
+        self.client_search.add_client(client_id, details["name"], details["goal"])
         self.clear_form()
         QMessageBox.information(self, "Success", "Client Data Updated Successfully!")
 
+    def form_details(self):
+        return {
+            "name": self.client_name.text(),
+            "age": self.client_age.text(),
+            "weight": self.client_weight.text(),
+            "goal": self.client_goal.text(),
+        }
+
     def clear_form(self):
         self.client_id.clear()
         self.client_name.clear()
@@ -189,6 +190,10 @@ class ClientManagementScreen(QWidget):
         self.client_weight.clear()
         self.client_goal.clear()
 
+    def closeEvent(self, event):
+        self.service.close()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     client_mgmt = ClientManagementScreen()
@@ -0,0 +1,103 @@
+# ui/client_roster_model.py
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+FETCH_BATCH = 500  # Rows handed to the view per fetchMore()
+
+ClientIdRole = Qt.UserRole
+
+
+class ClientRosterModel(QAbstractListModel):
+    """List model over a {client_id: details} mapping.
+
+    Rows keep the client ID natively (ClientIdRole), text is formatted only for
+    rows the view actually paints, and rows are handed to the view in batches
+    through canFetchMore()/fetchMore(). Changes are reported row by row.
+    """
+
+    def __init__(self, clients, parent=None):
+        super().__init__(parent)
+        self.clients = clients
+        self._ids = list(clients)
+        self._rows = {client_id: row for row, client_id in enumerate(self._ids)}  # Inverse of _ids
+        self._loaded = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._ids)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH, len(self._ids) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        client_id = self._ids[index.row()]
+        if role == Qt.DisplayRole:
+            details = self.clients[client_id]
+            return f"ID: {client_id}, Name: {details['name']}, Age: {details['age']}"
+        if role == ClientIdRole:
+            return client_id
+        return None
+
+    def client_id(self, index):
+        """The client ID behind a view index, or None."""
+        return self.data(index, ClientIdRole) if index.isValid() else None
+
+    def index_of(self, client_id):
+        """Model index for a client, fetching rows up to it if needed."""
+        row = self._rows[client_id]
+        while row >= self._loaded:
+            self.fetchMore()
+        return self.index(row)
+
+    def reload(self):
+        """Re-read every ID from the mapping (full reset)."""
+        self.beginResetModel()
+        self._ids = list(self.clients)
+        self._rows = {client_id: row for row, client_id in enumerate(self._ids)}
+        self._loaded = 0
+        self.endResetModel()
+
+    def client_added(self, client_id):
+        """Append a new ID; it becomes visible right away only if every row is loaded."""
+        row = len(self._ids)
+        if self._loaded < row:
+            self._ids.append(client_id)  # Will arrive with a later fetchMore()
+            self._rows[client_id] = row
+            return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ids.append(client_id)
+        self._rows[client_id] = row
+        self._loaded += 1
+        self.endInsertRows()
+
+    def client_changed(self, client_id):
+        row = self._rows[client_id]
+        if row < self._loaded:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def client_removed(self, client_id):
+        row = self._rows[client_id]
+        if row >= self._loaded:
+            self._remove_id(row)
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._remove_id(row)
+        self._loaded -= 1
+        self.endRemoveRows()
+
+    def _remove_id(self, row):
+        del self._rows[self._ids.pop(row)]
+        for later in range(row, len(self._ids)):  # Rows after it move up by one
+            self._rows[self._ids[later]] = later
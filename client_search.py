@@ -0,0 +1,180 @@
+# database/client_search.py
+
+import re
+from collections import Counter
+
+_WORD = re.compile(r"\w+")
+_END = ""  # Trie key marking that the path so far spells a whole token
+
+FUZZY_THRESHOLD = 0.3  # Minimum trigram similarity for a fuzzy match
+
+
+def tokenize(*fields):
+    tokens = set()
+    for field in fields:
+        tokens.update(_WORD.findall(str(field).lower()))
+    return tokens
+
+
+def trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ClientSearchIndex:
+    """In-memory typeahead index over client ID, name and goal.
+
+    Prefix matches come from a character trie over distinct tokens; when they
+    don't fill the result list, tokens sharing enough trigrams with the query
+    are added as fuzzy matches. add/update/remove touch only the tokens of the
+    client concerned, so the index never needs rebuilding.
+    """
+
+    def __init__(self):
+        self._root = {}
+        self._postings = {}    # token -> set of client IDs
+        self._trigrams = {}    # trigram -> set of tokens
+        self._tokens = {}      # client ID -> set of tokens
+        self.labels = {}       # client ID -> display text
+
+    @classmethod
+    def from_clients(cls, clients):
+        """Build from dicts with "id", "name" and optionally "goal"."""
+        index = cls()
+        for client in clients:
+            index.add(client["id"], client.get("name", ""), client.get("goal", ""))
+        return index
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def __contains__(self, client_id):
+        return client_id in self._tokens
+
+    def add(self, client_id, name, goal=""):
+        if client_id in self._tokens:
+            self.remove(client_id)
+        tokens = tokenize(client_id, name, goal)
+        self._tokens[client_id] = tokens
+        self.labels[client_id] = f"{client_id} - {name}"
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                self._insert_token(token)
+            ids.add(client_id)
+
+    update = add
+
+    def remove(self, client_id):
+        tokens = self._tokens.pop(client_id, None)
+        if tokens is None:
+            return
+        del self.labels[client_id]
+        for token in tokens:
+            ids = self._postings[token]
+            ids.discard(client_id)
+            if not ids:
+                del self._postings[token]
+                self._remove_token(token)
+
+    def _insert_token(self, token):
+        node = self._root
+        for char in token:
+            node = node.setdefault(char, {})
+        node[_END] = token
+        if not token.isdigit():  # IDs are matched by prefix only
+            for gram in trigrams(token):
+                self._trigrams.setdefault(gram, set()).add(token)
+
+    def _remove_token(self, token):
+        path = [self._root]
+        for char in token:
+            path.append(path[-1][char])
+        del path[-1][_END]
+        for depth in range(len(token), 0, -1):  # Prune branches left empty
+            if path[depth]:
+                break
+            del path[depth - 1][token[depth - 1]]
+        if token.isdigit():
+            return
+        for gram in trigrams(token):
+            grams = self._trigrams[gram]
+            grams.discard(token)
+            if not grams:
+                del self._trigrams[gram]
+
+    def _prefix_tokens(self, prefix):
+        """Yield every indexed token starting with `prefix`, an exact match first."""
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            token = node.get(_END)
+            if token is not None:
+                yield token
+            stack.extend(child for key, child in node.items() if key != _END)
+
+    def _prefix_weight(self, prefix, cap=1000):
+        """How many clients a prefix matches, counted no further than `cap`."""
+        total = 0
+        for token in self._prefix_tokens(prefix):
+            total += len(self._postings[token])
+            if total >= cap:
+                break
+        return total
+
+    def _has_prefix(self, client_id, prefixes):
+        tokens = self._tokens[client_id]
+        return all(any(token.startswith(p) for token in tokens) for p in prefixes)
+
+    def search(self, query, limit=20, fuzzy=True):
+        """Return up to `limit` client IDs matching every word of `query`."""
+        words = tokenize(query)
+        if not words:
+            return []
+        if len(words) > 1:  # Drive the scan from the most selective word
+            words = sorted(words, key=self._prefix_weight)
+        else:
+            words = list(words)
+        lead, rest = words[0], words[1:]
+        results = []
+        seen = set()
+
+        for token in self._prefix_tokens(lead):
+            for client_id in self._postings[token]:
+                if client_id in seen or (rest and not self._has_prefix(client_id, rest)):
+                    continue
+                seen.add(client_id)
+                results.append(client_id)
+                if len(results) >= limit:
+                    return results
+
+        if fuzzy and len(lead) >= 3 and not lead.isdigit():
+            for token in self._similar_tokens(lead):
+                for client_id in self._postings[token]:
+                    if client_id in seen or (rest and not self._has_prefix(client_id, rest)):
+                        continue
+                    seen.add(client_id)
+                    results.append(client_id)
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    def _similar_tokens(self, word):
+        """Tokens ranked by trigram similarity to `word` (typo tolerance)."""
+        grams = trigrams(word)
+        counts = Counter()
+        for gram in grams:
+            counts.update(self._trigrams.get(gram, ()))
+        scored = []
+        for token, shared in counts.items():
+            score = shared / (len(grams) + len(token) + 1 - shared)  # Jaccard over trigram sets
+            if score >= FUZZY_THRESHOLD:
+                scored.append((score, token))
+        scored.sort(reverse=True)
+        return [token for _, token in scored]
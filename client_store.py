@@ -0,0 +1,145 @@
+# database/client_store.py
+
+import json
+import os
+import threading
+
+FSYNC_EVERY = 32        # fsync the journal after this many unsynced records...
+FSYNC_INTERVAL = 1.0    # ...or at most this many seconds after the first unsynced one
+COMPACT_MIN = 500       # Never compact a journal shorter than this
+
+
+class ClientStore:
+    """Client roster kept as a JSON snapshot plus an append-only journal.
+
+    Every add/edit/delete appends one JSON line to `<snapshot>.journal`, so a
+    write costs the same no matter how many clients exist. Once the journal
+    grows past the roster size (and COMPACT_MIN) it is folded back into the
+    snapshot, which is replaced atomically. Startup loads the snapshot and
+    replays the journal; a torn final line from a crash is ignored.
+
+    Journal fsyncs are batched: a background timer syncs any unsynced records
+    `fsync_interval` seconds after the first of them, so a power loss can
+    lose at most that much (and at most `fsync_every` records) of edits.
+    """
+
+    def __init__(self, path, fsync_every=FSYNC_EVERY, fsync_interval=FSYNC_INTERVAL,
+                 compact_min=COMPACT_MIN):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.compact_min = compact_min
+        self.clients = {}
+        self._journal = None
+        self._journal_records = 0
+        self._unsynced = 0
+        self._timer = None
+        self._lock = threading.RLock()  # The sync timer runs on its own thread
+        self.load()
+
+    def load(self):
+        """Rebuild the roster from the snapshot and the journal tail."""
+        try:
+            with open(self.path, "r") as file:
+                self.clients = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.clients = {}
+
+        self._journal_records = 0
+        try:
+            with open(self.journal_path, "rb+") as file:
+                good = 0
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # Torn write at the tail; everything before it is intact
+                    if not line.endswith(b"\n"):
+                        break
+                    self._apply(record)
+                    self._journal_records += 1
+                    good += len(line)
+                file.truncate(good)  # Drop the torn tail so new records start on a clean line
+        except FileNotFoundError:
+            pass
+        return self.clients
+
+    def _apply(self, record):
+        if record["op"] == "put":
+            self.clients[record["id"]] = record["data"]
+        elif record["op"] == "delete":
+            self.clients.pop(record["id"], None)
+
+    def put(self, client_id, data):
+        """Add or replace a client."""
+        self._append({"op": "put", "id": client_id, "data": data})
+
+    def delete(self, client_id):
+        """Remove a client."""
+        self._append({"op": "delete", "id": client_id})
+
+    def _append(self, record):
+        with self._lock:
+            if self._journal is None:
+                self._journal = open(self.journal_path, "a")
+            self._journal.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._journal.flush()
+            self._apply(record)
+            self._journal_records += 1
+            self._unsynced += 1
+
+            if self._unsynced >= self.fsync_every:
+                self.sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.fsync_interval, self._timed_sync)
+                self._timer.daemon = True
+                self._timer.start()
+            if self._journal_records >= max(self.compact_min, len(self.clients)):
+                self.compact()
+
+    def _timed_sync(self):
+        with self._lock:
+            self._timer = None
+            self.sync()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def sync(self):
+        """Force journal records written so far onto disk."""
+        with self._lock:
+            self._cancel_timer()
+            if self._journal is not None and self._unsynced:
+                os.fsync(self._journal.fileno())
+            self._unsynced = 0
+
+    def compact(self):
+        """Write the roster as a fresh snapshot and start an empty journal."""
+        with self._lock:
+            self._cancel_timer()
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as file:
+                json.dump(self.clients, file, indent=4)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.path)
+
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._journal_records = 0
+            self._unsynced = 0
+
+    def close(self):
+        """Flush pending journal records and release the file."""
+        with self._lock:
+            self._cancel_timer()
+            if self._journal is not None:
+                self.sync()
+                self._journal.close()
+                self._journal = None
@@ -0,0 +1,67 @@
+# credential_benchmark.py
+#
+# Times password hashing at a range of cost settings so SCRYPT_N (or
+# PBKDF2_ITERATIONS) in database/credentials.py can be set to the highest cost
+# that still hashes within the login latency budget on this machine.
+#
+#   python credential_benchmark.py --target-ms 250 --output credentials.json
+
+import argparse
+import hashlib
+import json
+import time
+from database import credentials
+
+SCRYPT_COSTS = [2 ** k for k in range(12, 19)]
+PBKDF2_COSTS = [100000, 200000, 400000, 600000, 800000, 1200000]
+
+
+def best_of(repeat, func):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def run(target_ms, repeat=3):
+    results = []
+    if credentials.HAS_SCRYPT:
+        for n in SCRYPT_COSTS:
+            seconds = best_of(repeat, lambda: credentials.hash_password("correct horse", n=n))
+            results.append({"scheme": "scrypt", "cost": n, "ms": seconds * 1000,
+                            "memory_mb": 128 * n * credentials.SCRYPT_R / 2 ** 20})
+    for iterations in PBKDF2_COSTS:
+        seconds = best_of(repeat, lambda: hashlib.pbkdf2_hmac(
+            "sha256", b"correct horse", b"0123456789abcdef", iterations, credentials.KEY_BYTES))
+        results.append({"scheme": "pbkdf2_sha256", "cost": iterations, "ms": seconds * 1000})
+
+    for result in results:
+        marker = "✅" if result["ms"] <= target_ms else "  "
+        print(f"{marker} {result['scheme']:<14} cost {result['cost']:>8}  {result['ms']:8.1f} ms")
+
+    recommended = {}
+    for scheme in ("scrypt", "pbkdf2_sha256"):
+        within = [r["cost"] for r in results if r["scheme"] == scheme and r["ms"] <= target_ms]
+        if within:
+            recommended[scheme] = max(within)
+    print(f"Recommended within {target_ms} ms: {recommended or 'none - raise the target'}")
+    return {"target_ms": target_ms, "results": results, "recommended": recommended}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark password hashing cost settings.")
+    parser.add_argument("--target-ms", type=float, default=250, help="Acceptable hashing time per login")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    report = run(args.target_ms, args.repeat)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
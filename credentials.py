@@ -0,0 +1,102 @@
+# database/credentials.py
+
+import base64
+import hashlib
+import hmac
+import os
+import mysql.connector
+
+# Cost settings for new hashes; run credential_benchmark.py to choose them for
+# the machine the app runs on. Stored hashes made with lower settings are
+# upgraded the next time their owner logs in.
+SCRYPT_N = 2 ** 15   # CPU/memory cost (power of two); memory used is 128 * N * r bytes
+SCRYPT_R = 8
+SCRYPT_P = 1
+PBKDF2_ITERATIONS = 600000  # Used when the OpenSSL build lacks scrypt
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+HAS_SCRYPT = hasattr(hashlib, "scrypt")
+
+
+def _b64(data):
+    return base64.b64encode(data).decode("ascii")
+
+
+def _scrypt(password, salt, n, r, p):
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, dklen=KEY_BYTES,
+                          maxmem=128 * n * r * p + 1024 * 1024)
+
+
+def hash_password(password, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, iterations=PBKDF2_ITERATIONS):
+    """Salted KDF hash as a self-describing string, e.g. "scrypt$32768$8$1$<salt>$<key>"."""
+    salt = os.urandom(SALT_BYTES)
+    if HAS_SCRYPT:
+        return f"scrypt${n}${r}${p}${_b64(salt)}${_b64(_scrypt(password, salt, n, r, p))}"
+    key = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations, KEY_BYTES)
+    return f"pbkdf2_sha256${iterations}${_b64(salt)}${_b64(key)}"
+
+
+def verify_password(password, stored):
+    """Check `password` against a stored hash; legacy unsalted SHA-256 hex digests are accepted."""
+    if not stored:
+        return False
+    parts = stored.split("$")
+    if parts[0] == "scrypt" and len(parts) == 6:
+        n, r, p = int(parts[1]), int(parts[2]), int(parts[3])
+        key = _scrypt(password, base64.b64decode(parts[4]), n, r, p)
+        return hmac.compare_digest(key, base64.b64decode(parts[5]))
+    if parts[0] == "pbkdf2_sha256" and len(parts) == 4:
+        key = hashlib.pbkdf2_hmac("sha256", password.encode(), base64.b64decode(parts[2]), int(parts[1]),
+                                  KEY_BYTES)
+        return hmac.compare_digest(key, base64.b64decode(parts[3]))
+    if len(stored) == 64:
+        return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored.lower())
+    return False
+
+
+def needs_rehash(stored):
+    """True when `stored` uses an older scheme or a lower cost than new hashes would."""
+    parts = stored.split("$")
+    if HAS_SCRYPT:
+        return not (parts[0] == "scrypt" and len(parts) == 6
+                    and (int(parts[1]), int(parts[2]), int(parts[3])) >= (SCRYPT_N, SCRYPT_R, SCRYPT_P))
+    return not (parts[0] == "pbkdf2_sha256" and len(parts) == 4 and int(parts[1]) >= PBKDF2_ITERATIONS)
+
+
+_dummy_hash = None
+
+
+def authenticate(db, username, password):
+    """Verify a login through `db`, upgrading an outdated stored hash on success.
+
+    Unknown usernames still cost one hash, so response time does not reveal
+    which usernames exist. A failed upgrade is logged and retried at the next
+    login; it never fails the login itself. Meant to run on a worker thread.
+    """
+    global _dummy_hash
+    stored = db.get_password_hash(username)
+    if stored is None:
+        if _dummy_hash is None:
+            _dummy_hash = hash_password("")
+        verify_password(password, _dummy_hash)
+        return False
+    if not verify_password(password, stored):
+        return False
+    if needs_rehash(stored):
+        try:
+            db.set_password_hash(username, hash_password(password))
+            print(f"🔐 Upgraded password hash for {username}")
+        except (mysql.connector.Error, ValueError) as e:
+            print(f"⚠️ Could not upgrade password hash for {username}: {e}")
+    return True
+
+
+def register(db, username, password):
+    """Create a user; returns False if the username is taken."""
+    return db.add_user(username, hash_password(password))
+
+
+def reset_password(db, username, password):
+    """Set a new password; returns False if the user does not exist."""
+    return db.set_password_hash(username, hash_password(password))
@@ -1,19 +1,36 @@
 import sys
-from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout
+import importlib
+from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QMessageBox
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
-from ui.client_management import ClientManagementScreen
-from ui.track_progress import TrackProgressUI
-from ui.reports import ReportsWindow
-from ui.charts import ChartsWindow
-from ui.reminders import RemindersWindow
-from ui.activity_tracking import ActivityTrackingWindow
+from ui.reminder_scheduler import get_scheduler
+
+# Feature screens, imported only when first opened: button -> (module, class)
+SCREENS = {
+    "Client Management": ("ui.client_management", "ClientManagementScreen"),
+    "Track Progress": ("ui.track_progress", "TrackProgressUI"),
+    "Reports": ("ui.reports", "ReportsWindow"),
+    "View Charts": ("ui.charts", "ChartsWindow"),
+    "Set Reminders": ("ui.reminders", "RemindersWindow"),
+    "Activity Tracker": ("ui.activity_tracking", "ActivityTrackingWindow"),
+}
+
+
+def load_screen_class(name):
+    """Import the module behind a dashboard button and return its window class."""
+    module_name, class_name = SCREENS[name]
+    return getattr(importlib.import_module(module_name), class_name)
 
 class DashboardScreen(QWidget):
     def __init__(self):
         super().__init__()
+        self.windows = {}
         self.init_ui()
 
+        self.scheduler = get_scheduler()
+        self.scheduler.reminder_due.connect(self.show_due_reminder)
+        self.scheduler.start()
+
     def init_ui(self):
         self.setWindowTitle("Fitness Tracker Dashboard")
         self.setGeometry(100, 100, 1024, 600)
@@ -57,42 +74,25 @@ class DashboardScreen(QWidget):
 
         self.setLayout(main_layout)
 
-        self.buttons["Client Management"].clicked.connect(self.open_client_management)
-        self.buttons["Track Progress"].clicked.connect(self.open_track_progress)
-        self.buttons["Reports"].clicked.connect(self.open_reports)
-        self.buttons["View Charts"].clicked.connect(self.open_charts)
-        self.buttons["Set Reminders"].clicked.connect(self.open_reminders)
-        self.buttons["Activity Tracker"].clicked.connect(self.open_activity_tracker)
+        for name in SCREENS:
+            self.buttons[name].clicked.connect(lambda checked=False, name=name: self.open_screen(name))
         self.buttons["Logout"].clicked.connect(self.logout)
 
-    def open_client_management(self):
-        self.client_management_window = ClientManagementScreen()
-        self.client_management_window.show()
-
-    def open_track_progress(self):
+    def open_screen(self, name):
+        """Open a feature screen, importing its module on first use."""
         try:
-            self.track_progress_window = TrackProgressUI()
-            self.track_progress_window.show()
+            self.windows[name] = load_screen_class(name)()
+            self.windows[name].show()
         except Exception as e:
-            print(f"Error opening Track Progress: {e}")
-
-    def open_reports(self):
-        self.reports_window = ReportsWindow()
-        self.reports_window.show()
-
-    def open_charts(self):
-        self.charts_window = ChartsWindow()
-        self.charts_window.show()
-
-    def open_reminders(self):
-        self.reminders_window = RemindersWindow()
-        self.reminders_window.show()
+            print(f"Error opening {name}: {e}")
 
-    def open_activity_tracker(self):
-        self.activity_window = ActivityTrackingWindow()
-        self.activity_window.show()
+    def show_due_reminder(self, reminder):
+        QMessageBox.information(self, "⏰ Reminder",
+                                f"Client {reminder['client_id']}: {reminder['message']} ({reminder['reminder_date']})")
 
     def logout(self):
+        self.scheduler.reminder_due.disconnect(self.show_due_reminder)
+        self.scheduler.stop()
         from ui.login import LoginScreen
         self.login_screen = LoginScreen()
         self.login_screen.show()
@@ -1,16 +1,92 @@
 # database/database.py
 
+import contextlib
+import itertools
+from datetime import date, timedelta
 import mysql.connector
+import numpy as np
+from database.db_config import get_db_connection
+from database.migrations import ensure_schema
+from database.progress_cache import ProgressSeries, progress_cache
+from database.progress_store import open_store
+
+REMINDER_PAGE_SIZE = 200
+BULK_CHUNK_SIZE = 500  # Rows per executemany() batch
+STREAM_BATCH_SIZE = 500  # Rows per fetchmany() round trip for the streaming readers
+
+# Activity rollup granularity -> table; every table is keyed by (client_id, period_start)
+ROLLUP_TABLES = {
+    "day": "activity_rollup_daily",
+    "week": "activity_rollup_weekly",   # Weeks start on Monday
+    "month": "activity_rollup_monthly",
+}
+
+# Report summary granularity -> SQL bucket number for a date column. Months are
+# counted from year 0; seasons are meteorological, so December opens the winter
+# that runs into the next year's January and February.
+SUMMARY_BUCKETS = {
+    "month": "YEAR({col}) * 12 + MONTH({col}) - 1",
+    "season": "FLOOR((YEAR({col}) * 12 + MONTH({col})) / 3)",
+}
+SEASONS = {12: "Winter", 3: "Spring", 6: "Summer", 9: "Autumn"}
+
+
+def summary_label(bucket, period):
+    """Human label for a SUMMARY_BUCKETS bucket, e.g. "2026-09" or "Winter 2025/26"."""
+    months = bucket if period == "month" else bucket * 3 - 1
+    year, month = divmod(months, 12)
+    month += 1
+    if period == "month":
+        return f"{year}-{month:02d}"
+    if month == 12:
+        return f"Winter {year}/{(year + 1) % 100:02d}"
+    return f"{SEASONS[month]} {year}"
+
+
+def _float32_values(values):
+    """Single-precision weights as the short decimals MySQL prints for its FLOAT columns."""
+    return [float(np.format_float_positional(value, unique=True)) for value in values]
+
+
+def _store_summary_rows(days, weights, period, start_date=None, end_date=None):
+    """get_progress_summary()'s weight query, computed from a client's columnar store arrays.
+
+    Buckets are numbered as in SUMMARY_BUCKETS; `days` must be sorted.
+    """
+    low = np.searchsorted(days, np.datetime64(start_date, "D").astype(np.int64)) if start_date else 0
+    high = (np.searchsorted(days, np.datetime64(end_date, "D").astype(np.int64), side="right")
+            if end_date else len(days))
+    days, weights = days[low:high], weights[low:high]
+    if not len(days):
+        return []
+    months = days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64) + 1970 * 12
+    buckets = months if period == "month" else (months + 1) // 3
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(days)] - 1
+    counts = ends - starts + 1
+    means = np.add.reduceat(weights.astype(np.float64), starts) / counts
+    return list(zip(buckets[starts].tolist(), counts.tolist(),
+                    days[starts].astype("datetime64[D]").tolist(), days[ends].astype("datetime64[D]").tolist(),
+                    _float32_values(weights[starts]), _float32_values(weights[ends]),
+                    _float32_values(np.minimum.reduceat(weights, starts)),
+                    _float32_values(np.maximum.reduceat(weights, starts)), means.tolist()))
+
+def period_start(day, period):
+    """First day of the rollup period that contains `day`."""
+    if isinstance(day, str):
+        day = date.fromisoformat(day)
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    return day
 
 class Database:
     def __init__(self):
         try:
-            self.conn = mysql.connector.connect(
-                host="localhost",   # Change if needed
-                user="root",        # Change if needed
-                password="Welcome@123456",  # Change if needed
-                database="fitness_tracker"  # Ensure this database exists!
-            )
+            self.conn = get_db_connection()  # Borrowed from the shared pool
+            if self.conn is None:
+                raise mysql.connector.Error("No connection available from the pool")
             self.cursor = self.conn.cursor()
             self.create_tables()
             print("✅ Database Connected Successfully")
@@ -19,32 +95,20 @@ class Database:
             print(f"❌ Database Connection Failed: {e}")
             self.conn = None
 
+    def close(self):
+        """Return the connection to the shared pool."""
+        if self.conn is not None:
+            self.cursor.close()
+            self.conn.close()
+            self.conn = None
+
     def create_tables(self):
-        """Create necessary tables if they do not exist."""
+        """Bring the schema up to date (migrations run at most once per process)."""
         if self.conn is None:
             print("⚠️ No database connection.")
             return
 
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS clients (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                name VARCHAR(255),
-                age INT,
-                weight FLOAT,
-                goal TEXT
-            )
-        """)
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS reminders (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                client_id INT,
-                reminder_date DATE,
-                message TEXT,
-                status VARCHAR(50),
-                FOREIGN KEY (client_id) REFERENCES clients(id) ON DELETE CASCADE
-            )
-        """)
-        self.conn.commit()
+        ensure_schema(self.conn)
 
     def get_reminders(self):
         """Fetch all reminders."""
@@ -54,6 +118,39 @@ class Database:
         return [{"client_id": row[0], "reminder_date": row[1], "message": row[2], "status": row[3]}
                 for row in self.cursor.fetchall()]
 
+    def get_reminders_page(self, after=None, limit=REMINDER_PAGE_SIZE, status=None,
+                           start_date=None, end_date=None):
+        """Fetch one page of reminders ordered by (reminder_date, id).
+
+        Pass the (reminder_date, id) of the last row of the previous page as
+        `after` to get the next one; an empty page means there are no more.
+        Reminders without a date sort first, as MySQL orders NULLs.
+        """
+        if self.conn is None:
+            return []
+        query = "SELECT id, client_id, reminder_date, message, status FROM reminders WHERE 1 = 1"
+        params = []
+        if status:
+            query += " AND status = %s"
+            params.append(status)
+        if start_date:
+            query += " AND reminder_date >= %s"
+            params.append(start_date)
+        if end_date:
+            query += " AND reminder_date <= %s"
+            params.append(end_date)
+        if after is not None and after[0] is None:
+            query += " AND (reminder_date IS NOT NULL OR id > %s)"
+            params.append(after[1])
+        elif after is not None:
+            query += " AND (reminder_date > %s OR (reminder_date = %s AND id > %s))"  # Undated rows came first
+            params.extend([after[0], after[0], after[1]])
+        query += " ORDER BY reminder_date, id LIMIT %s"
+        params.append(limit)
+        self.cursor.execute(query, params)
+        return [{"id": row[0], "client_id": row[1], "reminder_date": row[2], "message": row[3], "status": row[4]}
+                for row in self.cursor.fetchall()]
+
     def save_reminder(self, client_id, reminder_date, message, status):
         """Save a new reminder."""
         if self.conn is None:
@@ -63,11 +160,533 @@ class Database:
             (client_id, reminder_date, message, status)
         )
         self.conn.commit()
+        return self.cursor.lastrowid
 
-    def delete_reminder(self, client_id, reminder_date):
-        """Delete a reminder."""
+    def save_reminders_bulk(self, reminders, chunk_size=BULK_CHUNK_SIZE):
+        """Insert many reminders in one transaction; returns how many were saved.
+
+        `reminders` may be any iterable (e.g. a generator streaming a file) of
+        (client_id, reminder_date, message, status) tuples; it is consumed in
+        batches of `chunk_size` rows, each sent with a single executemany().
+        """
         if self.conn is None:
-            return
-        self.cursor.execute("DELETE FROM reminders WHERE client_id = %s AND reminder_date = %s",
-                            (client_id, reminder_date))
+            return 0
+        rows = iter(reminders)
+        saved = 0
+        try:
+            while True:
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    break
+                self.cursor.executemany(
+                    "INSERT INTO reminders (client_id, reminder_date, message, status) VALUES (%s, %s, %s, %s)",
+                    chunk
+                )
+                saved += len(chunk)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return saved
+
+    def get_pending_reminders(self, start_date, end_date, unnotified_only=False):
+        """Fetch pending reminders due between two dates (inclusive).
+
+        With `unnotified_only`, reminders whose notification was already shown
+        are left out.
+        """
+        if self.conn is None:
+            return []
+        self.cursor.execute(
+            "SELECT id, client_id, reminder_date, message, status FROM reminders "
+            "WHERE status = 'Pending' AND reminder_date BETWEEN %s AND %s"
+            + (" AND notified_at IS NULL" if unnotified_only else "") + " ORDER BY reminder_date, id",
+            (start_date, end_date)
+        )
+        return [{"id": row[0], "client_id": row[1], "reminder_date": row[2], "message": row[3], "status": row[4]}
+                for row in self.cursor.fetchall()]
+
+    def mark_overdue_reminders(self, today):
+        """Flag every pending reminder dated before `today` as Overdue, shown or not; returns how many changed."""
+        if self.conn is None:
+            return 0
+        self.cursor.execute(
+            "UPDATE reminders SET status = 'Overdue' WHERE status = 'Pending' AND reminder_date < %s",
+            (today,)
+        )
         self.conn.commit()
+        return self.cursor.rowcount
+
+    def mark_reminders_notified(self, reminder_ids):
+        """Stamp these reminders as shown and return the ids this call stamped.
+
+        Ids another process (or an earlier call) already stamped are left out,
+        so only one app instance shows each notification. The rows are locked
+        between reading and stamping them.
+        """
+        if self.conn is None or not reminder_ids:
+            return []
+        placeholders = ", ".join(["%s"] * len(reminder_ids))
+        try:
+            self.cursor.execute(
+                f"SELECT id FROM reminders WHERE id IN ({placeholders}) AND notified_at IS NULL FOR UPDATE",
+                list(reminder_ids)
+            )
+            stamped = [row[0] for row in self.cursor.fetchall()]
+            if stamped:
+                placeholders = ", ".join(["%s"] * len(stamped))
+                self.cursor.execute(f"UPDATE reminders SET notified_at = NOW() WHERE id IN ({placeholders})", stamped)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return stamped
+
+    def delete_reminder(self, reminder_id):
+        """Delete a reminder; returns False if it was already gone."""
+        if self.conn is None:
+            return False
+        self.cursor.execute("DELETE FROM reminders WHERE id = %s", (reminder_id,))
+        self.conn.commit()
+        return self.cursor.rowcount > 0
+
+    def get_password_hash(self, username):
+        """Fetch a user's stored password hash, or None if there is no such user."""
+        if self.conn is None:
+            return None
+        self.cursor.execute("SELECT password FROM users WHERE username = %s", (username,))
+        row = self.cursor.fetchone()
+        return row[0] if row else None
+
+    def add_user(self, username, password_hash):
+        """Create a user; returns False if the username is already taken."""
+        if self.conn is None:
+            return False
+        try:
+            self.cursor.execute("INSERT INTO users (username, password) VALUES (%s, %s)", (username, password_hash))
+        except mysql.connector.IntegrityError:
+            self.conn.rollback()
+            return False
+        self.conn.commit()
+        return True
+
+    def set_password_hash(self, username, password_hash):
+        """Replace a user's password hash; returns False if the user does not exist."""
+        if self.conn is None:
+            return False
+        self.cursor.execute("UPDATE users SET password = %s WHERE username = %s", (password_hash, username))
+        self.conn.commit()
+        return self.cursor.rowcount > 0
+
+    def get_all_clients(self):
+        """Fetch every client."""
+        if self.conn is None:
+            return []
+        self.cursor.execute("SELECT id, name, age, weight, goal FROM clients ORDER BY id")
+        return [{"id": row[0], "name": row[1], "age": row[2], "weight": row[3], "goal": row[4]}
+                for row in self.cursor.fetchall()]
+
+    def get_client_name(self, client_id):
+        """Fetch a client's name."""
+        if self.conn is None:
+            return ""
+        self.cursor.execute("SELECT name FROM clients WHERE id = %s", (client_id,))
+        row = self.cursor.fetchone()
+        return row[0] if row else ""
+
+    def get_client_weight(self, client_id):
+        """The client's weight in kg from their record, else their latest weigh-in; None if neither exists."""
+        if self.conn is None:
+            return None
+        self.cursor.execute(
+            "SELECT COALESCE(c.weight, (SELECT p.weight FROM progress p WHERE p.client_id = c.id "
+            "AND p.weight IS NOT NULL ORDER BY p.date DESC LIMIT 1)) FROM clients c WHERE c.id = %s",
+            (client_id,)
+        )
+        row = self.cursor.fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _progress_filter(client_id, start_date, end_date):
+        where = "WHERE client_id = %s"
+        params = [client_id]
+        if start_date:
+            where += " AND date >= %s"
+            params.append(start_date)
+        if end_date:
+            where += " AND date <= %s"
+            params.append(end_date)
+        return where, params
+
+    def get_progress(self, client_id, start_date=None, end_date=None):
+        """Fetch a client's progress entries, oldest first, optionally within a date range."""
+        if self.conn is None:
+            return []
+        where, params = self._progress_filter(client_id, start_date, end_date)
+        self.cursor.execute(f"SELECT date, weight, notes FROM progress {where} ORDER BY date", params)
+        return [{"date": row[0].strftime("%Y-%m-%d"), "weight": row[1], "notes": row[2] or ""}
+                for row in self.cursor.fetchall()]
+
+    def get_progress_summary(self, client_id, period="month", start_date=None, end_date=None):
+        """Per-month or per-season weight statistics and activity totals.
+
+        Returns one dict per period with entries, start/end/min/max/mean weight,
+        change (end - start) and the period's activity minutes, calories and
+        sessions from the monthly rollup. Weights are aggregated from the
+        columnar progress store when one has been built, otherwise in SQL.
+        """
+        if self.conn is None:
+            return []
+        store = open_store()
+        if store is not None:
+            rows = _store_summary_rows(*store.read(client_id), period, start_date, end_date)
+        else:
+            where, params = self._progress_filter(client_id, start_date, end_date)
+            bucket = SUMMARY_BUCKETS[period].format(col="date")
+            self.cursor.execute(
+                "SELECT bucket, COUNT(*), MIN(date), MAX(date), MAX(first_weight), MAX(last_weight), "
+                "MIN(weight), MAX(weight), AVG(weight) FROM ("
+                f"SELECT date, weight, {bucket} AS bucket, "
+                f"FIRST_VALUE(weight) OVER (PARTITION BY {bucket} ORDER BY date) AS first_weight, "
+                f"FIRST_VALUE(weight) OVER (PARTITION BY {bucket} ORDER BY date DESC) AS last_weight "
+                f"FROM progress {where} AND weight IS NOT NULL"
+                ") AS entries GROUP BY bucket ORDER BY bucket",
+                params
+            )
+            rows = self.cursor.fetchall()
+        summary = {}
+        for row in rows:
+            bucket_id, entries, first_date, last_date, start_weight, end_weight, low, high, mean = row
+            summary[int(bucket_id)] = {
+                "period": summary_label(int(bucket_id), period),
+                "first_date": first_date, "last_date": last_date, "entries": entries,
+                "start_weight": start_weight, "end_weight": end_weight,
+                "min_weight": low, "max_weight": high, "mean_weight": round(float(mean), 1),
+                "change": round(end_weight - start_weight, 1),
+                "minutes": 0, "calories": 0.0, "sessions": 0,
+            }
+
+        # Activity comes from the monthly rollup, which months and seasons both group cleanly
+        query = (f"SELECT {SUMMARY_BUCKETS[period].format(col='period_start')} AS bucket, "
+                 "SUM(minutes), SUM(calories), SUM(sessions) FROM activity_rollup_monthly WHERE client_id = %s")
+        params = [client_id]
+        if start_date:
+            query += " AND period_start >= %s"
+            params.append(period_start(start_date, "month"))
+        if end_date:
+            query += " AND period_start <= %s"
+            params.append(end_date)
+        self.cursor.execute(query + " GROUP BY bucket", params)
+        for bucket_id, minutes, burned, sessions in self.cursor.fetchall():
+            entry = summary.setdefault(int(bucket_id), {
+                "period": summary_label(int(bucket_id), period),
+                "first_date": None, "last_date": None, "entries": 0,
+                "start_weight": None, "end_weight": None, "min_weight": None, "max_weight": None,
+                "mean_weight": None, "change": None,
+            })
+            entry.update(minutes=int(minutes or 0), calories=round(float(burned or 0), 1), sessions=int(sessions or 0))
+        return [summary[bucket_id] for bucket_id in sorted(summary)]
+
+    def count_progress(self, client_id, start_date=None, end_date=None):
+        """Number of progress entries get_progress() would return."""
+        if self.conn is None:
+            return 0
+        where, params = self._progress_filter(client_id, start_date, end_date)
+        self.cursor.execute(f"SELECT COUNT(*) FROM progress {where}", params)
+        return self.cursor.fetchone()[0]
+
+    def iter_progress(self, client_id, start_date=None, end_date=None, batch_size=STREAM_BATCH_SIZE):
+        """Yield batches of (date, weight, notes) progress rows from an unbuffered cursor.
+
+        Rows stay on the server until fetched, so memory is bounded by one batch
+        however long the range is. The connection cannot run other queries until
+        the generator is exhausted or closed.
+        """
+        if self.conn is None:
+            return
+        where, params = self._progress_filter(client_id, start_date, end_date)
+        cursor = self.conn.cursor(buffered=False)
+        try:
+            cursor.execute(f"SELECT date, weight, notes FROM progress {where} ORDER BY date", params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            self.conn.consume_results()  # Discard whatever an early exit left unread
+            cursor.close()
+
+    def iter_all_progress(self, batch_size=STREAM_BATCH_SIZE):
+        """Yield batches of (client_id, days since 1970-01-01, weight) for every weighed entry.
+
+        Ordered by client then date and streamed like iter_progress().
+        """
+        if self.conn is None:
+            return
+        cursor = self.conn.cursor(buffered=False)
+        try:
+            cursor.execute("SELECT client_id, DATEDIFF(date, '1970-01-01'), weight FROM progress "
+                           "WHERE weight IS NOT NULL ORDER BY client_id, date")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            self.conn.consume_results()
+            cursor.close()
+
+    def get_progress_series(self, client_id):
+        """A client's weighed entries as a ProgressSeries, from the columnar store when one has been built."""
+        store = open_store()
+        if store is not None:
+            return store.series(client_id)
+        return ProgressSeries.from_rows(self.get_progress(client_id))
+
+    def add_progress(self, client_id, date, weight, notes):
+        """Save a progress entry and append it to the columnar store, if one has been built.
+
+        The store's write lock is held across the insert, so a rebuild running
+        in another process either includes the entry or finishes before it is
+        inserted; the entry is never lost from the store or stored twice.
+        """
+        if self.conn is None:
+            return
+        store = open_store()
+        with store.locked() if store is not None else contextlib.nullcontext():
+            self.cursor.execute(
+                "INSERT INTO progress (client_id, date, weight, notes) VALUES (%s, %s, %s, %s)",
+                (client_id, date, weight, notes)
+            )
+            self.conn.commit()
+            if store is not None and weight is not None:
+                try:
+                    store.append(client_id, np.array([date], dtype="datetime64[D]"), [weight])
+                except OSError as e:
+                    print(f"⚠️ Progress store not updated, rebuild it with 'cli.py progress build-store': {e}")
+        progress_cache.invalidate(client_id)
+
+    def get_activity_list(self):
+        """Fetch the activity catalog as {name: MET value}."""
+        if self.conn is None:
+            return {}
+        self.cursor.execute("SELECT name, met FROM activities ORDER BY name")
+        return {row[0]: row[1] or 0.0 for row in self.cursor.fetchall()}
+
+    def get_catalog_version(self, name="activities"):
+        """Fetch the version counter that is bumped whenever a catalog changes."""
+        if self.conn is None:
+            return None
+        self.cursor.execute("SELECT version FROM catalog_version WHERE name = %s", (name,))
+        row = self.cursor.fetchone()
+        return row[0] if row else 0
+
+    def _bump_catalog_version(self, name):
+        self.cursor.execute("UPDATE catalog_version SET version = version + 1 WHERE name = %s", (name,))
+
+    def save_activity(self, name, met):
+        """Add or correct an activity's MET value."""
+        if self.conn is None:
+            return
+        try:
+            self.cursor.execute(
+                "INSERT INTO activities (name, met, calories_per_minute) VALUES (%s, %s, %s) "
+                "ON DUPLICATE KEY UPDATE met = VALUES(met), calories_per_minute = VALUES(calories_per_minute)",
+                (name, met, met * 70 / 60)  # Legacy per-minute figure at the 70 kg reference weight
+            )
+            self._bump_catalog_version("activities")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def delete_activity(self, name):
+        """Remove an activity from the catalog."""
+        if self.conn is None:
+            return
+        try:
+            self.cursor.execute("DELETE FROM activities WHERE name = %s", (name,))
+            self._bump_catalog_version("activities")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def log_activity(self, client_id, activity, duration, calories):
+        """Record an activity for today."""
+        if self.conn is None:
+            return
+        today = date.today()
+        try:
+            self.cursor.execute(
+                "INSERT INTO activity_log (client_id, activity, duration, calories_burned, log_date) "
+                "VALUES (%s, %s, %s, %s, %s)",
+                (client_id, activity, duration, calories, today)
+            )
+            self._add_to_rollups([(client_id, today, duration, calories)])
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def log_activities_bulk(self, rows):
+        """Insert many activity rows with one commit (group commit).
+
+        Each row is (entry_id, client_id, activity, duration, calories, log_date).
+        Rows whose entry_id is already stored are skipped, so replaying a batch
+        after a crash cannot double-count the log or the rollups.
+        """
+        if self.conn is None or not rows:
+            return 0
+        try:
+            placeholders = ", ".join(["%s"] * len(rows))
+            self.cursor.execute(
+                f"SELECT entry_id FROM activity_log WHERE entry_id IN ({placeholders}) FOR UPDATE",
+                [row[0] for row in rows]
+            )
+            stored = {row[0] for row in self.cursor.fetchall()}
+            rows = [row for row in rows if row[0] not in stored]
+            if rows:
+                self.cursor.executemany(
+                    "INSERT INTO activity_log (entry_id, client_id, activity, duration, calories_burned, log_date) "
+                    "VALUES (%s, %s, %s, %s, %s, %s)",
+                    rows
+                )
+                self._add_to_rollups([(row[1], row[5], row[3], row[4]) for row in rows])
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return len(rows)
+
+    def _add_to_rollups(self, rows):
+        """Fold (client_id, log_date, minutes, calories) rows into the rollup tables.
+
+        Runs inside the caller's transaction so the log and its rollups commit together.
+        """
+        for period, table in ROLLUP_TABLES.items():
+            totals = {}
+            for client_id, log_date, minutes, calories in rows:
+                key = (client_id, period_start(log_date, period))
+                total = totals.setdefault(key, [0, 0.0, 0])
+                total[0] += minutes
+                total[1] += calories
+                total[2] += 1
+            self.cursor.executemany(
+                f"INSERT INTO {table} (client_id, period_start, minutes, calories, sessions) "
+                "VALUES (%s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE "
+                "minutes = minutes + VALUES(minutes), calories = calories + VALUES(calories), "
+                "sessions = sessions + VALUES(sessions)",
+                [(client_id, start, *total) for (client_id, start), total in totals.items()]
+            )
+
+    def rebuild_activity_rollups(self):
+        """Recompute every rollup from activity_log (backfill or after bulk corrections)."""
+        if self.conn is None:
+            return
+        starts = {
+            "day": "log_date",
+            "week": "DATE_SUB(log_date, INTERVAL WEEKDAY(log_date) DAY)",
+            "month": "DATE_SUB(log_date, INTERVAL DAYOFMONTH(log_date) - 1 DAY)",
+        }
+        try:
+            for period, table in ROLLUP_TABLES.items():
+                self.cursor.execute(f"DELETE FROM {table}")
+                self.cursor.execute(
+                    f"INSERT INTO {table} (client_id, period_start, minutes, calories, sessions) "
+                    f"SELECT client_id, {starts[period]} AS period_start, SUM(duration), SUM(calories_burned), COUNT(*) "
+                    "FROM activity_log GROUP BY client_id, period_start"
+                )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def get_activity_totals(self, client_id, period="day", start_date=None, end_date=None):
+        """Per-period minutes, calories and session counts for a client, read from the rollups."""
+        if self.conn is None:
+            return []
+        query = (f"SELECT period_start, minutes, calories, sessions FROM {ROLLUP_TABLES[period]} "
+                 "WHERE client_id = %s")
+        params = [client_id]
+        if start_date:
+            query += " AND period_start >= %s"
+            params.append(period_start(start_date, period))
+        if end_date:
+            query += " AND period_start <= %s"
+            params.append(end_date)
+        self.cursor.execute(query + " ORDER BY period_start", params)
+        return [{"period_start": row[0], "minutes": row[1], "calories": row[2], "sessions": row[3]}
+                for row in self.cursor.fetchall()]
+
+    def get_active_client_ids(self, start_date, end_date):
+        """IDs of clients with progress entries or logged activity between the two dates."""
+        if self.conn is None:
+            return []
+        self.cursor.execute(
+            "SELECT client_id FROM progress WHERE date BETWEEN %s AND %s "
+            "UNION SELECT client_id FROM activity_rollup_monthly WHERE period_start BETWEEN %s AND %s "
+            "ORDER BY client_id",
+            (start_date, end_date, period_start(start_date, "month"), end_date)
+        )
+        return [row[0] for row in self.cursor.fetchall()]
+
+    def get_chart_fingerprints(self):
+        """Per-client summary of name, progress and daily activity rollups that changes whenever any does."""
+        if self.conn is None:
+            return {}
+        self.cursor.execute(
+            "SELECT c.id, c.name, p.entries, p.last_id, p.last_date, p.weight_sum, "
+            "r.days, r.last_day, r.minutes, r.calories FROM clients c "
+            "LEFT JOIN (SELECT client_id, COUNT(*) AS entries, MAX(id) AS last_id, MAX(date) AS last_date, "
+            "SUM(weight) AS weight_sum FROM progress GROUP BY client_id) p ON p.client_id = c.id "
+            "LEFT JOIN (SELECT client_id, COUNT(*) AS days, MAX(period_start) AS last_day, "
+            "SUM(minutes) AS minutes, SUM(calories) AS calories FROM activity_rollup_daily "
+            "GROUP BY client_id) r ON r.client_id = c.id"
+        )
+        return {row[0]: "|".join(str(value) for value in row[1:]) for row in self.cursor.fetchall()}
+
+    def get_activity_rows(self, after_id, limit):
+        """Fetch (id, activity, duration, client weight) for logged activities after `after_id`."""
+        if self.conn is None:
+            return []
+        self.cursor.execute(
+            "SELECT a.id, a.activity, a.duration, c.weight FROM activity_log a "
+            "LEFT JOIN clients c ON c.id = a.client_id WHERE a.id > %s ORDER BY a.id LIMIT %s",
+            (after_id, limit)
+        )
+        return self.cursor.fetchall()
+
+    def update_activity_calories(self, pairs):
+        """Set calories_burned from (calories, id) pairs in one transaction.
+
+        The pairs go into a per-connection temporary table with one multi-row
+        INSERT and are applied with a single UPDATE ... JOIN, so a chunk costs
+        four round trips however many rows it holds.
+        """
+        if self.conn is None or not pairs:
+            return
+        try:
+            self.cursor.execute("CREATE TEMPORARY TABLE IF NOT EXISTS activity_calories_update "
+                                "(id INT PRIMARY KEY, calories FLOAT NOT NULL)")
+            self.cursor.execute("DELETE FROM activity_calories_update")
+            self.cursor.executemany("INSERT INTO activity_calories_update (calories, id) VALUES (%s, %s)", pairs)
+            self.cursor.execute("UPDATE activity_log a JOIN activity_calories_update u ON u.id = a.id "
+                                "SET a.calories_burned = u.calories")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def get_today_activity_log(self, client_id):
+        """Fetch today's activities for a client."""
+        if self.conn is None:
+            return []
+        self.cursor.execute(
+            "SELECT activity, duration, calories_burned, entry_id FROM activity_log "
+            "WHERE client_id = %s AND log_date = CURDATE() ORDER BY id",
+            (client_id,)
+        )
+        return [{"activity": row[0], "duration": row[1], "calories_burned": row[2], "entry_id": row[3]}
+                for row in self.cursor.fetchall()]
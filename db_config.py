@@ -1,17 +1,182 @@
 # database/db_config.py
 
+import queue
+import threading
+import time
 import mysql.connector
 
-def get_db_connection():
-    """Establish a connection to the MySQL database."""
-    try:
-        conn = mysql.connector.connect(
-            host="localhost",    # Change to your database host if needed
-            user="root",         # Change to your MySQL username
-            password="Welcome@123456",  # Change to your MySQL password
-            database="fitness_tracker"  # Ensure this database exists in MySQL
-        )
+DB_CONFIG = {
+    "host": "localhost",    # Change to your database host if needed
+    "user": "root",         # Change to your MySQL username
+    "password": "Welcome@123456",  # Change to your MySQL password
+    "database": "fitness_tracker"  # Ensure this database exists in MySQL
+}
+
+POOL_SIZE = 8          # Maximum number of open connections shared by the app
+POOL_TIMEOUT = 10.0    # Seconds to wait for a free connection before giving up
+
+
+class PooledConnection:
+    """Wraps a MySQL connection so that close() hands it back to the pool."""
+
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+
+    def close(self):
+        """Return the connection to the pool instead of closing it."""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool.release(conn)
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise mysql.connector.Error("Connection was already returned to the pool")
+        return getattr(self._conn, name)
+
+    def __del__(self):
+        # A wrapper dropped without close() must not leak its pool slot
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ConnectionPool:
+    """A bounded pool of MySQL connections with pre-ping and checkout stats."""
+
+    def __init__(self, size=POOL_SIZE, timeout=POOL_TIMEOUT, **config):
+        self.size = size
+        self.timeout = timeout
+        self.config = config or DB_CONFIG
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._stats = {
+            "checkouts": 0,
+            "timeouts": 0,
+            "connects": 0,
+            "reconnects": 0,
+            "in_use": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+        }
+
+    def acquire(self, timeout=None):
+        """Borrow a healthy connection, waiting at most `timeout` seconds."""
+        timeout = self.timeout if timeout is None else timeout
+        started = time.perf_counter()
+        if not self._slots.acquire(timeout=timeout):
+            with self._lock:
+                self._stats["timeouts"] += 1
+            raise mysql.connector.errors.PoolError(
+                f"No free database connection after {timeout:.1f}s (pool size {self.size})"
+            )
+
+        try:
+            conn = self._checkout()
+        except Exception:
+            self._slots.release()
+            raise
+
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._stats["checkouts"] += 1
+            self._stats["in_use"] += 1
+            self._stats["wait_total"] += waited
+            self._stats["wait_max"] = max(self._stats["wait_max"], waited)
+        return PooledConnection(self, conn)
+
+    def _checkout(self):
+        """Reuse an idle connection after pinging it, or open a new one."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                if not conn.is_connected():  # is_connected() pings the server
+                    conn.reconnect(attempts=1, delay=0)
+                    with self._lock:
+                        self._stats["reconnects"] += 1
+                return conn
+            except mysql.connector.Error:
+                self._discard(conn)
+
+        conn = mysql.connector.connect(**self.config)
+        with self._lock:
+            self._stats["connects"] += 1
         return conn
+
+    def release(self, conn):
+        """Give a borrowed connection back to the pool."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+        except mysql.connector.Error:
+            self._discard(conn)
+        finally:
+            with self._lock:
+                self._stats["in_use"] -= 1
+            self._slots.release()
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except mysql.connector.Error:
+            pass
+
+    def stats(self):
+        """Return a snapshot of pool usage and checkout wait times."""
+        with self._lock:
+            snapshot = dict(self._stats)
+        checkouts = snapshot["checkouts"]
+        snapshot["wait_avg"] = snapshot["wait_total"] / checkouts if checkouts else 0.0
+        snapshot["idle"] = self._idle.qsize()
+        snapshot["size"] = self.size
+        return snapshot
+
+    def close_all(self):
+        """Close every idle connection (borrowed ones close when released)."""
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def configure_pool(size=POOL_SIZE, timeout=POOL_TIMEOUT, **config):
+    """Replace the shared pool, e.g. to change its size at startup."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+        _pool = ConnectionPool(size=size, timeout=timeout, **config)
+    return _pool
+
+
+def get_pool():
+    """Return the shared connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+
+def get_db_connection(timeout=None):
+    """Borrow a connection from the shared pool. Call close() to return it."""
+    try:
+        return get_pool().acquire(timeout)
     except mysql.connector.Error as e:
         print(f"Database connection error: {e}")
         return None
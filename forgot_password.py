@@ -1,18 +1,11 @@
 # ui/forgot_password.py
 
 import sys
-import mysql.connector
 from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QMessageBox
 from PyQt5.QtGui import QFont
+from database.async_db import AsyncDatabase
+from database.credentials import reset_password
 
-# Database connection function
-def get_db_connection():
-    return mysql.connector.connect(
-        host="localhost",
-        user="root",  # Change if needed
-        password="Welcome@123456",  # Change if needed
-        database="fitness_tracker"
-    )
 
 class ForgotPasswordScreen(QWidget):
     def __init__(self):
@@ -20,6 +13,7 @@ class ForgotPasswordScreen(QWidget):
         self.confirm_input = None
         self.new_password_input = None
         self.username_input = None
+        self.db = AsyncDatabase(self)  # ✅ Hashing runs on a worker thread
         self.init_ui()
 
     def init_ui(self):
@@ -49,10 +43,10 @@ class ForgotPasswordScreen(QWidget):
         self.confirm_input.setEchoMode(QLineEdit.Password)
 
         # Reset Button
-        reset_button = QPushButton("Reset Password")
-        reset_button.setFont(QFont("Arial", 12))
-        reset_button.setStyleSheet("background-color: #FF5722; color: white; padding: 10px;")
-        reset_button.clicked.connect(self.reset_password)
+        self.reset_button = QPushButton("Reset Password")
+        self.reset_button.setFont(QFont("Arial", 12))
+        self.reset_button.setStyleSheet("background-color: #FF5722; color: white; padding: 10px;")
+        self.reset_button.clicked.connect(self.reset_password)
 
         # Back to Login Button
         back_button = QPushButton("Back to Login")
@@ -69,7 +63,7 @@ class ForgotPasswordScreen(QWidget):
         layout.addWidget(self.new_password_input)
         layout.addWidget(confirm_label)
         layout.addWidget(self.confirm_input)
-        layout.addWidget(reset_button)
+        layout.addWidget(self.reset_button)
         layout.addWidget(back_button)
 
         self.setLayout(layout)
@@ -87,27 +81,24 @@ class ForgotPasswordScreen(QWidget):
             QMessageBox.warning(self, "Error", "Passwords do not match.")
             return
 
-        try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-
-            # Check if the user exists
-            cursor.execute("SELECT * FROM users WHERE username = %s", (username,))
-            user = cursor.fetchone()
-
+        def done(user):
+            self.reset_button.setEnabled(True)
             if not user:
                 QMessageBox.warning(self, "Error", "Username not found.")
             else:
-                # Update password with SHA-256 hash
-                cursor.execute("UPDATE users SET password = SHA2(%s, 256) WHERE username = %s", (new_password, username))
-                conn.commit()
                 QMessageBox.information(self, "Success", "Password reset successfully! You can now log in.")
                 self.close()
 
-            conn.close()
+        def failed(error):
+            self.reset_button.setEnabled(True)
+            QMessageBox.critical(self, "Database Error", f"An error occurred: {error}")
+
+        self.reset_button.setEnabled(False)
+        self.db.run(reset_password, username, new_password, on_result=done, on_error=failed)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"An error occurred: {str(e)}")
+    def closeEvent(self, event):
+        self.db.shutdown()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,11 +1,11 @@
 import sys
-import mysql.connector
 from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QMessageBox
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 from ui.signup import SignupScreen
 from ui.dashboard import DashboardScreen
-from database.db_config import get_db_connection
+from database.async_db import AsyncDatabase
+from database.credentials import authenticate
 
 class LoginScreen(QWidget):
     def __init__(self):
@@ -14,6 +14,7 @@ class LoginScreen(QWidget):
         self.username_input = None
         self.signup_window = None
         self.dashboard_window = None
+        self.db = AsyncDatabase(self)  # ✅ Password hashing is deliberately slow; keep it off the GUI thread
         self.init_ui()
 
     def init_ui(self):
@@ -36,10 +37,10 @@ class LoginScreen(QWidget):
         self.password_input.setEchoMode(QLineEdit.Password)
         self.password_input.setPlaceholderText("Enter your password")
 
-        login_button = QPushButton("Login")
-        login_button.setFont(QFont("Arial", 12))
-        login_button.setStyleSheet("background-color: #4CAF50; color: white;")
-        login_button.clicked.connect(self.login_user)
+        self.login_button = QPushButton("Login")
+        self.login_button.setFont(QFont("Arial", 12))
+        self.login_button.setStyleSheet("background-color: #4CAF50; color: white;")
+        self.login_button.clicked.connect(self.login_user)
 
         signup_button = QPushButton("Sign Up")
         signup_button.setFont(QFont("Arial", 12))
@@ -52,7 +53,7 @@ class LoginScreen(QWidget):
         layout.addWidget(self.username_input)
         layout.addWidget(password_label)
         layout.addWidget(self.password_input)
-        layout.addWidget(login_button)
+        layout.addWidget(self.login_button)
         layout.addWidget(signup_button)
 
         self.setLayout(layout)
@@ -65,29 +66,32 @@ class LoginScreen(QWidget):
             QMessageBox.warning(self, "Error", "All fields are required.")
             return
 
-        try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM users WHERE username = %s AND password = SHA2(%s, 256)", (username, password))
-            user = cursor.fetchone()
+        self.login_button.setEnabled(False)
+        self.db.run(authenticate, username, password,
+                    on_result=self.finish_login, on_error=self.login_failed)
 
-            if user:
-                QMessageBox.information(self, "Success", "Login successful! 🚀")
-                self.dashboard_window = DashboardScreen()
-                self.dashboard_window.show()
-                self.close()
-            else:
-                QMessageBox.warning(self, "Error", "Invalid username or password.")
+    def finish_login(self, user):
+        self.login_button.setEnabled(True)
+        if user:
+            QMessageBox.information(self, "Success", "Login successful! 🚀")
+            self.dashboard_window = DashboardScreen()
+            self.dashboard_window.show()
+            self.close()
+        else:
+            QMessageBox.warning(self, "Error", "Invalid username or password.")
 
-            conn.close()
-
-        except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"An error occurred: {str(e)}")
+    def login_failed(self, error):
+        self.login_button.setEnabled(True)
+        QMessageBox.critical(self, "Database Error", f"An error occurred: {error}")
 
     def open_signup(self):
         self.signup_window = SignupScreen()
         self.signup_window.show()
 
+    def closeEvent(self, event):
+        self.db.shutdown()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     login_window = LoginScreen()
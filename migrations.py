@@ -0,0 +1,274 @@
+# database/migrations.py
+
+import threading
+import mysql.connector
+
+
+class MigrationError(mysql.connector.Error):
+    """The existing data must be fixed by hand before the schema can be upgraded."""
+
+
+# MySQL has no IF NOT EXISTS for indexes or columns, and DDL commits as it goes,
+# so a migration that stopped half way must be able to run again. The helpers
+# below build steps that check information_schema first.
+def _exists(cursor, query, *params):
+    cursor.execute(query, params)
+    return cursor.fetchone()[0] > 0
+
+
+def _create_index(name, table, columns, unique=False):
+    def step(cursor):
+        if not _exists(cursor, """
+            SELECT COUNT(*) FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+        """, table, name):
+            kind = "UNIQUE INDEX" if unique else "INDEX"
+            cursor.execute(f"CREATE {kind} {name} ON {table} ({columns})")
+    return step
+
+
+def _add_column(table, column, definition):
+    def step(cursor):
+        if not _exists(cursor, """
+            SELECT COUNT(*) FROM information_schema.columns
+            WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s
+        """, table, column):
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    return step
+
+
+def _require_unique(table, column, hint):
+    """Stop with a readable error instead of MySQL's on the first duplicate a unique index would hit."""
+    def step(cursor):
+        cursor.execute(f"""
+            SELECT {column}, COUNT(*) FROM {table}
+            GROUP BY {column} HAVING COUNT(*) > 1 ORDER BY {column} LIMIT 10
+        """)
+        duplicates = cursor.fetchall()
+        if duplicates:
+            listed = ", ".join(f"{value!r} ({count}x)" for value, count in duplicates)
+            raise MigrationError(f"{table}.{column} has duplicate values: {listed}. {hint}")
+    return step
+
+
+# Ordered schema migrations: (version, description, steps); a step is an SQL
+# string or a callable(cursor) from above.
+# Append new entries with the next version number; never edit applied ones.
+MIGRATIONS = [
+    (1, "Create clients and reminders tables", [
+        """
+        CREATE TABLE IF NOT EXISTS clients (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(255),
+            age INT,
+            weight FLOAT,
+            goal TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS reminders (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            client_id INT,
+            reminder_date DATE,
+            message TEXT,
+            status VARCHAR(50),
+            FOREIGN KEY (client_id) REFERENCES clients(id) ON DELETE CASCADE
+        )
+        """,
+    ]),
+    (2, "Create progress, activity and user tables", [
+        """
+        CREATE TABLE IF NOT EXISTS progress (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            client_id INT NOT NULL,
+            date DATE NOT NULL,
+            weight FLOAT,
+            notes TEXT,
+            FOREIGN KEY (client_id) REFERENCES clients(id) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS activities (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            calories_per_minute FLOAT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS activity_log (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            client_id INT NOT NULL,
+            activity VARCHAR(100) NOT NULL,
+            duration INT NOT NULL,
+            calories_burned FLOAT NOT NULL,
+            log_date DATE NOT NULL,
+            logged_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (client_id) REFERENCES clients(id) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            username VARCHAR(255) NOT NULL,
+            password VARCHAR(255) NOT NULL
+        )
+        """,
+    ]),
+    # One index per access pattern in database.py; see query_plan_check.py
+    (3, "Add indexes matching the query access patterns", [
+        # A client's reminders by date
+        _create_index("idx_reminders_client_date", "reminders", "client_id, reminder_date"),
+        # Status filters and date-ordered listing
+        _create_index("idx_reminders_status_date", "reminders", "status, reminder_date"),
+        _create_index("idx_reminders_date_id", "reminders", "reminder_date, id"),
+        # get_progress: WHERE client_id = ? [AND date range] ORDER BY date
+        _create_index("idx_progress_client_date", "progress", "client_id, date"),
+        # get_today_activity_log: WHERE client_id = ? AND log_date = CURDATE()
+        _create_index("idx_activity_log_client_date", "activity_log", "client_id, log_date"),
+        # get_activity_list / login / signup lookups by name. Duplicate activities
+        # are interchangeable (the log refers to them by name), so keep the first;
+        # duplicate users need a person to decide which account survives.
+        """
+        DELETE later FROM activities later
+        JOIN activities earlier ON earlier.name = later.name AND earlier.id < later.id
+        """,
+        _create_index("idx_activities_name", "activities", "name", unique=True),
+        _require_unique("users", "username", "Rename or delete the extra accounts, then start the app again."),
+        _create_index("idx_users_username", "users", "username", unique=True),
+    ]),
+    (4, "Add idempotency keys to activity_log for write-behind replays", [
+        _add_column("activity_log", "entry_id", "CHAR(32) NULL"),
+        _create_index("idx_activity_log_entry", "activity_log", "entry_id", unique=True),
+    ]),
+    (5, "Store MET values for the activity catalog", [
+        _add_column("activities", "met", "FLOAT NULL"),
+        # Back-fill from the old per-minute figures, which assumed a 70 kg client
+        "UPDATE activities SET met = calories_per_minute * 60 / 70 WHERE met IS NULL",
+    ]),
+    (6, "Track a version number for cached catalogs", [
+        """
+        CREATE TABLE IF NOT EXISTS catalog_version (
+            name VARCHAR(50) PRIMARY KEY,
+            version INT NOT NULL
+        )
+        """,
+        "INSERT IGNORE INTO catalog_version (name, version) VALUES ('activities', 1)",
+    ]),
+    # Filled by Database.rebuild_activity_rollups(); kept current by the log_activity* writes
+    (7, "Add per-client daily, weekly and monthly activity rollups", [
+        """
+        CREATE TABLE IF NOT EXISTS activity_rollup_daily (
+            client_id INT NOT NULL,
+            period_start DATE NOT NULL,
+            minutes INT NOT NULL DEFAULT 0,
+            calories DOUBLE NOT NULL DEFAULT 0,
+            sessions INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (client_id, period_start),
+            FOREIGN KEY (client_id) REFERENCES clients(id) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS activity_rollup_weekly (
+            client_id INT NOT NULL,
+            period_start DATE NOT NULL,
+            minutes INT NOT NULL DEFAULT 0,
+            calories DOUBLE NOT NULL DEFAULT 0,
+            sessions INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (client_id, period_start),
+            FOREIGN KEY (client_id) REFERENCES clients(id) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS activity_rollup_monthly (
+            client_id INT NOT NULL,
+            period_start DATE NOT NULL,
+            minutes INT NOT NULL DEFAULT 0,
+            calories DOUBLE NOT NULL DEFAULT 0,
+            sessions INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (client_id, period_start),
+            FOREIGN KEY (client_id) REFERENCES clients(id) ON DELETE CASCADE
+        )
+        """,
+    ]),
+    # get_active_client_ids: WHERE date / period_start BETWEEN ? AND ? across all clients
+    (8, "Index progress and monthly rollups by date for active-client lookups", [
+        _create_index("idx_progress_date_client", "progress", "date, client_id"),
+        _create_index("idx_activity_rollup_monthly_start", "activity_rollup_monthly", "period_start, client_id"),
+    ]),
+    # Set by ReminderScheduler once a reminder has popped up, so it pops up only once
+    (9, "Record when a reminder notification was shown", [
+        _add_column("reminders", "notified_at", "DATETIME NULL"),
+    ]),
+    # Installs that predate migration 2 may still have the old CHAR(64) SHA-256 column,
+    # which cannot hold the self-describing KDF hashes from credentials.py
+    (10, "Widen users.password for salted KDF hashes", [
+        "ALTER TABLE users MODIFY password VARCHAR(255) NOT NULL",
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+_schema_current = False
+_lock = threading.Lock()
+
+
+def current_version(cursor):
+    """Return the applied schema version, or 0 on a fresh database."""
+    try:
+        cursor.execute("SELECT MAX(version) FROM schema_version")
+        row = cursor.fetchone()
+        return row[0] or 0
+    except mysql.connector.ProgrammingError:
+        return 0  # schema_version does not exist yet
+
+
+def migrate(conn):
+    """Apply every pending migration in order and return the new version."""
+    cursor = conn.cursor()
+    try:
+        version = current_version(cursor)
+        if version >= LATEST_VERSION:
+            return version
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INT PRIMARY KEY,
+                description VARCHAR(255),
+                applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        for number, description, steps in MIGRATIONS:
+            if number <= version:
+                continue
+            for step in steps:
+                if callable(step):
+                    step(cursor)
+                else:
+                    cursor.execute(step)
+            cursor.execute(
+                "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+                (number, description)
+            )
+            conn.commit()
+            print(f"✅ Applied migration {number}: {description}")
+            version = number
+        return version
+    finally:
+        cursor.close()
+
+
+def ensure_schema(conn):
+    """Migrate once per process; later calls are free once the schema is current."""
+    global _schema_current
+    if _schema_current:
+        return
+    with _lock:
+        if not _schema_current:
+            migrate(conn)
+            _schema_current = True
+
+
+def reset_schema_cache():
+    """Force the next ensure_schema() call to check the database again."""
+    global _schema_current
+    _schema_current = False
@@ -0,0 +1,115 @@
+# database/progress_cache.py
+
+import threading
+from collections import OrderedDict
+import numpy as np
+
+MAX_CACHE_BYTES = 32 * 1024 * 1024  # Budget for cached series across all clients
+ENTRY_OVERHEAD = 256                # Rough per-entry cost of the arrays' headers and the dict slot
+MS_PER_DAY = 86400000
+
+
+class ProgressSeries:
+    """A client's progress as parallel arrays: UTC-midnight epoch-ms dates and weights."""
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    @classmethod
+    def from_rows(cls, progress_data):
+        """Build from get_progress() rows (already ordered by date), skipping entries without a weight."""
+        weighed = [data for data in progress_data if data["weight"] is not None]  # Notes-only entries
+        x = np.array([data["date"] for data in weighed], dtype="datetime64[ms]").astype(np.int64)
+        y = np.array([float(data["weight"]) for data in weighed], dtype=np.float64)
+        return cls(x, y)
+
+    def dates(self):
+        """Dates as "YYYY-MM-DD" strings, for tables."""
+        return np.datetime_as_string(self.x.astype("datetime64[ms]"), unit="D").tolist()
+
+    def __len__(self):
+        return len(self.x)
+
+    @property
+    def nbytes(self):
+        return self.x.nbytes + self.y.nbytes + ENTRY_OVERHEAD
+
+
+class ProgressSeriesCache:
+    """Process-wide LRU of parsed progress series, bounded by memory rather than entry count.
+
+    Database.add_progress() invalidates the client it wrote for. A per-client
+    generation counter stops a read that raced with that write from putting
+    the stale series back.
+    """
+
+    def __init__(self, max_bytes=MAX_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # client_id -> ProgressSeries, least recently used first
+        self._generation = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def peek(self, client_id):
+        """The cached series (marking it recently used), or None without touching the database."""
+        with self._lock:
+            series = self._entries.get(client_id)
+            if series is not None:
+                self._entries.move_to_end(client_id)
+            return series
+
+    def get(self, db, client_id):
+        """Return the series for `client_id`, loading it through `db` on a miss."""
+        series = self.peek(client_id)
+        if series is not None:
+            return series
+
+        with self._lock:
+            generation = self._generation.get(client_id, 0)
+        series = db.get_progress_series(client_id)
+        with self._lock:
+            if self._generation.get(client_id, 0) == generation:
+                self._store(client_id, series)
+        return series
+
+    def _store(self, client_id, series):
+        """Insert and evict least recently used entries (called with the lock held)."""
+        old = self._entries.pop(client_id, None)
+        if old is not None:
+            self._bytes -= old.nbytes
+        if series.nbytes > self.max_bytes:
+            return  # Larger than the whole budget; serve it uncached
+        self._entries[client_id] = series
+        self._bytes += series.nbytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+    def invalidate(self, client_id):
+        with self._lock:
+            self._generation[client_id] = self._generation.get(client_id, 0) + 1
+            old = self._entries.pop(client_id, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+
+    def clear(self):
+        with self._lock:
+            for client_id in self._entries:
+                self._generation[client_id] = self._generation.get(client_id, 0) + 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes}
+
+
+progress_cache = ProgressSeriesCache()
+
+
+def load_progress_series(db, client_id):
+    """Worker-thread entry point for AsyncDatabase.submit()."""
+    return progress_cache.get(db, client_id)
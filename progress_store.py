@@ -0,0 +1,331 @@
+# database/progress_store.py
+
+import contextlib
+import os
+import threading
+import numpy as np
+from database.db_config import get_pool
+from database.progress_cache import MS_PER_DAY, ProgressSeries
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+STORE_DIR = "progress_store"  # One subdirectory per database
+DAYS_FILE = "days.{generation}.i8"        # int64 days since 1970-01-01, one per entry
+WEIGHTS_FILE = "weights.{generation}.f4"  # float32 weight, parallel to DAYS_FILE
+INDEX_FILE = "index.npz"  # Extents plus the generation of the data files they point into
+LOCK_FILE = "write.lock"  # Locked by whichever process is writing
+
+EXTENT = np.dtype([("client_id", np.int64), ("offset", np.int64), ("length", np.int64)])
+
+
+def _lock(file):
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        return
+    file.seek(0)
+    while True:
+        try:
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            pass  # LK_LOCK gives up after ten seconds; keep waiting
+
+
+def _unlock(file):
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class ProgressStore:
+    """Columnar, memory-mapped progress time series for many clients.
+
+    Entries live in two flat files of int64 epoch days and float32 weights.
+    The index lists extents: contiguous runs of one client's entries. append()
+    writes the new rows at the end of the data files and adds an extent, and
+    compact() writes a new generation of files with a single date-ordered
+    extent per client. Replacing the index is the commit point for both.
+    Reads of a compacted client are zero-copy views of the mapped files.
+
+    Writers in every process take the lock file in the store directory (see
+    locked()); readers never wait, and pick up other processes' commits on
+    their next read.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._thread_lock = threading.RLock()
+        self._lock_file = None
+        self._depth = 0
+        self.generation = 0
+        self._load()
+
+    def _file(self, name, generation=None):
+        return os.path.join(self.path, name.format(generation=self.generation if generation is None else generation))
+
+    def _signature(self):
+        try:
+            stat = os.stat(self._file(INDEX_FILE))
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _load(self, recover=False):
+        """Read the index and map the part of the data files it covers.
+
+        With `recover` (only under the lock), rows past the index, left by a
+        writer that crashed before committing, are cut off and files of other
+        generations are deleted.
+        """
+        signature = self._signature()
+        try:
+            with np.load(self._file(INDEX_FILE)) as saved:
+                index = saved["extents"]
+                self.generation = int(saved["generation"])
+        except FileNotFoundError:
+            index = np.empty(0, dtype=EXTENT)
+            self.generation = 0
+        end = int((index["offset"] + index["length"]).max()) if len(index) else 0
+
+        if recover:
+            for name, dtype in ((DAYS_FILE, np.int64), (WEIGHTS_FILE, np.float32)):
+                size = end * np.dtype(dtype).itemsize
+                with open(self._file(name), "ab") as file:
+                    if file.tell() < size:
+                        raise ValueError(f"{self._file(name)} is shorter than its index")
+                    if file.tell() > size:
+                        file.truncate(size)
+            self._remove_other_generations()
+
+        extents = {}
+        for extent in index:
+            extents.setdefault(int(extent["client_id"]), []).append((int(extent["offset"]), int(extent["length"])))
+        # Swapped in one assignment so a concurrent read never mixes old extents with new files
+        self._state = (self._map(DAYS_FILE, np.int64, end), self._map(WEIGHTS_FILE, np.float32, end), extents)
+        self.index = index
+        self._loaded = signature
+
+    def _map(self, name, dtype, length):
+        if length == 0:
+            return np.empty(0, dtype=dtype)  # np.memmap cannot map an empty file
+        return np.memmap(self._file(name), dtype=dtype, mode="r", shape=(length,))
+
+    def _refresh(self):
+        """Reload if another process (or thread) committed since the last load."""
+        if self._signature() == self._loaded:
+            return
+        with self._thread_lock:
+            try:
+                self._load()
+            except FileNotFoundError:
+                self._load()  # A compact() elsewhere removed the files between reading the index and mapping
+
+    def _remove_other_generations(self):
+        """Delete data files left by a finished or interrupted compact()."""
+        current = {DAYS_FILE.format(generation=self.generation), WEIGHTS_FILE.format(generation=self.generation)}
+        for name in os.listdir(self.path):
+            if name.startswith(("days.", "weights.")) and name not in current:
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass  # Still mapped by a reader on Windows; the next writer retries
+
+    def _save_index(self, index, generation):
+        tmp_path = self._file(INDEX_FILE) + ".tmp"
+        with open(tmp_path, "wb") as file:
+            np.savez(file, extents=index, generation=np.int64(generation))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self._file(INDEX_FILE))
+
+    @contextlib.contextmanager
+    def locked(self):
+        """Hold the store's write lock, shared by every process; re-entrant within a thread.
+
+        The index is reloaded on entry, so writes build on whatever other
+        processes committed before.
+        """
+        with self._thread_lock:
+            if self._depth == 0:
+                self._lock_file = open(os.path.join(self.path, LOCK_FILE), "a+b")
+                try:
+                    _lock(self._lock_file)
+                except BaseException:
+                    self._lock_file.close()
+                    raise
+            self._depth += 1
+            try:
+                if self._depth == 1:
+                    self._load(recover=True)
+                yield self
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    _unlock(self._lock_file)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def __len__(self):
+        self._refresh()
+        return len(self._state[0])
+
+    def client_ids(self):
+        self._refresh()
+        return sorted(self._state[2])
+
+    def read(self, client_id):
+        """(days, weights) arrays for a client, ordered by day.
+
+        A client with a single extent gets read-only views into the mapped
+        files; clients appended to since the last compact() get a merged copy.
+        """
+        self._refresh()
+        all_days, all_weights, extents = self._state
+        extents = extents.get(client_id)
+        if not extents:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        if len(extents) == 1:
+            offset, length = extents[0]
+            return all_days[offset:offset + length], all_weights[offset:offset + length]
+        days = np.concatenate([all_days[offset:offset + length] for offset, length in extents])
+        weights = np.concatenate([all_weights[offset:offset + length] for offset, length in extents])
+        order = np.argsort(days, kind="stable")
+        return days[order], weights[order]
+
+    def series(self, client_id):
+        """The client's entries as a ProgressSeries (epoch-ms dates), as used by the charts."""
+        days, weights = self.read(client_id)
+        return ProgressSeries(days.astype(np.int64) * MS_PER_DAY, weights.astype(np.float64))
+
+    def append(self, client_id, days, weights):
+        """Add entries for one client; `days` may be epoch-day integers or datetime64 values."""
+        self.append_many([(client_id, days, weights)])
+
+    def append_many(self, runs):
+        """Add (client_id, days, weights) runs with one write per file and one index update."""
+        extents, day_parts, weight_parts = [], [], []
+        with self.locked():
+            offset = len(self._state[0])
+            for client_id, days, weights in runs:
+                days = np.asarray(days)
+                if np.issubdtype(days.dtype, np.datetime64):
+                    days = days.astype("datetime64[D]")
+                days = days.astype(np.int64)
+                weights = np.asarray(weights, dtype=np.float32)
+                if len(days) != len(weights):
+                    raise ValueError("days and weights must be the same length")
+                if not len(days):
+                    continue
+                order = np.argsort(days, kind="stable")
+                day_parts.append(days[order])
+                weight_parts.append(weights[order])
+                extents.append((client_id, offset, len(days)))
+                offset += len(days)
+            if not extents:
+                return
+
+            for name, parts in ((DAYS_FILE, day_parts), (WEIGHTS_FILE, weight_parts)):
+                with open(self._file(name), "ab") as file:
+                    file.write(np.concatenate(parts).tobytes())
+                    file.flush()
+                    os.fsync(file.fileno())
+            self._save_index(np.concatenate([self.index, np.array(extents, dtype=EXTENT)]), self.generation)
+            self._load()
+
+    def compact(self):
+        """Rewrite the files so every client is one contiguous, date-ordered extent."""
+        with self.locked():
+            clients = sorted(self._state[2])
+            runs = [self.read(client_id) for client_id in clients]
+            lengths = np.array([len(days) for days, _ in runs], dtype=np.int64)
+            index = np.empty(len(clients), dtype=EXTENT)
+            index["client_id"] = clients
+            index["length"] = lengths
+            index["offset"] = np.concatenate([[0], np.cumsum(lengths)[:-1]]) if len(clients) else []
+
+            generation = self.generation + 1
+            for name, column in ((DAYS_FILE, 0), (WEIGHTS_FILE, 1)):
+                with open(self._file(name, generation), "wb") as file:
+                    for run in runs:
+                        file.write(np.ascontiguousarray(run[column]).tobytes())
+                    file.flush()
+                    os.fsync(file.fileno())
+            del runs
+            self._save_index(index, generation)
+            self._load(recover=True)
+
+    def replace(self, batches):
+        """Swap the contents for `batches` of (client_ids, days, weights) arrays ordered by client then day.
+
+        The rows go into a new generation of files and the index is written
+        once at the end, so readers see the old contents until then.
+        """
+        with self.locked():
+            generation = self.generation + 1
+            extents = []
+            offset = 0
+            with open(self._file(DAYS_FILE, generation), "wb") as days_file, \
+                    open(self._file(WEIGHTS_FILE, generation), "wb") as weights_file:
+                for clients, days, weights in batches:
+                    if not len(clients):
+                        continue
+                    starts = np.flatnonzero(np.r_[True, clients[1:] != clients[:-1]])
+                    for start, end in zip(starts, np.r_[starts[1:], len(clients)]):
+                        client_id = int(clients[start])
+                        if extents and extents[-1][0] == client_id:
+                            extents[-1][2] += end - start  # Client split across two batches
+                        else:
+                            extents.append([client_id, offset, end - start])
+                        offset += end - start
+                    days_file.write(np.asarray(days, dtype=np.int64).tobytes())
+                    weights_file.write(np.asarray(weights, dtype=np.float32).tobytes())
+                for file in (days_file, weights_file):
+                    file.flush()
+                    os.fsync(file.fileno())
+            self._save_index(np.array([tuple(extent) for extent in extents], dtype=EXTENT), generation)
+            self._load(recover=True)
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def store_path(database=None):
+    """Store directory for `database`, by default the one the connection pool uses."""
+    return os.path.join(STORE_DIR, database or get_pool().config["database"])
+
+
+def open_store(path=None, create=False):
+    """The process's shared store at `path` (default: store_path()), or None if none has been built there."""
+    path = os.path.abspath(path or store_path())
+    if not create and not os.path.exists(os.path.join(path, INDEX_FILE)):
+        return None
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = ProgressStore(path)
+        return store
+
+
+def build_progress_store(db, path=None, batch_size=50000):
+    """Fill the store at `path` (default: store_path()) with every weighed entry in `db`; returns the store.
+
+    The write lock is held throughout, so Database.add_progress() calls wait
+    for the build instead of appending to the contents it replaces.
+    """
+    store = open_store(path, create=True)
+
+    def batches():
+        for rows in db.iter_all_progress(batch_size):
+            table = np.array(rows, dtype=np.float64)
+            yield table[:, 0].astype(np.int64), table[:, 1].astype(np.int64), table[:, 2]
+
+    store.replace(batches())
+    return store
@@ -0,0 +1,277 @@
+# query_plan_check.py
+#
+# Query-plan regression check. Seeds a scratch database with synthetic data,
+# runs every public Database method against it while recording the statements
+# it sends, then EXPLAINs each filtered one and fails if any of them falls back
+# to a full table scan.
+#
+#   python query_plan_check.py --clients 2000 --database fitness_tracker_plancheck
+#
+# A Database method without an entry in cases() fails the check too, so new
+# queries cannot slip past it.
+
+import argparse
+import random
+import re
+import shutil
+import sys
+from contextlib import contextmanager
+from datetime import date, timedelta
+import mysql.connector
+from database.db_config import DB_CONFIG, configure_pool
+from database.database import Database
+from database.progress_store import store_path
+
+TODAY = date.today()
+CLIENT = 7  # Every seeded client has the same history; any existing ID will do
+
+# Database methods that never send a query of their own
+NOT_QUERIES = {"close", "create_tables"}
+# Methods that stream a whole table on purpose; their plans are not checked
+READS_EVERY_ROW = {"iter_all_progress"}
+
+
+def cases(db):
+    """(name, method, callable) for every public Database method, with arguments that hit seeded rows."""
+    month_start = TODAY.replace(day=1)
+    return [
+        ("get_reminders", "get_reminders", lambda: db.get_reminders()),
+        ("get_reminders_page", "get_reminders_page", lambda: db.get_reminders_page()),
+        ("get_reminders_page next page by status", "get_reminders_page",
+         lambda: db.get_reminders_page((TODAY - timedelta(days=30), 0), status="Pending")),
+        ("get_reminders_page after undated", "get_reminders_page", lambda: db.get_reminders_page((None, 0))),
+        ("get_reminders_page date window", "get_reminders_page",
+         lambda: db.get_reminders_page(start_date=TODAY - timedelta(days=90), end_date=TODAY)),
+        ("save_reminder", "save_reminder", lambda: db.save_reminder(CLIENT, TODAY, "Plan check", "Pending")),
+        ("save_reminders_bulk", "save_reminders_bulk",
+         lambda: db.save_reminders_bulk([(CLIENT, TODAY, "Plan check", "Pending")] * 3)),
+        ("get_pending_reminders", "get_pending_reminders",
+         lambda: db.get_pending_reminders(TODAY, TODAY + timedelta(days=7))),
+        ("get_pending_reminders unnotified", "get_pending_reminders",
+         lambda: db.get_pending_reminders(TODAY, TODAY + timedelta(days=7), True)),
+        ("mark_reminders_notified", "mark_reminders_notified", lambda: db.mark_reminders_notified([1, 2, 3])),
+        ("mark_overdue_reminders", "mark_overdue_reminders",
+         lambda: db.mark_overdue_reminders(TODAY - timedelta(days=300))),
+        ("delete_reminder", "delete_reminder", lambda: db.delete_reminder(1)),
+        ("get_password_hash", "get_password_hash", lambda: db.get_password_hash("user7")),
+        ("add_user", "add_user", lambda: db.add_user("plan-check", "x")),
+        ("set_password_hash", "set_password_hash", lambda: db.set_password_hash("user7", "y")),
+        ("get_all_clients", "get_all_clients", lambda: db.get_all_clients()),
+        ("get_client_name", "get_client_name", lambda: db.get_client_name(CLIENT)),
+        ("get_client_weight", "get_client_weight", lambda: db.get_client_weight(CLIENT)),
+        ("get_progress", "get_progress", lambda: db.get_progress(CLIENT)),
+        ("get_progress date range", "get_progress",
+         lambda: db.get_progress(CLIENT, TODAY - timedelta(days=90), TODAY)),
+        ("count_progress", "count_progress", lambda: db.count_progress(CLIENT, TODAY - timedelta(days=90))),
+        ("iter_progress", "iter_progress", lambda: list(db.iter_progress(CLIENT))),
+        ("iter_all_progress", "iter_all_progress", lambda: list(db.iter_all_progress())),
+        ("get_progress_series", "get_progress_series", lambda: db.get_progress_series(CLIENT)),
+        ("get_progress_summary month", "get_progress_summary",
+         lambda: db.get_progress_summary(CLIENT, "month", TODAY - timedelta(days=180), TODAY)),
+        ("get_progress_summary season", "get_progress_summary", lambda: db.get_progress_summary(CLIENT, "season")),
+        ("add_progress", "add_progress", lambda: db.add_progress(CLIENT, TODAY.isoformat(), 80.0, "")),
+        ("get_activity_list", "get_activity_list", lambda: db.get_activity_list()),
+        ("get_catalog_version", "get_catalog_version", lambda: db.get_catalog_version()),
+        ("save_activity", "save_activity", lambda: db.save_activity("Plan Check", 4.0)),
+        ("delete_activity", "delete_activity", lambda: db.delete_activity("Plan Check")),
+        ("log_activity", "log_activity", lambda: db.log_activity(CLIENT, "Running", 30, 300.0)),
+        ("log_activities_bulk", "log_activities_bulk",
+         lambda: db.log_activities_bulk([("f" * 32, CLIENT, "Walking", 20, 80.0, TODAY.isoformat())])),
+        ("get_activity_totals day", "get_activity_totals",
+         lambda: db.get_activity_totals(CLIENT, "day", TODAY - timedelta(days=90), TODAY)),
+        ("get_activity_totals week", "get_activity_totals",
+         lambda: db.get_activity_totals(CLIENT, "week", TODAY - timedelta(days=90))),
+        ("get_activity_totals month", "get_activity_totals", lambda: db.get_activity_totals(CLIENT, "month")),
+        ("get_active_client_ids", "get_active_client_ids", lambda: db.get_active_client_ids(month_start, TODAY)),
+        ("get_chart_fingerprints", "get_chart_fingerprints", lambda: db.get_chart_fingerprints()),
+        ("get_activity_rows", "get_activity_rows", lambda: db.get_activity_rows(1000, 500)),
+        ("update_activity_calories", "update_activity_calories",
+         lambda: db.update_activity_calories([(100.0, 1), (120.0, 2)])),
+        ("get_today_activity_log", "get_today_activity_log", lambda: db.get_today_activity_log(CLIENT)),
+        ("rebuild_activity_rollups", "rebuild_activity_rollups", lambda: db.rebuild_activity_rollups()),
+    ]
+
+
+def missing_cases(covered):
+    """Public Database methods that cases() does not exercise."""
+    public = {name for name in dir(Database) if not name.startswith("_") and callable(getattr(Database, name))}
+    return sorted(public - NOT_QUERIES - set(covered))
+
+
+class _RecordingCursor:
+    """Cursor proxy that notes each statement (with its first parameter row) before running it."""
+
+    def __init__(self, cursor, log):
+        self._cursor = cursor
+        self._log = log
+
+    def execute(self, query, params=None, *args, **kwargs):
+        self._log.append((query, params))
+        return self._cursor.execute(query, params, *args, **kwargs)
+
+    def executemany(self, query, seq_params):
+        seq_params = list(seq_params)
+        if seq_params:
+            self._log.append((query, seq_params[0]))
+        return self._cursor.executemany(query, seq_params)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _RecordingConnection:
+    def __init__(self, conn, log):
+        self._conn = conn
+        self._log = log
+
+    def cursor(self, *args, **kwargs):
+        return _RecordingCursor(self._conn.cursor(*args, **kwargs), self._log)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+@contextmanager
+def recording(db):
+    """Yield a list that collects every (query, params) `db` sends inside the block."""
+    log = []
+    conn, cursor = db.conn, db.cursor
+    db.conn, db.cursor = _RecordingConnection(conn, log), _RecordingCursor(cursor, log)
+    try:
+        yield log
+    finally:
+        db.conn, db.cursor = conn, cursor
+
+
+def filtered(query):
+    """True for reads and writes that pick rows with a WHERE clause (the ones an index can serve)."""
+    return (re.match(r"\s*(SELECT|UPDATE|DELETE)\b", query, re.IGNORECASE) is not None
+            and re.search(r"\bWHERE\b", query, re.IGNORECASE) is not None)
+
+ACTIVITIES = {"Running": 11.4, "Cycling": 8.0, "Swimming": 9.8, "Walking": 4.3, "Yoga": 3.0}
+STATUSES = ["Pending", "Done", "Overdue"]
+
+
+def seed(db, clients, days, seed_value=42):
+    """Fill the scratch schema with `clients` clients and `days` days of history each."""
+    rng = random.Random(seed_value)
+    conn = db.conn
+    cursor = conn.cursor()
+    cursor.executemany(
+        "INSERT INTO clients (name, age, weight, goal) VALUES (%s, %s, %s, %s)",
+        [(f"Client {i}", rng.randint(16, 70), rng.uniform(50, 120), "Slim") for i in range(clients)]
+    )
+    cursor.executemany(
+        "INSERT IGNORE INTO activities (name, calories_per_minute) VALUES (%s, %s)",
+        list(ACTIVITIES.items())
+    )
+    cursor.executemany(
+        "INSERT INTO users (username, password) VALUES (%s, %s)",
+        [(f"user{i}", "x") for i in range(clients)]
+    )
+    cursor.execute("SELECT id FROM clients")
+    ids = [row[0] for row in cursor.fetchall()]
+
+    for client_id in ids:
+        cursor.executemany(
+            "INSERT INTO progress (client_id, date, weight, notes) VALUES (%s, %s, %s, %s)",
+            [(client_id, TODAY - timedelta(days=d), rng.uniform(50, 120), "") for d in range(0, days, 7)]
+        )
+        cursor.executemany(
+            "INSERT INTO reminders (client_id, reminder_date, message, status) VALUES (%s, %s, %s, %s)",
+            [(client_id, TODAY - timedelta(days=d), "Check in", rng.choice(STATUSES))
+             for d in range(0, days, 14)]
+        )
+        cursor.executemany(
+            "INSERT INTO activity_log (client_id, activity, duration, calories_burned, log_date) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            [(client_id, name, 30, per_minute * 30, TODAY - timedelta(days=d))
+             for d in range(0, days, 3) for name, per_minute in [rng.choice(list(ACTIVITIES.items()))]]
+        )
+        conn.commit()
+
+    db.rebuild_activity_rollups()
+
+    for table in ("clients", "reminders", "progress", "activity_log", "activities", "users",
+                  "activity_rollup_daily", "activity_rollup_weekly", "activity_rollup_monthly"):
+        cursor.execute(f"ANALYZE TABLE {table}")
+        cursor.fetchall()
+    cursor.close()
+
+
+def explain(conn, query, params):
+    """Return EXPLAIN rows as dicts."""
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("EXPLAIN " + query, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def full_scans(conn, query, params):
+    """EXPLAIN rows that read a whole base table (derived tables and unions are built from indexed reads)."""
+    return [row for row in explain(conn, query, params)
+            if not str(row.get("table") or "").startswith("<")
+            and (row.get("type") == "ALL" or row.get("key") is None)]
+
+
+def check_plans(db):
+    """Run every case, EXPLAIN what it sent and return the names of the cases that scan a whole table."""
+    failures = []
+    all_cases = cases(db)
+    for method in missing_cases(method for _, method, _ in all_cases):
+        failures.append(method)
+        print(f"❌ {method}: no case in query_plan_check.cases()")
+
+    for name, method, call in all_cases:
+        with recording(db) as log:
+            call()
+        if method in READS_EVERY_ROW:
+            print(f"➖ {name} reads every row by design")
+            continue
+        statements = [(query, params) for query, params in log if filtered(query)]
+        scans = [row for query, params in statements for row in full_scans(db.conn, query, params)]
+        if scans:
+            failures.append(name)
+            for row in scans:
+                print(f"❌ {name}: full scan of {row.get('table')} (type={row.get('type')}, key={row.get('key')})")
+        else:
+            print(f"✅ {name} ({len(statements)} filtered of {len(log)} statements)")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Assert that database.py queries use indexes.")
+    parser.add_argument("--database", default="fitness_tracker_plancheck",
+                        help="Scratch database; it is dropped and recreated")
+    parser.add_argument("--clients", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+
+    config = {key: value for key, value in DB_CONFIG.items() if key != "database"}
+    server = mysql.connector.connect(**config)
+    cursor = server.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{args.database}`")
+    cursor.execute(f"CREATE DATABASE `{args.database}`")
+    server.close()
+    shutil.rmtree(store_path(args.database), ignore_errors=True)  # Stale, and the SQL paths are what is checked
+
+    configure_pool(**config, database=args.database)
+    db = Database()  # Migrates the scratch schema
+    if db.conn is None:
+        sys.exit(1)
+    try:
+        seed(db, args.clients, args.days)
+        failures = check_plans(db)
+    finally:
+        db.close()
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+# rebuild_rollups.py
+#
+# Backfills the daily/weekly/monthly activity rollup tables from activity_log.
+# Run once after upgrading, or after editing activity_log outside the app.
+#
+#   python rebuild_rollups.py
+
+import sys
+import time
+from database.database import Database
+
+
+def main():
+    db = Database()
+    if db.conn is None:
+        sys.exit(1)
+    started = time.perf_counter()
+    try:
+        db.rebuild_activity_rollups()
+    finally:
+        db.close()
+    print(f"✅ Activity rollups rebuilt in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# database/reminder_import.py
+
+import csv
+import json
+import time
+from datetime import date
+from database.database import BULK_CHUNK_SIZE
+
+STATUSES = ("Pending", "Done", "Overdue")
+
+
+def _row(record, line):
+    client_id = str(record.get("client_id", "")).strip()
+    reminder_date = str(record.get("reminder_date", "")).strip()
+    message = str(record.get("message", "")).strip()
+    status = str(record.get("status") or "Pending").strip()
+    if not client_id or not reminder_date or not message:
+        raise ValueError(f"Row {line}: client_id, reminder_date and message are required")
+    if status not in STATUSES:
+        raise ValueError(f"Row {line}: unknown status {status!r}")
+    try:
+        reminder_date = date.fromisoformat(reminder_date).isoformat()
+    except ValueError:
+        raise ValueError(f"Row {line}: reminder_date {reminder_date!r} is not a YYYY-MM-DD date") from None
+    return client_id, reminder_date, message, status
+
+
+def iter_reminder_file(path):
+    """Stream (client_id, reminder_date, message, status) tuples from a file.
+
+    .csv files need a header row naming those columns (status is optional),
+    .jsonl files hold one object per line, and .json files an array of objects.
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, newline="") as file:
+            for line, record in enumerate(csv.DictReader(file), start=2):
+                yield _row(record, line)
+    elif path.lower().endswith(".jsonl"):
+        with open(path) as file:
+            for line, text in enumerate(file, start=1):
+                if text.strip():
+                    yield _row(json.loads(text), line)
+    elif path.lower().endswith(".json"):
+        with open(path) as file:
+            for line, record in enumerate(json.load(file), start=1):
+                yield _row(record, line)
+    else:
+        raise ValueError("Reminders can be imported from .csv, .json or .jsonl files")
+
+
+def import_reminder_file(db, path, chunk_size=BULK_CHUNK_SIZE):
+    """Stream a file into Database.save_reminders_bulk; returns (rows, seconds)."""
+    started = time.perf_counter()
+    count = db.save_reminders_bulk(iter_reminder_file(path), chunk_size)
+    return count, time.perf_counter() - started
@@ -0,0 +1,154 @@
+# ui/reminder_scheduler.py
+
+import heapq
+from datetime import date, datetime, time, timedelta
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from database.async_db import AsyncDatabase
+
+REMINDER_TIME = time(9, 0)  # Reminders are dated, not timed; fire them at this time of day
+HORIZON_DAYS = 7            # How far ahead pending reminders are kept in memory
+MAX_TIMER_MS = 60 * 60 * 1000  # Re-arm at least hourly so clock changes are picked up
+
+
+def _as_date(value):
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value), "%Y-%m-%d").date()
+
+
+class ReminderScheduler(QObject):
+    """Fires reminder_due for each pending reminder when it comes due.
+
+    Pending reminders within HORIZON_DAYS are held in a min-heap keyed by due
+    time and a single-shot QTimer is armed for the earliest one. A due
+    reminder is stamped notified_at and shown only by the instance that
+    stamped it, so it pops up once even with several apps open. On the first
+    start() and at each midnight missed reminders are marked Overdue with one
+    UPDATE and the next window is loaded; in between, RemindersWindow reports
+    saves and deletes so the heap is patched instead of re-reading the table.
+    """
+
+    reminder_due = pyqtSignal(dict)
+    overdue_marked = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.db = AsyncDatabase(self)
+        self._heap = []      # (due datetime, reminder id)
+        self._live = {}      # reminder id -> reminder dict, for lazy deletion
+        self._window_end = None
+        self._running = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._dispatch)
+
+    def start(self):
+        """Start firing reminders; the window is loaded once per process and kept across stop()."""
+        if self._running:
+            return
+        self._running = True
+        if self._window_end is None:
+            self.refresh()
+        else:
+            self._dispatch()  # Resume, catching up on anything that came due while stopped
+
+    def refresh(self):
+        """Mark missed reminders Overdue and reload the upcoming window, e.g. after an import."""
+        today = date.today()
+        self.db.submit("overdue", "mark_overdue_reminders", today.isoformat(),
+                       on_result=self._on_overdue_marked,
+                       on_error=lambda e: print(f"❌ Error marking overdue reminders: {e}"))
+        end = today + timedelta(days=HORIZON_DAYS)
+        self.db.submit("window", "get_pending_reminders", today.isoformat(), end.isoformat(), True,
+                       on_result=lambda reminders: self._load_window(reminders, end),
+                       on_error=lambda e: print(f"❌ Error loading reminders: {e}"))
+
+    def stop(self):
+        """Stop firing reminders until the next start(), e.g. while nobody is logged in."""
+        self._running = False
+        self._timer.stop()
+        self.db.shutdown()
+
+    def _on_overdue_marked(self, count):
+        if count:
+            print(f"⏰ Marked {count} reminders as Overdue")
+            self.overdue_marked.emit(count)
+
+    def _load_window(self, reminders, window_end):
+        self._heap = []
+        self._live = {}
+        self._window_end = window_end
+        for reminder in reminders:
+            self._push(reminder)
+        if self._running:
+            self._arm()
+
+    def due_time(self, reminder):
+        return datetime.combine(_as_date(reminder["reminder_date"]), REMINDER_TIME)
+
+    def _push(self, reminder):
+        self._live[reminder["id"]] = reminder
+        heapq.heappush(self._heap, (self.due_time(reminder), reminder["id"]))
+
+    def reminder_saved(self, reminder):
+        """Track a newly saved reminder if it is pending and inside the loaded window."""
+        if reminder.get("status") != "Pending" or self._window_end is None:
+            return
+        if date.today() <= _as_date(reminder["reminder_date"]) <= self._window_end:
+            self._push(reminder)
+            if self._running:
+                self._arm()
+
+    def reminder_deleted(self, reminder_id):
+        """Forget a reminder removed by Database.delete_reminder()."""
+        if self._live.pop(reminder_id, None) is not None and self._running:
+            self._arm()  # Its heap entry is skipped when popped
+
+    def _arm(self):
+        while self._heap and self._heap[0][1] not in self._live:
+            heapq.heappop(self._heap)
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), time())
+        wake = min(self._heap[0][0], midnight) if self._heap else midnight
+        delay = (wake - now).total_seconds() * 1000
+        self._timer.start(int(min(max(delay, 0), MAX_TIMER_MS)))
+
+    def _dispatch(self):
+        now = datetime.now()
+        if self._window_end is not None and now.date() + timedelta(days=HORIZON_DAYS) > self._window_end:
+            self.refresh()  # Day rolled over: mark yesterday's misses and slide the window
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, reminder_id = heapq.heappop(self._heap)
+            reminder = self._live.pop(reminder_id, None)
+            if reminder is not None:
+                due.append(reminder)
+        if due:
+            # Stamp them before showing anything, and show only the ones this instance stamped,
+            # so neither a crash nor a second running app makes a reminder fire twice
+            self.db.run("mark_reminders_notified", [reminder["id"] for reminder in due],
+                        on_result=lambda stamped: self._notify(due, stamped),
+                        on_error=lambda e: self._notify_unrecorded(due, e))
+        self._arm()
+
+    def _notify(self, due, stamped):
+        stamped = set(stamped)
+        for reminder in due:
+            if reminder["id"] in stamped:
+                self.reminder_due.emit(reminder)
+
+    def _notify_unrecorded(self, due, error):
+        print(f"❌ Error recording reminder notifications: {error}")
+        for reminder in due:  # A possible duplicate is better than a missed reminder
+            self.reminder_due.emit(reminder)
+
+
+_scheduler = None
+
+
+def get_scheduler():
+    """The process-wide scheduler shared by the dashboard and RemindersWindow."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = ReminderScheduler()
+    return _scheduler
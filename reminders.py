@@ -1,16 +1,16 @@
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QTableWidget,
-    QTableWidgetItem, QLineEdit, QDateEdit, QComboBox, QHBoxLayout, QMessageBox
+    QTableWidgetItem, QLineEdit, QDateEdit, QComboBox, QHBoxLayout, QMessageBox, QCheckBox,
+    QFileDialog
 )
-from PyQt5.QtCore import QDate
+from PyQt5.QtCore import Qt, QDate
+from database.async_db import AsyncDatabase
+from database.database import REMINDER_PAGE_SIZE
+from core.services import ReminderService, ServiceError, task
+from ui.reminder_scheduler import get_scheduler
+
+FETCH_THRESHOLD = 20  # Fetch the next page when this many rows from the bottom
 
-# ✅ Import Database Properly
-try:
-    from database.db_config import Database  # Ensure correct import
-    db = Database()
-except Exception as e:
-    print(f"Database Connection Error: {e}")
-    db = None  # Prevent crashes
 
 class RemindersWindow(QWidget):
     def __init__(self):
@@ -19,16 +19,49 @@ class RemindersWindow(QWidget):
         self.setWindowTitle("Set Reminders")
         self.setGeometry(100, 100, 600, 500)
 
+        self.db = AsyncDatabase(self)  # ✅ Queries run on worker threads
+        self.last_key = None    # (reminder_date, id) of the last loaded row
+        self.has_more = False
+
         layout = QVBoxLayout()
 
         # Reminder List Label
         self.reminder_list_label = QLabel("Reminder List")
         layout.addWidget(self.reminder_list_label)
 
+        # Reminder Filters
+        filter_layout = QHBoxLayout()
+
+        self.status_filter = QComboBox()
+        self.status_filter.addItems(["All", "Pending", "Done", "Overdue"])
+        self.status_filter.currentIndexChanged.connect(self.load_reminders)
+        filter_layout.addWidget(QLabel("Status:"))
+        filter_layout.addWidget(self.status_filter)
+
+        self.window_filter = QCheckBox("From")
+        self.window_filter.toggled.connect(self.load_reminders)
+        filter_layout.addWidget(self.window_filter)
+
+        self.filter_start = QDateEdit()
+        self.filter_start.setCalendarPopup(True)
+        self.filter_start.setDate(QDate.currentDate().addMonths(-1))
+        self.filter_start.dateChanged.connect(self.window_changed)
+        filter_layout.addWidget(self.filter_start)
+
+        filter_layout.addWidget(QLabel("To"))
+        self.filter_end = QDateEdit()
+        self.filter_end.setCalendarPopup(True)
+        self.filter_end.setDate(QDate.currentDate().addMonths(1))
+        self.filter_end.dateChanged.connect(self.window_changed)
+        filter_layout.addWidget(self.filter_end)
+
+        layout.addLayout(filter_layout)
+
         # Reminder Table
         self.table = QTableWidget()
         self.table.setColumnCount(4)
         self.table.setHorizontalHeaderLabels(["Client ID", "Reminder Date", "Message", "Status"])
+        self.table.verticalScrollBar().valueChanged.connect(self.maybe_fetch_more)
         layout.addWidget(self.table)
 
         # Buttons for Add, Edit, Delete
@@ -46,6 +79,10 @@ class RemindersWindow(QWidget):
         self.btn_delete.clicked.connect(self.delete_reminder)
         button_layout.addWidget(self.btn_delete)
 
+        self.btn_import = QPushButton("Import CSV/JSON")
+        self.btn_import.clicked.connect(self.import_reminders)
+        button_layout.addWidget(self.btn_import)
+
         layout.addLayout(button_layout)
 
         # Reminder Form Inputs
@@ -83,48 +120,79 @@ class RemindersWindow(QWidget):
 
         self.load_reminders()  # ✅ Load reminders on startup
 
-    def load_reminders(self):
-        """Fetch and display all reminders from the database."""
-        if db is None:
-            QMessageBox.critical(self, "Database Error", "Database connection is not available.")
-            return
-
-        try:
-            reminders = db.get_reminders()
-            self.table.setRowCount(len(reminders))
+    def current_filters(self):
+        status = self.status_filter.currentText()
+        if self.window_filter.isChecked():
+            start = self.filter_start.date().toString("yyyy-MM-dd")
+            end = self.filter_end.date().toString("yyyy-MM-dd")
+        else:
+            start = end = None
+        return (None if status == "All" else status), start, end
 
-            for row, data in enumerate(reminders):
-                self.table.setItem(row, 0, QTableWidgetItem(str(data["client_id"])))
-                self.table.setItem(row, 1, QTableWidgetItem(data["reminder_date"]))
-                self.table.setItem(row, 2, QTableWidgetItem(data["message"]))
-                self.table.setItem(row, 3, QTableWidgetItem(data["status"]))
+    def window_changed(self):
+        """Date edits only filter while the From checkbox is ticked."""
+        if self.window_filter.isChecked():
+            self.load_reminders()
 
-        except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"Failed to load reminders: {e}")
+    def load_reminders(self):
+        """Reload the first page of reminders matching the filters."""
+        self.table.setRowCount(0)
+        self.last_key = None
+        self.has_more = False
+        self.fetch_page()
+
+    def fetch_page(self):
+        status, start, end = self.current_filters()
+        self.db.submit("reminders", "get_reminders_page", self.last_key, REMINDER_PAGE_SIZE, status, start, end,
+                       on_result=self.append_reminders,
+                       on_error=lambda e: QMessageBox.critical(self, "Database Error", f"Failed to load reminders: {e}"))
+
+    def maybe_fetch_more(self, value):
+        """Keyset-paginate as the user scrolls towards the end of the table."""
+        bar = self.table.verticalScrollBar()
+        if self.has_more and not self.db.is_pending("reminders") and value >= bar.maximum() - FETCH_THRESHOLD:
+            self.fetch_page()
+
+    def append_reminders(self, reminders):
+        first = self.table.rowCount()
+        self.table.setRowCount(first + len(reminders))
+
+        for row, data in enumerate(reminders, start=first):
+            client_item = QTableWidgetItem(str(data["client_id"]))
+            client_item.setData(Qt.UserRole, data["id"])  # Rows are deleted by id
+            self.table.setItem(row, 0, client_item)
+            self.table.setItem(row, 1, QTableWidgetItem(str(data["reminder_date"] or "")))
+            self.table.setItem(row, 2, QTableWidgetItem(data["message"]))
+            self.table.setItem(row, 3, QTableWidgetItem(data["status"]))
+
+        self.has_more = len(reminders) == REMINDER_PAGE_SIZE
+        if reminders:
+            self.last_key = (reminders[-1]["reminder_date"], reminders[-1]["id"])
+        # Keep going until the viewport is full (no scroll bar means no scroll events)
+        if self.has_more and self.table.verticalScrollBar().maximum() == 0:
+            self.fetch_page()
 
     def save_reminder(self):
         """Save a new or edited reminder."""
-        if db is None:
-            QMessageBox.critical(self, "Database Error", "Database connection is not available.")
-            return
-
-        client_id = self.client_id_input.text().strip()
+        client_id = self.client_id_input.text()
         reminder_date = self.reminder_date.date().toString("yyyy-MM-dd")
-        message = self.message_input.text().strip()
+        message = self.message_input.text()
         status = self.status_dropdown.currentText()
 
-        if not client_id or not message:
-            QMessageBox.warning(self, "Input Error", "Please enter a Client ID and Message.")
-            return
-
-        try:
-            db.save_reminder(client_id, reminder_date, message, status)
+        def saved(reminder):
+            get_scheduler().reminder_saved(reminder)
             self.load_reminders()  # Refresh UI
             QMessageBox.information(self, "Success", "Reminder saved successfully!")
             self.clear_form()
 
-        except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"Failed to save reminder: {e}")
+        def failed(error):
+            if isinstance(error, ServiceError):  # ReminderService validates the form
+                QMessageBox.warning(self, "Input Error", str(error))
+            else:
+                QMessageBox.critical(self, "Database Error", f"Failed to save reminder: {error}")
+
+        self.db.run(task(ReminderService, "save"), client_id, reminder_date, message, status,
+                    on_result=saved, on_error=failed)
 
     def edit_reminder(self):
         """Load selected reminder into input fields."""
@@ -137,26 +205,45 @@ class RemindersWindow(QWidget):
 
     def delete_reminder(self):
         """Delete selected reminder."""
-        if db is None:
-            QMessageBox.critical(self, "Database Error", "Database connection is not available.")
-            return
-
         selected = self.table.currentRow()
         if selected >= 0:
-            client_id = self.table.item(selected, 0).text()
-            reminder_date = self.table.item(selected, 1).text()
+            reminder_id = self.table.item(selected, 0).data(Qt.UserRole)
 
             confirm = QMessageBox.question(self, "Confirm Deletion",
                                            f"Are you sure you want to delete this reminder?",
                                            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if confirm == QMessageBox.Yes:
-                try:
-                    db.delete_reminder(client_id, reminder_date)
+                def deleted(_):
+                    get_scheduler().reminder_deleted(reminder_id)
                     self.load_reminders()  # Refresh UI
                     QMessageBox.information(self, "Success", "Reminder deleted successfully!")
 
-                except Exception as e:
-                    QMessageBox.critical(self, "Database Error", f"Failed to delete reminder: {e}")
+                self.db.run("delete_reminder", reminder_id,
+                            on_result=deleted,
+                            on_error=lambda e: QMessageBox.critical(self, "Database Error", f"Failed to delete reminder: {e}"))
+
+    def import_reminders(self):
+        """Bulk-load reminders from a CSV or JSON file on a worker thread."""
+        path, _ = QFileDialog.getOpenFileName(self, "Import Reminders", "",
+                                              "Reminder files (*.csv *.json *.jsonl)")
+        if not path:
+            return
+
+        def imported(result):
+            count, seconds = result
+            rate = count / seconds if seconds else count
+            get_scheduler().refresh()  # Pick up any imported reminders that are due soon
+            self.load_reminders()
+            self.btn_import.setEnabled(True)
+            QMessageBox.information(self, "Import Complete",
+                                    f"Imported {count} reminders in {seconds:.2f}s ({rate:,.0f} rows/s).")
+
+        def failed(error):
+            self.btn_import.setEnabled(True)
+            QMessageBox.critical(self, "Import Error", f"Failed to import reminders: {error}")
+
+        self.btn_import.setEnabled(False)
+        self.db.run(task(ReminderService, "import_file"), path, on_result=imported, on_error=failed)
 
     def clear_form(self):
         """Clear input fields for adding a new reminder."""
@@ -164,6 +251,10 @@ class RemindersWindow(QWidget):
         self.message_input.clear()
         self.status_dropdown.setCurrentIndex(0)
 
+    def closeEvent(self, event):
+        self.db.shutdown()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication([])
     window = RemindersWindow()
@@ -0,0 +1,179 @@
+# render_charts.py
+#
+# Renders weight and weekly activity charts for every client (or the ones
+# given) as PNGs, headless, across a process pool. Clients whose name, progress
+# and activity data are unchanged since their last render, within the same
+# activity window, are skipped; the output directory's manifest.json records
+# what each PNG was rendered from.
+#
+#   python render_charts.py --output charts
+#   python render_charts.py --clients 3 7 12 --workers 2 --force
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+import matplotlib
+matplotlib.use("Agg")  # No display needed; must happen before any other matplotlib import
+from matplotlib.figure import Figure
+from database.database import Database, period_start
+
+OUTPUT_DIR = "charts"
+MANIFEST = "manifest.json"
+ACTIVITY_WEEKS = 12  # Weeks of activity shown in the activity chart
+DPI = 100
+
+_db = None  # One connection per worker process
+
+
+def _init_worker():
+    global _db
+    _db = Database()
+    if _db.conn is None:
+        raise ConnectionError("Database connection is not available.")
+
+
+def render_weight_chart(series, name, path):
+    fig = Figure(figsize=(8, 4), dpi=DPI)
+    ax = fig.subplots()
+    if len(series):
+        ax.plot(series.x.astype("datetime64[ms]"), series.y, marker=".", linewidth=1.5)
+    else:
+        ax.text(0.5, 0.5, "No progress recorded", ha="center", va="center", transform=ax.transAxes)
+    ax.set_title(f"{name} - Weight Progress")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Weight (Kgs)")
+    ax.grid(alpha=0.3)
+    fig.autofmt_xdate()
+    fig.savefig(path)
+
+
+def render_activity_chart(weeks, name, path):
+    fig = Figure(figsize=(8, 4), dpi=DPI)
+    ax = fig.subplots()
+    labels = [week["period_start"].strftime("%d/%m") for week in weeks]
+    ax.bar(labels, [float(week["calories"] or 0) for week in weeks], color="tab:orange")
+    ax.set_title(f"{name} - Calories Burned per Week")
+    ax.set_xlabel("Week starting")
+    ax.set_ylabel("Calories")
+    ax.grid(axis="y", alpha=0.3)
+    fig.autofmt_xdate()
+    fig.savefig(path)
+
+
+def activity_window_start(today=None):
+    """Monday of the first week the activity chart shows."""
+    return period_start((today or date.today()) - timedelta(weeks=ACTIVITY_WEEKS), "week")
+
+
+def render_client(client_id, name, fingerprint, window_start, output_dir):
+    """Render both charts for one client in a worker process; returns its manifest entry."""
+    series = _db.get_progress_series(client_id)
+    weeks = _db.get_activity_totals(client_id, "week", window_start)
+
+    weight_file = f"client_{client_id}_weight.png"
+    activity_file = f"client_{client_id}_activity.png"
+    render_weight_chart(series, name, os.path.join(output_dir, weight_file))
+    render_activity_chart(weeks, name, os.path.join(output_dir, activity_file))
+    return {
+        "name": name,
+        "fingerprint": fingerprint,
+        "rendered_at": datetime.now().isoformat(timespec="seconds"),
+        "weight_chart": weight_file,
+        "activity_chart": activity_file,
+    }
+
+
+def load_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST)) as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"clients": {}}
+
+
+def save_manifest(output_dir, manifest):
+    path = os.path.join(output_dir, MANIFEST)
+    with open(path + ".tmp", "w") as file:
+        json.dump(manifest, file, indent=4)
+    os.replace(path + ".tmp", path)
+
+
+def is_current(entry, fingerprint, output_dir):
+    return (entry is not None and entry.get("fingerprint") == fingerprint
+            and os.path.exists(os.path.join(output_dir, entry["weight_chart"]))
+            and os.path.exists(os.path.join(output_dir, entry["activity_chart"])))
+
+
+def render_all(output_dir=OUTPUT_DIR, client_ids=None, workers=None, force=False):
+    """Render every selected client whose data changed; returns (rendered, skipped, failed) counts."""
+    os.makedirs(output_dir, exist_ok=True)
+    db = Database()
+    if db.conn is None:
+        raise ConnectionError("Database connection is not available.")
+    try:
+        clients = {client["id"]: client["name"] for client in db.get_all_clients()}
+        fingerprints = db.get_chart_fingerprints()
+    finally:
+        db.close()
+    # The activity chart moves on every Monday even when no data changed
+    window_start = activity_window_start()
+    fingerprints = {client_id: f"{window_start.isoformat()}|{fingerprint}"
+                    for client_id, fingerprint in fingerprints.items()}
+
+    if client_ids:
+        missing = set(client_ids) - set(clients)
+        for client_id in sorted(missing):
+            print(f"⚠️ No client with ID {client_id}")
+        clients = {client_id: clients[client_id] for client_id in client_ids if client_id in clients}
+
+    manifest = load_manifest(output_dir)
+    entries = manifest.setdefault("clients", {})
+    todo = [client_id for client_id in clients
+            if force or not is_current(entries.get(str(client_id)), fingerprints.get(client_id), output_dir)]
+    skipped = len(clients) - len(todo)
+    failed = 0
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = {pool.submit(render_client, client_id, clients[client_id],
+                                   fingerprints.get(client_id), window_start, output_dir): client_id
+                       for client_id in todo}
+            for future in as_completed(futures):
+                client_id = futures[future]
+                try:
+                    entries[str(client_id)] = future.result()
+                except Exception as e:
+                    failed += 1
+                    print(f"❌ Failed to render charts for client {client_id}: {e}")
+
+    manifest["generated_at"] = datetime.now().isoformat(timespec="seconds")
+    save_manifest(output_dir, manifest)
+    return len(todo) - failed, skipped, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render client progress charts to PNG files.")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="Directory for the PNGs and manifest")
+    parser.add_argument("--clients", type=int, nargs="+", help="Only these client IDs (default: all)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="Re-render clients even if unchanged")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        rendered, skipped, failed = render_all(args.output, args.clients, args.workers, args.force)
+    except ConnectionError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ Rendered {rendered} clients, skipped {skipped} unchanged, {failed} failed "
+          f"in {time.perf_counter() - started:.2f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
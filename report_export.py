@@ -0,0 +1,188 @@
+# database/report_export.py
+
+import os
+import zlib
+from fpdf import FPDF
+
+ROW_HEIGHT = 8
+COLUMNS = (("Date", 40), ("Weight (Kgs)", 40), ("Notes", 110))
+
+# Layout in mm, as with FPDF's defaults: A4 portrait, 10 mm margins, 1 mm cell padding
+PAGE_WIDTH, PAGE_HEIGHT = 210.0, 297.0
+MARGIN = 10.0
+CELL_PADDING = 1.0
+SCALE = 72 / 25.4  # PDF points per mm
+
+FONTS = {"": ("F1", "Helvetica"), "B": ("F2", "Helvetica-Bold"), "I": ("F3", "Helvetica-Oblique")}
+CATALOG, PAGES = 1, 2
+FONT_OBJECTS = {"F1": 3, "F2": 4, "F3": 5}
+FIRST_PAGE_OBJECT = 6  # Page n (from 1) is content stream 4 + 2n and page object 5 + 2n
+
+
+def _latin1(text):
+    """The standard PDF fonts only cover Latin-1; replace anything else instead of failing."""
+    return str(text).encode("latin-1", "replace").decode("latin-1")
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").replace("\r", "")
+
+
+class ProgressReportPDF:
+    """Progress report, written to `path` one page at a time; the table header repeats on every page.
+
+    FPDF keeps every page in memory until output(), so pages are laid out
+    here and each is compressed and written as soon as it is full. Memory
+    use is one page plus a file offset per PDF object, however many rows
+    the report has. FPDF is only used to measure strings.
+    """
+
+    def __init__(self, path, title):
+        self.path = path
+        self.title = _latin1(title)
+        self.metrics = FPDF()  # Never gets a page
+        self.pages = 0
+        self.content = None  # Drawing operators of the page being filled
+        self.offsets = {}
+        self.x = self.y = MARGIN
+        self.file = open(path, "wb")
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for name, base_font in FONTS.values():
+            self._object(FONT_OBJECTS[name],
+                         f"<< /Type /Font /Subtype /Type1 /BaseFont /{base_font} /Encoding /WinAnsiEncoding >>")
+
+    def _write(self, data):
+        self.file.write(data if isinstance(data, bytes) else data.encode("latin-1"))
+
+    def _object(self, number, body, stream=None):
+        self.offsets[number] = self.file.tell()
+        self._write(f"{number} 0 obj\n{body}\n")
+        if stream is not None:
+            self._write(b"stream\n" + stream + b"\nendstream\n")
+        self._write("endobj\n")
+
+    def set_font(self, style, size):
+        self.metrics.set_font("Arial", style, size)
+        self.font = (style, size)
+
+    def cell(self, width, height, text, border=False, align="L"):
+        """Draw a cell at the current position and move right, like FPDF.cell(); width 0 runs to the margin."""
+        if width == 0:
+            width = PAGE_WIDTH - MARGIN - self.x
+        if border:
+            self.content.append(f"{self.x * SCALE:.2f} {(PAGE_HEIGHT - self.y) * SCALE:.2f} "
+                                f"{width * SCALE:.2f} {-height * SCALE:.2f} re S")
+        if text:
+            style, size = self.font
+            dx = (width - self.metrics.get_string_width(text)) / 2 if align == "C" else CELL_PADDING
+            baseline = self.y + 0.5 * height + 0.3 * size / SCALE
+            self.content.append(f"BT /{FONTS[style][0]} {size:.2f} Tf {(self.x + dx) * SCALE:.2f} "
+                                f"{(PAGE_HEIGHT - baseline) * SCALE:.2f} Td ({_escape(text)}) Tj ET")
+        self.x += width
+
+    def ln(self, height):
+        self.x = MARGIN
+        self.y += height
+
+    def start_page(self):
+        if self.content is not None:
+            self._end_page()
+        self.pages += 1
+        self.content = []
+        self.x = self.y = MARGIN
+        if self.pages == 1:
+            self.set_font("B", 16)
+            self.cell(0, 10, self.title, align="C")
+            self.ln(15)
+        self.set_font("B", 12)
+        for heading, width in COLUMNS:
+            self.cell(width, ROW_HEIGHT, heading, border=True)
+        self.ln(ROW_HEIGHT)
+        self.set_font("", 11)
+
+    def _end_page(self):
+        """Add the footer and write the page out."""
+        self.x, self.y = MARGIN, PAGE_HEIGHT - 12
+        self.set_font("I", 8)
+        self.cell(0, 8, f"Page {self.pages}", align="C")
+        stream = zlib.compress("\n".join(self.content).encode("latin-1"))
+        number = FIRST_PAGE_OBJECT + 2 * (self.pages - 1)
+        fonts = " ".join(f"/{name} {obj} 0 R" for name, obj in FONT_OBJECTS.items())
+        self._object(number, f"<< /Filter /FlateDecode /Length {len(stream)} >>", stream)
+        self._object(number + 1, f"<< /Type /Page /Parent {PAGES} 0 R "
+                                 f"/MediaBox [0 0 {PAGE_WIDTH * SCALE:.2f} {PAGE_HEIGHT * SCALE:.2f}] "
+                                 f"/Resources << /Font << {fonts} >> >> /Contents {number} 0 R >>")
+        self.content = None
+
+    def clip(self, text, width):
+        """Longest prefix of `text` that fits in `width` (binary search; widths grow with length)."""
+        if self.metrics.get_string_width(text) <= width:
+            return text
+        low, high = 0, len(text)  # text[:low] fits, text[:high] does not
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.metrics.get_string_width(text[:middle]) <= width:
+                low = middle
+            else:
+                high = middle
+        return text[:low]
+
+    def write_row(self, values):
+        if self.content is None or self.y + ROW_HEIGHT > PAGE_HEIGHT - 15:
+            self.start_page()
+        for value, (_, width) in zip(values, COLUMNS):
+            text = "" if value is None else _latin1(value)
+            self.cell(width, ROW_HEIGHT, self.clip(text, width - 2), border=True)  # Never overflow the cell
+        self.ln(ROW_HEIGHT)
+
+    def close(self):
+        """Write the last page, the page tree and the cross-reference table."""
+        if self.content is None and self.pages == 0:
+            self.start_page()
+        if self.content is not None:
+            self._end_page()
+        kids = " ".join(f"{FIRST_PAGE_OBJECT + 2 * page + 1} 0 R" for page in range(self.pages))
+        self._object(PAGES, f"<< /Type /Pages /Kids [{kids}] /Count {self.pages} >>")
+        self._object(CATALOG, f"<< /Type /Catalog /Pages {PAGES} 0 R >>")
+        xref = self.file.tell()
+        size = len(self.offsets) + 1
+        self._write(f"xref\n0 {size}\n0000000000 65535 f \n")
+        for number in range(1, size):
+            self._write(f"{self.offsets[number]:010d} 00000 n \n")
+        self._write(f"trailer\n<< /Size {size} /Root {CATALOG} 0 R >>\nstartxref\n{xref}\n%%EOF\n")
+        self.file.close()
+
+    def abort(self):
+        """Close and delete a half-written file."""
+        self.file.close()
+        os.remove(self.path)
+
+
+def export_progress_pdf(db, path, client_id, start_date=None, end_date=None, on_progress=None, title=None):
+    """Stream a client's progress rows from `db` into a PDF at `path`; returns the row count.
+
+    Rows are read in batches with Database.iter_progress, and each page is
+    written to `path` as soon as it is full, so memory use does not grow
+    with the report. `on_progress(done, total)` is called after each batch.
+    A failed export leaves no file behind.
+    """
+    total = db.count_progress(client_id, start_date, end_date)
+    pdf = ProgressReportPDF(path, title or f"Client Progress Report - ID {client_id}")
+    done = 0
+    try:
+        if on_progress is not None:
+            on_progress(done, total)
+        for rows in db.iter_progress(client_id, start_date, end_date):
+            for log_date, weight, notes in rows:
+                pdf.write_row((log_date.strftime("%Y-%m-%d"), weight, notes or ""))
+            done += len(rows)
+            if on_progress is not None:
+                on_progress(done, total)
+        if done == 0:
+            pdf.start_page()
+            pdf.cell(0, ROW_HEIGHT, "No progress recorded in this period.")
+        pdf.close()
+    except BaseException:
+        pdf.abort()
+        raise
+    return done
@@ -1,19 +1,24 @@
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QComboBox, QRadioButton,
-    QDateEdit, QLineEdit, QTableWidget, QTableWidgetItem, QHBoxLayout, QMessageBox
+    QDateEdit, QLineEdit, QTableWidget, QTableWidgetItem, QHBoxLayout, QMessageBox, QProgressBar
 )
-from PyQt5.QtCore import Qt, QDate
-from fpdf import FPDF
+from PyQt5.QtCore import Qt, QDate, QObject, pyqtSignal
+from database.async_db import AsyncDatabase
+from core.services import ReportService, task
 
-# ✅ Import Database Properly
-try:
-    from database.db_config import database
 
-    db = Database()
+class ExportProgress(QObject):
+    """Carries progress from the export worker thread to the GUI thread."""
+    progress = pyqtSignal(int, int)  # rows written, total rows
+
+
+PROGRESS_COLUMNS = ["Date", "Weight (Kgs)", "Notes"]
+SUMMARY_COLUMNS = [
+    ("Period", "period"), ("Entries", "entries"), ("Start", "start_weight"), ("End", "end_weight"),
+    ("Change", "change"), ("Min", "min_weight"), ("Max", "max_weight"), ("Mean", "mean_weight"),
+    ("Active Min", "minutes"), ("Calories", "calories"), ("Sessions", "sessions"),
+]
 
-except Exception as e:
-    print(f"Database Connection Error: {e}")
-    db = None  # Prevents crashes
 
 class ReportsWindow(QWidget):
     def __init__(self):
@@ -21,6 +26,8 @@ class ReportsWindow(QWidget):
         self.setWindowTitle("Generate Reports")
         self.setGeometry(100, 100, 600, 500)
 
+        self.db = AsyncDatabase(self)  # ✅ Queries run on worker threads
+
         layout = QVBoxLayout()
 
         # Report Type Selection
@@ -71,8 +78,8 @@ class ReportsWindow(QWidget):
 
         # Table Display
         self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Date", "Weight (Kgs)", "Notes"])
+        self.table.setColumnCount(len(PROGRESS_COLUMNS))
+        self.table.setHorizontalHeaderLabels(PROGRESS_COLUMNS)
         layout.addWidget(self.table)
 
         # Export to PDF Button
@@ -80,14 +87,17 @@ class ReportsWindow(QWidget):
         self.btn_export_pdf.clicked.connect(self.export_to_pdf)
         layout.addWidget(self.btn_export_pdf)
 
+        self.export_progress_bar = QProgressBar()
+        self.export_progress_bar.hide()
+        layout.addWidget(self.export_progress_bar)
+
+        self.export_progress = ExportProgress()  # No parent: an export may outlive the window
+        self.export_progress.progress.connect(self.update_export_progress)
+
         self.setLayout(layout)
 
     def load_report_data(self):
         """Fetch progress data based on selected filters."""
-        if db is None:
-            QMessageBox.critical(self, "Database Error", "Database connection is not available.")
-            return
-
         client_id = self.client_id_input.text().strip()
         start_date = self.start_date.date().toString("yyyy-MM-dd")
         end_date = self.end_date.date().toString("yyyy-MM-dd")
@@ -96,59 +106,76 @@ class ReportsWindow(QWidget):
             QMessageBox.warning(self, "Input Error", "Please enter a Client ID.")
             return
 
-        try:
-            progress_data = db.get_progress(client_id, start_date, end_date)
-
-            if not progress_data:
-                QMessageBox.warning(self, "No Data", "No progress data found for this client in the selected period.")
-                return
+        on_error = lambda e: QMessageBox.critical(self, "Database Error", f"Failed to load data: {e}")
+        if self.monthly_report.isChecked() or self.seasonal_report.isChecked():
+            # Aggregated in SQL: one row per month or season however long the range is
+            period = "month" if self.monthly_report.isChecked() else "season"
+            self.db.submit("report", task(ReportService, "summary"), client_id, period, start_date, end_date,
+                           on_result=self.show_summary_data, on_error=on_error)
+        else:
+            self.db.submit("report", "get_progress", client_id, start_date, end_date,
+                           on_result=self.show_report_data, on_error=on_error)
+
+    def show_summary_data(self, summary):
+        if not summary:
+            QMessageBox.warning(self, "No Data", "No progress data found for this client in the selected period.")
+            return
 
-            self.table.setRowCount(len(progress_data))
-            for row, data in enumerate(progress_data):
-                self.table.setItem(row, 0, QTableWidgetItem(data["date"]))
-                self.table.setItem(row, 1, QTableWidgetItem(str(data["weight"])))
-                self.table.setItem(row, 2, QTableWidgetItem(data["notes"]))
+        self.table.setColumnCount(len(SUMMARY_COLUMNS))
+        self.table.setHorizontalHeaderLabels([heading for heading, _ in SUMMARY_COLUMNS])
+        self.table.setRowCount(len(summary))
+        for row, data in enumerate(summary):
+            for column, (_, key) in enumerate(SUMMARY_COLUMNS):
+                value = data[key]
+                self.table.setItem(row, column, QTableWidgetItem("" if value is None else str(value)))
+
+    def show_report_data(self, progress_data):
+        if not progress_data:
+            QMessageBox.warning(self, "No Data", "No progress data found for this client in the selected period.")
+            return
 
-        except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"Failed to load data: {e}")
+        self.table.setColumnCount(len(PROGRESS_COLUMNS))
+        self.table.setHorizontalHeaderLabels(PROGRESS_COLUMNS)
+        self.table.setRowCount(len(progress_data))
+        for row, data in enumerate(progress_data):
+            self.table.setItem(row, 0, QTableWidgetItem(str(data["date"])))
+            self.table.setItem(row, 1, QTableWidgetItem(str(data["weight"])))
+            self.table.setItem(row, 2, QTableWidgetItem(data["notes"]))
 
     def export_to_pdf(self):
-        """Export report data to a PDF file."""
-        if db is None:
-            QMessageBox.critical(self, "Database Error", "Database connection is not available.")
-            return
-
+        """Export the filtered progress rows to a PDF, streamed straight from the database."""
         client_id = self.client_id_input.text().strip()
         if not client_id:
             QMessageBox.warning(self, "Input Error", "Please enter a Client ID.")
             return
 
-        try:
-            pdf = FPDF()
-            pdf.set_auto_page_break(auto=True, margin=15)
-            pdf.add_page()
-            pdf.set_font("Arial", "B", 16)
-            pdf.cell(200, 10, f"Client Progress Report - ID {client_id}", ln=True, align="C")
-            pdf.ln(10)
-
-            pdf.set_font("Arial", size=12)
-            pdf.cell(40, 10, "Date", 1)
-            pdf.cell(40, 10, "Weight (Kgs)", 1)
-            pdf.cell(110, 10, "Notes", 1)
-            pdf.ln()
-
-            for row in range(self.table.rowCount()):
-                pdf.cell(40, 10, self.table.item(row, 0).text(), 1)
-                pdf.cell(40, 10, self.table.item(row, 1).text(), 1)
-                pdf.cell(110, 10, self.table.item(row, 2).text(), 1)
-                pdf.ln()
-
-            pdf_filename = "client_progress_report.pdf"
-            pdf.output(pdf_filename)
-            QMessageBox.information(self, "Success", f"PDF Exported Successfully as {pdf_filename}")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export PDF: {e}")
+        start_date = self.start_date.date().toString("yyyy-MM-dd")
+        end_date = self.end_date.date().toString("yyyy-MM-dd")
+        pdf_filename = f"client_{client_id}_{start_date}_{end_date}.pdf"
+
+        def exported(count):
+            self.btn_export_pdf.setEnabled(True)
+            self.export_progress_bar.hide()
+            QMessageBox.information(self, "Success", f"PDF Exported Successfully as {pdf_filename} ({count} rows)")
+
+        def failed(error):
+            self.btn_export_pdf.setEnabled(True)
+            self.export_progress_bar.hide()
+            QMessageBox.critical(self, "Export Error", f"Failed to export PDF: {error}")
+
+        self.btn_export_pdf.setEnabled(False)
+        self.export_progress_bar.setRange(0, 0)  # Busy until the row count arrives
+        self.export_progress_bar.show()
+        self.db.run(task(ReportService, "export_pdf"), pdf_filename, client_id, start_date, end_date,
+                    self.export_progress.progress.emit, on_result=exported, on_error=failed)
+
+    def update_export_progress(self, done, total):
+        self.export_progress_bar.setRange(0, max(total, 1))
+        self.export_progress_bar.setValue(done)
+
+    def closeEvent(self, event):
+        self.db.shutdown()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication([])
@@ -0,0 +1,280 @@
+# core/services.py
+#
+# Plain-Python business logic shared by the Qt screens and cli.py. Nothing in
+# here may import PyQt5. Services wrap a Database (or the client roster store)
+# and raise ServiceError for input the user has to correct.
+
+import functools
+import uuid
+from datetime import date, timedelta
+from database.activity_catalog import activity_catalog
+from database.activity_catalog import save_activity as _save_activity, delete_activity as _delete_activity
+from database.calorie_engine import CalorieEngine, recalculate_activity_log
+from database.client_store import ClientStore
+from database.database import REMINDER_PAGE_SIZE
+from database.progress_cache import progress_cache
+from database.progress_store import build_progress_store
+from database.reminder_import import STATUSES, import_reminder_file
+
+CLIENTS_FILE = "clients.json"
+CLIENT_FIELDS = ("name", "age", "weight", "goal")
+
+
+class ServiceError(ValueError):
+    """Invalid input; the message is meant to be shown to the user as is."""
+
+
+def _parse_date(value, field="Date"):
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        raise ServiceError(f"{field} must be in YYYY-MM-DD format.") from None
+
+
+def _parse_month(value):
+    try:
+        return date.fromisoformat(f"{value}-01").strftime("%Y-%m")
+    except ValueError:
+        raise ServiceError("Month must be in YYYY-MM format.") from None
+
+
+@functools.lru_cache(maxsize=None)
+def task(service_class, method_name):
+    """Worker callable `f(db, *args)` running `service_class(db).method_name(*args)`.
+
+    For AsyncDatabase.submit()/run(); the same callable is returned for the
+    same method, so identical requests still coalesce.
+    """
+    def run(db, *args):
+        return getattr(service_class(db), method_name)(*args)
+    run.__name__ = f"{service_class.__name__}.{method_name}"
+    return run
+
+
+class ClientService:
+    """Client roster CRUD on top of the journaled ClientStore."""
+
+    def __init__(self, store):
+        self.store = store
+
+    @classmethod
+    def open(cls, path=CLIENTS_FILE):
+        return cls(ClientStore(path))
+
+    @property
+    def clients(self):
+        return self.store.clients
+
+    def get(self, client_id):
+        return self.store.clients.get(client_id)
+
+    def _details(self, details):
+        details = {field: str(details.get(field, "")).strip() for field in CLIENT_FIELDS}
+        if not all(details.values()):
+            raise ServiceError("All fields are required!")
+        return details
+
+    def add(self, client_id, **details):
+        client_id = str(client_id).strip()
+        details = self._details(details)
+        if not client_id:
+            raise ServiceError("All fields are required!")
+        if client_id in self.store.clients:
+            raise ServiceError("Client ID already exists!")
+        self.store.put(client_id, details)
+        return details
+
+    def update(self, client_id, **details):
+        if client_id not in self.store.clients:
+            raise ServiceError("Client does not exist!")
+        details = self._details(details)
+        self.store.put(client_id, details)
+        return details
+
+    def delete(self, client_id):
+        if client_id not in self.store.clients:
+            raise ServiceError("Client does not exist!")
+        self.store.delete(client_id)
+
+    def close(self):
+        self.store.close()
+
+
+class ActivityService:
+    """Activity catalog, calorie maths and activity logging.
+
+    With a write-behind `buffer` (the GUI's), log() queues rows; without one it
+    writes them straight through `db`.
+    """
+
+    def __init__(self, db=None, buffer=None):
+        self.db = db
+        self.buffer = buffer
+        self._engine = None
+
+    def catalog(self):
+        return activity_catalog.get(self.db)
+
+    def use_catalog(self, catalog):
+        """Compute with an already loaded catalog instead of fetching one."""
+        self._engine = CalorieEngine(catalog)
+
+    def engine(self):
+        if self._engine is None:
+            self.use_catalog(self.catalog())
+        return self._engine
+
+    def save_activity(self, name, met):
+        name = name.strip()
+        if not name or met <= 0:
+            raise ServiceError("An activity needs a name and a positive MET value.")
+        _save_activity(self.db, name, met)
+
+    def delete_activity(self, name):
+        _delete_activity(self.db, name)
+
+    def estimate(self, activity, weight_kg, minutes):
+        return self.engine().preview(activity, weight_kg, minutes)
+
+    def log(self, client_id, activity, minutes, weight_kg=None):
+        """Record an activity done today and return the logged row.
+
+        Without `weight_kg` the client's weight is looked up through `db`; the
+        engine's default weight is used only when none is on record.
+        """
+        if not client_id:
+            raise ServiceError("Select a client first.")
+        if minutes <= 0:
+            raise ServiceError("Duration must be at least one minute.")
+        if activity not in self.engine().met_table:
+            raise ServiceError(f"Unknown activity {activity!r}; add it to the catalog first.")
+        if weight_kg is None and self.db is not None:
+            weight_kg = self.db.get_client_weight(client_id)
+        calories = self.estimate(activity, weight_kg, minutes)
+        if self.buffer is not None:
+            return self.buffer.add(client_id, activity, minutes, calories)
+        row = {"entry_id": uuid.uuid4().hex, "client_id": client_id, "activity": activity,
+               "duration": minutes, "calories_burned": calories, "log_date": date.today().isoformat()}
+        self.db.log_activities_bulk([(row["entry_id"], client_id, activity, minutes, calories, row["log_date"])])
+        return row
+
+    def today(self, client_id):
+        return self.db.get_today_activity_log(client_id)
+
+    def totals(self, client_id, period="day", start_date=None, end_date=None):
+        return self.db.get_activity_totals(client_id, period, start_date, end_date)
+
+    def recalculate_calories(self):
+        """Recompute every logged activity's calories from the current MET table."""
+        return recalculate_activity_log(self.db, self.engine())
+
+    def rebuild_rollups(self):
+        self.db.rebuild_activity_rollups()
+
+
+class ProgressService:
+    """Weight progress entries, cached series and summaries."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def history(self, client_id, start_date=None, end_date=None):
+        return self.db.get_progress(client_id, start_date, end_date)
+
+    def series(self, client_id):
+        return progress_cache.get(self.db, client_id)
+
+    def add(self, client_id, entry_date, weight, notes=""):
+        if not client_id:
+            raise ServiceError("Select a client first.")
+        entry_date = _parse_date(entry_date)
+        try:
+            weight = float(weight)
+        except (TypeError, ValueError):
+            raise ServiceError("Weight must be a number.") from None
+        if weight <= 0:
+            raise ServiceError("Weight must be positive.")
+        self.db.add_progress(client_id, entry_date.isoformat(), weight, notes)
+
+    def add_and_fetch(self, client_id, entry_date, weight, notes=""):
+        """Add an entry and return the client's refreshed history."""
+        self.add(client_id, entry_date, weight, notes)
+        return self.history(client_id)
+
+    def summary(self, client_id, period="month", start_date=None, end_date=None):
+        if period not in ("month", "season"):
+            raise ServiceError(f"Unknown summary period {period!r}.")
+        return self.db.get_progress_summary(client_id, period, start_date, end_date)
+
+    def build_store(self, path=None):
+        return build_progress_store(self.db, path)
+
+
+class ReminderService:
+    """Reminder validation, paging, import and overdue handling."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def page(self, after=None, limit=REMINDER_PAGE_SIZE, status=None, start_date=None, end_date=None):
+        return self.db.get_reminders_page(after, limit, status, start_date, end_date)
+
+    def save(self, client_id, reminder_date, message, status="Pending"):
+        """Save a reminder and return it, with its new id."""
+        client_id = str(client_id).strip()
+        message = message.strip()
+        if not client_id or not message:
+            raise ServiceError("Please enter a Client ID and Message.")
+        if status not in STATUSES:
+            raise ServiceError(f"Unknown status {status!r}.")
+        reminder_date = _parse_date(reminder_date, "Reminder date").isoformat()
+        reminder_id = self.db.save_reminder(client_id, reminder_date, message, status)
+        return {"id": reminder_id, "client_id": client_id, "reminder_date": reminder_date,
+                "message": message, "status": status}
+
+    def delete(self, reminder_id):
+        return self.db.delete_reminder(reminder_id)
+
+    def import_file(self, path):
+        """Bulk-load a CSV/JSON reminder file; returns (count, seconds)."""
+        try:
+            return import_reminder_file(self.db, path)
+        except ValueError as e:  # Bad rows, unsupported file types and malformed JSON
+            raise ServiceError(str(e)) from None
+
+    def due(self, days=7, today=None):
+        today = today or date.today()
+        return self.db.get_pending_reminders(today, today + timedelta(days=days))
+
+    def mark_overdue(self, today=None):
+        return self.db.mark_overdue_reminders(today or date.today())
+
+
+class ReportService:
+    """Report summaries, PDF exports and the batch jobs behind them."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def summary(self, client_id, period="month", start_date=None, end_date=None):
+        return ProgressService(self.db).summary(client_id, period, start_date, end_date)
+
+    def export_pdf(self, path, client_id, start_date=None, end_date=None, on_progress=None):
+        """Stream a client's progress into a PDF; returns the number of rows written."""
+        if not str(client_id).strip():
+            raise ServiceError("Please enter a Client ID.")
+        from database.report_export import export_progress_pdf  # fpdf is only needed here
+        return export_progress_pdf(self.db, path, client_id, start_date, end_date, on_progress)
+
+    @staticmethod
+    def monthly_batch(month, output_dir=None, client_ids=None, workers=None, force=False):
+        """Month-end reports for every active client; workers open their own connections."""
+        import batch_reports
+        return batch_reports.run_batch(_parse_month(month), output_dir or batch_reports.OUTPUT_DIR, client_ids,
+                                       workers, force)
+
+    @staticmethod
+    def render_charts(output_dir=None, client_ids=None, workers=None, force=False):
+        """Headless chart PNGs for every client whose data changed."""
+        import render_charts
+        return render_charts.render_all(output_dir or render_charts.OUTPUT_DIR, client_ids, workers, force)
@@ -1,18 +1,11 @@
 # ui/signup.py
 
 import sys
-import mysql.connector
 from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QMessageBox
 from PyQt5.QtGui import QFont
+from database.async_db import AsyncDatabase
+from database.credentials import register
 
-# Database connection function
-def get_db_connection():
-    return mysql.connector.connect(
-        host="localhost",
-        user="root",  # Change if needed
-        password="Welcome@123456",  # Change if needed
-        database="fitness_tracker"
-    )
 
 class SignupScreen(QWidget):
     def __init__(self):
@@ -20,6 +13,7 @@ class SignupScreen(QWidget):
         self.confirm_input = None
         self.password_input = None
         self.username_input = None
+        self.db = AsyncDatabase(self)  # ✅ Hashing runs on a worker thread
         self.init_ui()
 
     def init_ui(self):
@@ -49,10 +43,10 @@ class SignupScreen(QWidget):
         self.confirm_input.setEchoMode(QLineEdit.Password)
 
         # Sign Up Button
-        signup_button = QPushButton("Sign Up")
-        signup_button.setFont(QFont("Arial", 12))
-        signup_button.setStyleSheet("background-color: #4CAF50; color: white; padding: 10px;")
-        signup_button.clicked.connect(self.signup_user)
+        self.signup_button = QPushButton("Sign Up")
+        self.signup_button.setFont(QFont("Arial", 12))
+        self.signup_button.setStyleSheet("background-color: #4CAF50; color: white; padding: 10px;")
+        self.signup_button.clicked.connect(self.signup_user)
 
         # Back to Login Button
         back_button = QPushButton("Back to Login")
@@ -69,7 +63,7 @@ class SignupScreen(QWidget):
         layout.addWidget(self.password_input)
         layout.addWidget(confirm_label)
         layout.addWidget(self.confirm_input)
-        layout.addWidget(signup_button)
+        layout.addWidget(self.signup_button)
         layout.addWidget(back_button)
 
         self.setLayout(layout)
@@ -87,27 +81,24 @@ class SignupScreen(QWidget):
             QMessageBox.warning(self, "Error", "Passwords do not match.")
             return
 
-        try:
-            conn = get_db_connection()
-            cursor = conn.cursor()
-
-            # Check if username already exists
-            cursor.execute("SELECT * FROM users WHERE username = %s", (username,))
-            existing_user = cursor.fetchone()
-
-            if existing_user:
+        def registered(created):
+            self.signup_button.setEnabled(True)
+            if not created:
                 QMessageBox.warning(self, "Error", "Username already exists.")
             else:
-                # Insert new user with SHA-256 hashed password
-                cursor.execute("INSERT INTO users (username, password) VALUES (%s, SHA2(%s, 256))", (username, password))
-                conn.commit()
                 QMessageBox.information(self, "Success", "Account created successfully! You can now log in.")
                 self.close()
 
-            conn.close()
+        def failed(error):
+            self.signup_button.setEnabled(True)
+            QMessageBox.critical(self, "Database Error", f"An error occurred: {error}")
+
+        self.signup_button.setEnabled(False)
+        self.db.run(register, username, password, on_result=registered, on_error=failed)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Database Error", f"An error occurred: {str(e)}")
+    def closeEvent(self, event):
+        self.db.shutdown()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,77 @@
+# startup_benchmark.py
+#
+# Measures cold import time of the dashboard and every feature screen, each in
+# a fresh interpreter so one module's imports don't warm the cache for the next.
+#
+#   python startup_benchmark.py --repeat 5 --output startup.json
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = [
+    "ui.dashboard",
+    "ui.client_management",
+    "ui.track_progress",
+    "ui.reports",
+    "ui.charts",
+    "ui.reminders",
+    "ui.activity_tracking",
+]
+
+_PROBE = (
+    "import time, importlib;"
+    "t = time.perf_counter();"
+    "importlib.import_module({module!r});"
+    "print(time.perf_counter() - t)"
+)
+
+
+def time_import(module):
+    """Seconds taken to import `module` in a new Python process."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exited with status {result.returncode}")
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def run(modules=MODULES, repeat=3):
+    results = {}
+    for module in modules:
+        try:
+            samples = [time_import(module) for _ in range(repeat)]
+        except RuntimeError as e:
+            results[module] = {"error": str(e)}
+            print(f"❌ {module}: {e}")
+            continue
+        results[module] = {
+            "median_ms": statistics.median(samples) * 1000,
+            "min_ms": min(samples) * 1000,
+            "samples_ms": [s * 1000 for s in samples],
+        }
+        print(f"{module:<28} {results[module]['median_ms']:8.1f} ms")
+    return {"python": sys.version.split()[0], "timestamp": time.time(), "repeat": repeat, "modules": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record per-module import time for the GUI.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    report = run(args.modules, args.repeat)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# test_calorie_engine.py
+#
+#   python -m unittest test_calorie_engine
+
+import unittest
+from database.calorie_engine import DEFAULT_WEIGHT_KG, CalorieEngine
+
+MET_TABLE = {"Running": 9.8, "Yoga": 2.5}
+
+
+class CalorieEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = CalorieEngine(MET_TABLE)
+
+    def test_preview_matches_compute(self):
+        rows = [("Running", 82.5, 30), ("Yoga", None, 45), ("Running", 0, 20), ("Yoga", -3.0, 60),
+                ("Running", float("nan"), 10), ("Unknown", 70.0, 30)]
+        activities, weights, minutes = zip(*rows)
+        computed = [round(value, 1) for value in self.engine.compute(activities, weights, minutes).tolist()]
+        previews = [self.engine.preview(activity, weight, duration) for activity, weight, duration in rows]
+        self.assertEqual(previews, computed)
+
+    def test_missing_and_non_positive_weights_use_the_default(self):
+        expected = self.engine.preview("Running", DEFAULT_WEIGHT_KG, 60)
+        for weight in (None, 0, -70.0, float("nan")):
+            self.assertEqual(self.engine.preview("Running", weight, 60), expected)
+        self.assertEqual(self.engine.compute(["Running"], [-70.0], [60]).tolist(), [9.8 * DEFAULT_WEIGHT_KG])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# test_client_search.py
+#
+#   python -m unittest test_client_search
+
+import random
+import time
+import unittest
+from database.client_search import ClientSearchIndex
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn"]
+LAST_NAMES = ["Smith", "Jones", "Brown", "Garcia", "Miller", "Davis", "Wilson", "Moore", "Clark", "Lewis"]
+GOALS = ["Lose weight", "Build muscle", "Endurance", "Flexibility", "General fitness"]
+
+
+class ClientSearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = ClientSearchIndex.from_clients([
+            {"id": "101", "name": "Jordan Smith", "goal": "Lose weight"},
+            {"id": "102", "name": "Jordana Brown", "goal": "Endurance"},
+            {"id": "205", "name": "Sam Garcia", "goal": "Build muscle"},
+        ])
+
+    def test_prefix_matches_any_word(self):
+        self.assertEqual(sorted(self.index.search("jor", fuzzy=False)), ["101", "102"])
+        self.assertEqual(self.index.search("smi", fuzzy=False), ["101"])
+        self.assertEqual(sorted(self.index.search("10", fuzzy=False)), ["101", "102"])
+
+    def test_every_word_must_match(self):
+        self.assertEqual(self.index.search("jor bro"), ["102"])
+        self.assertEqual(self.index.search("sam endurance"), [])
+
+    def test_case_is_folded(self):
+        self.assertEqual(self.index.search("GARCIA"), ["205"])
+        self.assertEqual(self.index.search("sMiTh JoRdAn"), ["101"])
+
+    def test_substring_inside_a_word_matches_through_trigrams(self):
+        self.assertIn("205", self.index.search("arcia"))
+        self.assertEqual(self.index.search("arcia", fuzzy=False), [])
+
+    def test_ids_match_by_prefix_only(self):
+        self.assertEqual(self.index.search("20"), ["205"])
+        self.assertEqual(self.index.search("05"), [])
+
+
+class ClientSearchIndexSpeedTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(42)
+        cls.index = ClientSearchIndex.from_clients(
+            {"id": str(client_id), "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+             "goal": rng.choice(GOALS)}
+            for client_id in range(100000))
+
+    def test_prefix_lookup_on_100k_clients_is_sub_millisecond(self):
+        self.assertEqual(len(self.index), 100000)
+        for query in ("jor", "mil", "12345"):
+            timings = []
+            for _ in range(5):
+                started = time.perf_counter()
+                results = self.index.search(query)
+                timings.append(time.perf_counter() - started)
+            self.assertTrue(results)
+            self.assertLess(min(timings), 0.001, f"{query!r} took {min(timings) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    unittest.main()
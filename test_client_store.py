@@ -0,0 +1,49 @@
+# test_client_store.py
+#
+#   python -m unittest test_client_store
+
+import json
+import os
+import tempfile
+import unittest
+from database.client_store import ClientStore
+
+
+class ClientStoreReplayTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "clients.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_journal(self, records, tail):
+        with open(self.path + ".journal", "wb") as file:
+            for record in records:
+                file.write(json.dumps(record).encode() + b"\n")
+            file.write(tail)
+
+    def test_truncated_last_line_is_dropped(self):
+        self.write_journal([
+            {"op": "put", "id": "1", "data": {"name": "Jordan Smith"}},
+            {"op": "put", "id": "2", "data": {"name": "Sam Garcia"}},
+        ], b'{"op":"delete","id":"1"')  # Crash part-way through the third record
+        store = ClientStore(self.path)
+        self.assertEqual(store.clients, {"1": {"name": "Jordan Smith"}, "2": {"name": "Sam Garcia"}})
+
+        store.put("3", {"name": "Casey Brown"})
+        store.close()
+        self.assertEqual(ClientStore(self.path).clients["3"], {"name": "Casey Brown"})
+
+    def test_complete_record_without_newline_is_not_replayed(self):
+        self.write_journal([{"op": "put", "id": "1", "data": {"name": "Jordan Smith"}}],
+                           b'{"op":"delete","id":"1"}')  # The newline never reached the disk
+        store = ClientStore(self.path)
+        self.assertIn("1", store.clients)
+        store.close()
+        with open(self.path + ".journal", "rb") as file:
+            self.assertTrue(file.read().endswith(b"}\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# test_credentials.py
+#
+#   python -m unittest test_credentials
+
+import hashlib
+import unittest
+from database.credentials import authenticate, needs_rehash, verify_password
+
+
+class FakeUsers:
+    """Stands in for Database: just the two calls authenticate() makes."""
+
+    def __init__(self, hashes):
+        self.hashes = dict(hashes)
+        self.updates = []
+
+    def get_password_hash(self, username):
+        return self.hashes.get(username)
+
+    def set_password_hash(self, username, stored):
+        self.updates.append(username)
+        self.hashes[username] = stored
+        return True
+
+
+def legacy_hash(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+class CredentialsTest(unittest.TestCase):
+    def test_legacy_sha256_hash_verifies_and_needs_rehash(self):
+        stored = legacy_hash("s3cret")
+        self.assertTrue(verify_password("s3cret", stored))
+        self.assertTrue(verify_password("s3cret", stored.upper()))
+        self.assertTrue(needs_rehash(stored))
+
+    def test_login_with_legacy_hash_upgrades_it(self):
+        db = FakeUsers({"coach": legacy_hash("s3cret")})
+        self.assertTrue(authenticate(db, "coach", "s3cret"))
+        self.assertEqual(db.updates, ["coach"])
+        upgraded = db.hashes["coach"]
+        self.assertNotEqual(upgraded, legacy_hash("s3cret"))
+        self.assertFalse(needs_rehash(upgraded))
+        self.assertTrue(verify_password("s3cret", upgraded))
+
+        self.assertTrue(authenticate(db, "coach", "s3cret"))
+        self.assertEqual(db.updates, ["coach"])  # Already current; not rehashed again
+
+    def test_wrong_password_is_rejected_without_rehash(self):
+        db = FakeUsers({"coach": legacy_hash("s3cret")})
+        self.assertFalse(verify_password("guess", db.hashes["coach"]))
+        self.assertFalse(authenticate(db, "coach", "guess"))
+        self.assertFalse(authenticate(db, "nobody", "s3cret"))
+        self.assertEqual(db.updates, [])
+        self.assertEqual(db.hashes["coach"], legacy_hash("s3cret"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+# test_progress_cache.py
+#
+#   python -m unittest test_progress_cache
+
+import unittest
+from database.progress_cache import ProgressSeries
+
+
+class ProgressSeriesFromRowsTest(unittest.TestCase):
+    def test_entries_without_weight_are_skipped(self):
+        series = ProgressSeries.from_rows([
+            {"date": "2026-01-01", "weight": 82.5, "notes": ""},
+            {"date": "2026-01-08", "weight": None, "notes": "Missed weigh-in"},
+            {"date": "2026-01-15", "weight": 81.0, "notes": ""},
+        ])
+        self.assertEqual(series.dates(), ["2026-01-01", "2026-01-15"])
+        self.assertEqual(series.y.tolist(), [82.5, 81.0])
+
+    def test_no_weighed_entries_gives_an_empty_series(self):
+        series = ProgressSeries.from_rows([{"date": "2026-01-08", "weight": None, "notes": ""}])
+        self.assertEqual(len(series), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
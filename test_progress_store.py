@@ -0,0 +1,62 @@
+# test_progress_store.py
+#
+#   python -m unittest test_progress_store
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from database.progress_store import DAYS_FILE, ProgressStore
+
+
+class ProgressStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_appends_are_read_back_in_day_order(self):
+        store = ProgressStore(self.path)
+        store.append(7, [20002, 20000], [81.5, 82.0])
+        store.append(7, [20001], [81.8])
+        days, weights = store.read(7)
+        self.assertEqual(days.tolist(), [20000, 20001, 20002])
+        self.assertEqual(weights.tolist(), np.array([82.0, 81.8, 81.5], dtype=np.float32).tolist())
+
+    def test_commits_from_another_instance_are_seen_on_the_next_read(self):
+        reader = ProgressStore(self.path)
+        writer = ProgressStore(self.path)  # Stands in for a second process
+        writer.append(3, [20000], [70.0])
+        self.assertEqual(reader.read(3)[0].tolist(), [20000])
+        reader.append(3, [20001], [69.5])
+        self.assertEqual(writer.read(3)[0].tolist(), [20000, 20001])
+
+    def test_rows_written_past_the_index_are_dropped_by_the_next_writer(self):
+        store = ProgressStore(self.path)
+        store.append(1, [20000], [90.0])
+        with open(os.path.join(self.path, DAYS_FILE.format(generation=store.generation)), "ab") as file:
+            file.write(np.array([20005], dtype=np.int64).tobytes())  # A crash before the index update
+        store = ProgressStore(self.path)
+        store.append(1, [20001], [89.0])
+        self.assertEqual(store.read(1)[0].tolist(), [20000, 20001])
+
+    def test_replace_and_compact_keep_one_extent_per_client(self):
+        store = ProgressStore(self.path)
+        store.append(9, [19000], [60.0])
+        store.replace([
+            (np.array([1, 1, 2]), np.array([20000, 20001, 20000]), np.array([80.0, 79.5, 95.0])),
+            (np.array([2]), np.array([20003]), np.array([94.0])),  # Client 2 continues in the next batch
+        ])
+        self.assertEqual(store.client_ids(), [1, 2])
+        self.assertEqual(len(store.index), 2)
+        store.append(1, [20002], [79.0])
+        store.compact()
+        self.assertEqual(len(store.index), 2)
+        self.assertEqual(store.read(1)[0].tolist(), [20000, 20001, 20002])
+        self.assertEqual(store.series(2).x.tolist(), [20000 * 86400000, 20003 * 86400000])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# test_reminder_import.py
+#
+#   python -m unittest test_reminder_import
+
+import os
+import tempfile
+import unittest
+from database.reminder_import import iter_reminder_file
+
+HEADER = "client_id,reminder_date,message,status\n"
+
+
+class ReminderImportTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", newline="") as file:
+            file.write(text)
+        return path
+
+    def assertRowError(self, path, message):
+        with self.assertRaises(ValueError) as caught:
+            list(iter_reminder_file(path))
+        self.assertEqual(str(caught.exception), message)
+
+    def test_valid_rows_are_normalised(self):
+        path = self.write("ok.csv", HEADER + " 7 ,2024-03-01, Weigh-in ,\n8,2024-03-02,Call,Done\n")
+        self.assertEqual(list(iter_reminder_file(path)), [
+            ("7", "2024-03-01", "Weigh-in", "Pending"),
+            ("8", "2024-03-02", "Call", "Done"),
+        ])
+
+    def test_bad_date_reports_its_row(self):
+        path = self.write("dates.csv", HEADER + "7,2024-03-01,Weigh-in,\n7,01/03/2024,Weigh-in,\n")
+        self.assertRowError(path, "Row 3: reminder_date '01/03/2024' is not a YYYY-MM-DD date")
+
+    def test_bad_status_reports_its_row(self):
+        path = self.write("status.csv", HEADER + "7,2024-03-01,Weigh-in,Later\n")
+        self.assertRowError(path, "Row 2: unknown status 'Later'")
+
+    def test_missing_fields_report_their_row(self):
+        path = self.write("missing.csv", HEADER + "7,2024-03-01,Weigh-in,\n7,2024-03-02,,\n")
+        self.assertRowError(path, "Row 3: client_id, reminder_date and message are required")
+
+    def test_jsonl_rows_are_numbered_by_line(self):
+        path = self.write("missing.jsonl", '{"client_id": 7, "reminder_date": "2024-03-01", "message": "Call"}\n'
+                                           "\n"
+                                           '{"client_id": 7, "message": "Call"}\n')
+        self.assertRowError(path, "Row 3: client_id, reminder_date and message are required")
+
+
+if __name__ == "__main__":
+    unittest.main()
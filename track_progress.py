@@ -1,22 +1,13 @@
 import sys
-import pandas as pd
-from fpdf import FPDF
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QComboBox, QLineEdit, QTextEdit, QTableWidget,
     QTableWidgetItem,
-    QFileDialog, QMessageBox
+    QMessageBox
 )
 from PyQt5.QtCore import QDate, Qt
-import matplotlib.pyplot as plt
-
-# ✅ Import Database Correctly
-try:
-    from database.db_config import Database
-
-    db = Database()
-except Exception as e:
-    print(f"Database Import Error: {e}")
-    db = None  # Prevents crashing
+from database.async_db import AsyncDatabase
+from core.services import ProgressService, ServiceError, task
+from ui.client_completer import attach_to_combo
 
 
 class TrackProgressUI(QWidget):
@@ -25,9 +16,12 @@ class TrackProgressUI(QWidget):
         self.setWindowTitle("Track Client Progress")
         self.setGeometry(200, 200, 600, 500)
 
+        self.db = AsyncDatabase(self)  # ✅ Queries run on worker threads
+
         layout = QVBoxLayout()
 
         self.client_id_dropdown = QComboBox()
+        self.client_search = attach_to_combo(self.client_id_dropdown)
         self.client_id_dropdown.currentIndexChanged.connect(self.load_client_name)
 
         self.client_name_field = QLineEdit()
@@ -64,50 +58,68 @@ class TrackProgressUI(QWidget):
 
     def load_clients(self):
         """Load clients into dropdown."""
-        if db is None:
-            print("Error: Database connection failed.")
-            return
+        self.db.submit("clients", "get_all_clients",
+                       on_result=self.populate_clients,
+                       on_error=self.show_clients_error)
 
-        try:
-            self.client_id_dropdown.clear()
-            clients = db.get_all_clients()
+    def populate_clients(self, clients):
+        self.client_id_dropdown.clear()
 
-            if not clients:
-                QMessageBox.warning(self, "Warning", "No clients found in the database!")
+        if not clients:
+            QMessageBox.warning(self, "Warning", "No clients found in the database!")
+            return
 
-            for client in clients:
-                self.client_id_dropdown.addItem(f"{client['id']} - {client['name']}", client['id'])
+        for client in clients:
+            self.client_id_dropdown.addItem(f"{client['id']} - {client['name']}", client['id'])
+        self.client_search.set_clients(clients)
 
-        except Exception as e:
-            print(f"Error loading clients: {e}")
-            QMessageBox.critical(self, "Database Error", f"Failed to load clients: {e}")
+    def show_clients_error(self, error):
+        print(f"Error loading clients: {error}")
+        QMessageBox.critical(self, "Database Error", f"Failed to load clients: {error}")
 
     def load_client_name(self):
-        """Auto-fill client name."""
-        if db is None:
-            return
-
+        """Auto-fill client name and the progress table for the selected client."""
         client_id = self.client_id_dropdown.itemData(self.client_id_dropdown.currentIndex())
         if client_id:
-            self.client_name_field.setText(db.get_client_name(client_id))
+            self.client_name_field.clear()
+            self.db.submit("client_name", "get_client_name", client_id,
+                           on_result=self.client_name_field.setText,
+                           on_error=lambda e: print(f"Error loading client name: {e}"))
+            self.load_progress(client_id)
+
+    def load_progress(self, client_id):
+        """Fetch the progress history for a client."""
+        self.db.submit("progress", "get_progress", client_id,
+                       on_result=self.show_progress,
+                       on_error=lambda e: print(f"Error loading progress: {e}"))
+
+    def show_progress(self, progress_data):
+        self.progress_table.setRowCount(len(progress_data))
+        for row, data in enumerate(progress_data):
+            self.progress_table.setItem(row, 0, QTableWidgetItem(str(data["date"])))
+            self.progress_table.setItem(row, 1, QTableWidgetItem(str(data["weight"])))
+            self.progress_table.setItem(row, 2, QTableWidgetItem(data.get("notes") or ""))
 
     def add_progress(self):
         """Add new progress entry."""
-        if db is None:
-            QMessageBox.critical(self, "Error", "Database connection is not available.")
-            return
-
         client_id = self.client_id_dropdown.itemData(self.client_id_dropdown.currentIndex())
         date = self.date_field.text()
         weight = self.weight_field.text()
         notes = self.notes_field.toPlainText()
 
-        if client_id and date and weight:
-            try:
-                db.add_progress(client_id, date, weight, notes)
-                self.load_progress(client_id)
-            except Exception as e:
-                QMessageBox.critical(self, "Database Error", f"Failed to add progress: {e}")
+        self.db.cancel("progress")  # The write below returns a fresher history
+        self.db.run(task(ProgressService, "add_and_fetch"), client_id, date, weight, notes,
+                    on_result=self.show_progress, on_error=self.add_progress_failed)
+
+    def add_progress_failed(self, error):
+        if isinstance(error, ServiceError):
+            QMessageBox.warning(self, "Input Error", str(error))
+        else:
+            QMessageBox.critical(self, "Database Error", f"Failed to add progress: {error}")
+
+    def closeEvent(self, event):
+        self.db.shutdown()
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
@@ -1,43 +1,20 @@
-import mysql.connector
-import hashlib
-from database.db_config import get_db_connection  # Importing the DB connection function
-
-
-def hash_password(password):
-    """Hash the password using SHA-256"""
-    return hashlib.sha256(password.encode()).hexdigest()
+from database.database import Database
+from database.credentials import authenticate, register
 
 
 def login(username, password):
     """Check user credentials for login"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    hashed_password = hash_password(password)
-
-    query = "SELECT * FROM users WHERE username = %s AND password = %s"
-    cursor.execute(query, (username, hashed_password))
-    user = cursor.fetchone()
-
-    cursor.close()
-    conn.close()
-
-    return user is not None
+    db = Database()
+    try:
+        return db.conn is not None and authenticate(db, username, password)
+    finally:
+        db.close()
 
 
 def signup(username, password):
     """Register a new user"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
+    db = Database()
     try:
-        hashed_password = hash_password(password)
-        query = "INSERT INTO users (username, password) VALUES (%s, %s)"
-        cursor.execute(query, (username, hashed_password))
-        conn.commit()
-        success = True
-    except mysql.connector.Error:
-        success = False  # Username already exists or other DB issue
-
-    cursor.close()
-    conn.close()
-    return success
+        return db.conn is not None and register(db, username, password)
+    finally:
+        db.close()